@@ -0,0 +1,1242 @@
+import random
+import math
+from dataclasses import dataclass, asdict
+from enum import Enum
+from typing import Callable, Dict, List, Optional, Tuple
+import numpy as np
+from uzamsal_indeks import UzamsalIzgara
+from avci_sistemi import AvciSistemi
+from balik_dizisi import (
+    BalikDizisi, SAYISAL_ALANLAR, KOD_ALANLARI, BALIK_HAREKETI, HareketKurallari, suru_yonu
+)
+from populasyon_sayaclari import PopulasyonSayaclari
+from gecmis_deposu import GecmisDeposu
+from soy_agaci import SoyAgaci
+from rastgele import RastgeleServisi
+from faz_profilleyici import FazProfilleyici
+from paralel_akvaryum import ParalelHareket
+from kosu_kaydi import KosuKaydedici, yeni_dosya_adi
+from kontrol_noktasi import (
+    KontrolNoktalari, npz_yukle, onekle, onek_ayikla
+)
+
+class Davranis(Enum):
+    """Davranış türleri (tüm türler için ortak)"""
+    AGRESIF = "agresif"
+    PASIF = "pasif"
+    SOSYAL = "sosyal"
+    YALNIZ = "yalniz"
+
+@dataclass
+class Ajan:
+    """Liste kipindeki tek birey (balık, böcek...)
+
+    Türe bağlı sabitler `hareket_et`e HareketKurallari olarak verilir;
+    türler bu sınıftan kendi adlarıyla türetilir (akvaryum_motoru.Balik,
+    bocek_motoru.Bocek).
+    """
+    x: float
+    y: float
+    renk: str
+    boyut: float
+    hiz: float
+    enerji: float
+    yas: int
+    max_enerji: float
+    zeka: float
+    guc: float
+    dayaniklilik: float
+    tur: Enum
+    davranis: Davranis
+    cinsiyet: str  # "erkek" veya "disi"
+    hamile: bool = False
+    hamilelik_suresi: int = 0
+    hayatta: bool = True
+    hastalık: bool = False
+    mutasyon_sayisi: int = 0
+    nesil: int = 0
+    anne_id: int = -1  # Soy ağacı kimlikleri; kurucularda -1
+    baba_id: int = -1
+    id: int = -1       # Motor tarafından SoyAgaci'ndan verilir
+    yon_x: float = 0.0  # Son adımın birim yönü (sürü kuralının hizalanması için)
+    yon_y: float = 0.0
+
+    def hareket_et(self, genislik: int, yukseklik: int, ortam, digerleri: List['Ajan'],
+                   izgara: UzamsalIzgara = None, indeks: int = -1, rng=random, suru_yonu=None,
+                   rakip_mesafesi: float = 80.0, kurallar: HareketKurallari = BALIK_HAREKETI,
+                   hedef_indeksi: int = None):
+        """Gelişmiş hareket sistemi
+
+        `izgara` verilirse komşu ve rakip sorguları tüm listeyi taramak yerine
+        ızgara üzerinden yapılır; `indeks` bireyin ızgaradaki kendi indeksidir.
+        `hedef_indeksi` verilirse en yakın birey (sosyal) ya da rakip
+        (agresif) toplu sorguyla önceden bulunmuştur (ızgara indeksi, yoksa -1).
+        Rastgele adımlar `rng` akışından çekilir. Sosyal bireye `suru_yonu`
+        (vx, vy) verilirse en yakın birey yerine o yöne gider (bkz.
+        AjanMotoru.suru_yaricapi).
+        """
+        if not self.hayatta:
+            return
+        onceki_x, onceki_y = self.x, self.y
+
+        # Ortama göre hareket hızı
+        hiz_carpani = kurallar.hiz_carpani(ortam)
+
+        # Davranışa göre hareket
+        if self.davranis == Davranis.SOSYAL and suru_yonu is not None:
+            self._hedefe_hareket_et(self.x + suru_yonu[0], self.y + suru_yonu[1], hiz_carpani, kurallar)
+        elif self.davranis == Davranis.SOSYAL:
+            # Diğer bireylere yaklaş (sürü halinde hareket)
+            en_yakin = self._en_yakin_bul(digerleri, izgara, indeks, hedef_indeksi)
+            if en_yakin and self._mesafe_hesapla(en_yakin) > kurallar.sosyal_esik:
+                self._hedefe_hareket_et(en_yakin.x, en_yakin.y, hiz_carpani, kurallar)
+            else:
+                self._rastgele_hareket_et(hiz_carpani, kurallar, rng)
+        elif self.davranis == Davranis.AGRESIF:
+            # Farklı renkteki bireyleri kovala
+            hedef = self._rakip_bul(digerleri, izgara, indeks, rakip_mesafesi, hedef_indeksi)
+            if hedef:
+                self._hedefe_hareket_et(hedef.x, hedef.y, hiz_carpani * kurallar.agresif_carpan, kurallar)
+            else:
+                self._rastgele_hareket_et(hiz_carpani, kurallar, rng)
+        else:
+            self._rastgele_hareket_et(hiz_carpani, kurallar, rng)
+
+        # Sınırları kontrol et
+        kenar = kurallar.kenar
+        self.x = max(kenar, min(genislik - kenar, self.x))
+        self.y = max(kenar, min(yukseklik - kenar, self.y))
+        yer_x, yer_y = self.x - onceki_x, self.y - onceki_y
+        uzunluk = math.hypot(yer_x, yer_y)
+        if uzunluk > 0:
+            self.yon_x, self.yon_y = yer_x / uzunluk, yer_y / uzunluk
+
+        # Enerji tüketimi
+        enerji_tuketimi = kurallar.tuketim_taban + (self.boyut * kurallar.tuketim_boyut) + (self.hiz * kurallar.tuketim_hiz)
+        if self.hamile:
+            enerji_tuketimi *= kurallar.hamile_carpani
+        if self.hastalık:
+            enerji_tuketimi *= kurallar.hasta_carpani
+
+        self.enerji -= enerji_tuketimi
+        self.yas += 1
+
+        # Hamilelik kontrolü
+        if self.hamile:
+            self.hamilelik_suresi += 1
+            if self.hamilelik_suresi >= kurallar.hamilelik_suresi:
+                self.hamile = False
+                self.hamilelik_suresi = 0
+
+        # Yaşlanma ve ölüm kontrolü
+        max_yas = kurallar.omur_taban + (self.dayaniklilik * kurallar.omur_dayaniklilik)
+        if self.enerji <= 0 or self.yas > max_yas:
+            self.hayatta = False
+
+    def _rastgele_hareket_et(self, hiz_carpani: float, kurallar: HareketKurallari, rng=random):
+        """Rastgele hareket"""
+        hareket_hizi = self.hiz * hiz_carpani
+        self.x += rng.uniform(-hareket_hizi, hareket_hizi) * kurallar.rastgele_adim
+        self.y += rng.uniform(-hareket_hizi, hareket_hizi) * kurallar.rastgele_adim
+
+    def _hedefe_hareket_et(self, hedef_x: float, hedef_y: float, hiz_carpani: float, kurallar: HareketKurallari):
+        """Hedefe doğru hareket"""
+        dx = hedef_x - self.x
+        dy = hedef_y - self.y
+        mesafe = math.sqrt(dx*dx + dy*dy)
+
+        if mesafe > 0:
+            hareket_hizi = self.hiz * hiz_carpani
+            self.x += (dx / mesafe) * hareket_hizi * kurallar.hedef_adim
+            self.y += (dy / mesafe) * hareket_hizi * kurallar.hedef_adim
+
+    def _en_yakin_bul(self, digerleri: List['Ajan'], izgara: UzamsalIzgara = None,
+                      indeks: int = -1, bulunan: int = None) -> 'Ajan':
+        """En yakın bireyi bul"""
+        if bulunan is not None:
+            return self._izgara_nesnesi(izgara, bulunan)
+        if izgara is not None:
+            i, _ = izgara.en_yakin(self.x, self.y, haric=indeks)
+            return self._izgara_nesnesi(izgara, i)
+
+        en_yakin = None
+        en_kisa_mesafe = float('inf')
+
+        for diger in digerleri:
+            if diger is not self and diger.hayatta:
+                mesafe = self._mesafe_hesapla(diger)
+                if mesafe < en_kisa_mesafe:
+                    en_kisa_mesafe = mesafe
+                    en_yakin = diger
+
+        return en_yakin
+
+    def _rakip_bul(self, digerleri: List['Ajan'], izgara: UzamsalIzgara = None,
+                   indeks: int = -1, rakip_mesafesi: float = 80.0, bulunan: int = None) -> 'Ajan':
+        """Farklı renkteki bireyi bul"""
+        if bulunan is not None:
+            return self._izgara_nesnesi(izgara, bulunan)
+        if izgara is not None:
+            i = izgara.ilk(self.x, self.y, rakip_mesafesi, haric=indeks,
+                           farkli_etiket=izgara.etiketler[indeks])
+            return self._izgara_nesnesi(izgara, i)
+
+        for diger in digerleri:
+            if (diger is not self and diger.hayatta and
+                diger.renk != self.renk and self._mesafe_hesapla(diger) < rakip_mesafesi):
+                return diger
+        return None
+
+    @staticmethod
+    def _izgara_nesnesi(izgara: UzamsalIzgara, i: int) -> 'Ajan':
+        """Izgara indeksini bireye çevir (bu tick içinde ölenleri atla)"""
+        if i < 0:
+            return None
+        ajan = izgara.nesneler[i]
+        return ajan if ajan.hayatta else None
+
+    def _mesafe_hesapla(self, diger: 'Ajan') -> float:
+        """İki birey arasındaki mesafe"""
+        dx = self.x - diger.x
+        dy = self.y - diger.y
+        return math.sqrt(dx*dx + dy*dy)
+
+class YiyecekKaynagi:
+    """Yenilenen yiyecek kaynağı"""
+    def __init__(self, x: float, y: float, miktar: float = 120.0, yenilenme_hizi: float = 0.6):
+        self.x = x
+        self.y = y
+        self.miktar = miktar
+        self.max_miktar = miktar
+        self.yenilenme_hizi = yenilenme_hizi
+
+    def guncelle(self):
+        """Yiyecek kaynağını güncelle"""
+        if self.miktar < self.max_miktar:
+            self.miktar = min(self.max_miktar, self.miktar + self.yenilenme_hizi)
+
+    def tuket(self, miktar: float) -> float:
+        """Yiyecek tüket"""
+        tuketilen = min(self.miktar, miktar)
+        self.miktar -= tuketilen
+        return tuketilen
+
+def olu_ajanlari_takasla_cikar(ajanlar: list) -> int:
+    """Ölü ajanları sondaki canlılarla takas edip listeyi kısalt
+
+    Sıra korunmaz ama yeni liste ayrılmaz; taşınan eleman sayısı ölü sayısı
+    kadardır. Çıkarılan ajan sayısını döndürür.
+    """
+    olu = [i for i, ajan in enumerate(ajanlar) if not ajan.hayatta]
+    son = len(ajanlar)
+    for i in reversed(olu):
+        son -= 1
+        ajanlar[i] = ajanlar[son]
+    del ajanlar[son:]
+    return len(olu)
+
+# --- Tür tanımı ----------------------------------------------------------
+
+@dataclass
+class SecilimKurallari:
+    """Doğal seçilim: tick başına ölüm riski
+
+    risk = taban - renk avantajı * k - tür avantajı * k + ortam cezası
+    - dayanıklılık * k (+ hastalık ve yaşlılık ekleri)
+    """
+    renk_avantajlari: Dict[str, float]
+    tur_avantajlari: Dict[Enum, float]
+    ortam_cezasi: Callable          # ortam -> tüm bireyler için ortak risk
+    hastalik_olasiligi: float
+    taban_risk: float
+    renk_katsayisi: float
+    tur_katsayisi: float
+    dayaniklilik_katsayisi: float
+    hastalik_riski: float
+    yaslilik_esigi: int
+    yaslilik_katsayisi: float
+
+@dataclass
+class UremeKurallari:
+    """Toplu üreme: çiftleşme koşulları, kalıtım sapmaları ve mutasyonlar"""
+    aralik: int                     # Üreme bu kadar tickte bir (her seferinde bir nesil)
+    en_az_populasyon: int
+    enerji_esigi: float
+    yas_esigi: int
+    en_fazla_cift: int
+    ayni_tur_uyumu: float
+    farkli_tur_uyumu: float
+    erkek_enerji_kaybi: float
+    disi_enerji_kaybi: float
+    yavru_sayisi: Tuple[int, int]   # Çift başına (en az, en çok), ikisi de dahil
+    mutasyon: Dict[str, float]      # renk, tur, davranis
+    konum_sapmasi: float
+    yavru_enerjisi: Tuple[float, float]
+    sapmalar: Dict[str, float]      # Ebeveyn ortalamasına eklenen en büyük sapma
+    sinirlar: Dict[str, Tuple[float, float]]
+
+@dataclass
+class YemKurallari:
+    menzil: float
+    talep_carpani: float            # Tick başına talep = boyut * k
+    kazanc: float                   # Tüketilen miktarın enerjiye dönen oranı
+    yenilenme_hizi: float
+    kenar: float                    # Başlangıç konumlarının kenar payı
+    miktar: Tuple[float, float]
+
+@dataclass
+class AvciKurallari:
+    hiz: float
+    menzil: float
+    tokluk: float
+    yakalama_yaricapi: float
+    yakalama_toklugu: float
+    tokluk_tuketimi: float
+    dogma_olasiligi: float          # Her tick yeni avcı gelme şansı
+    en_fazla: int
+    kenar: float
+
+@dataclass
+class TurTanimi:
+    """Ortak motorun bir türe özgü tüm parçaları
+
+    Özellik aralıkları, avantaj tabloları, ortam modeli ve kural sabitleri
+    burada toplanır; motor yalnızca bunları okur. Çizim pygame'e bağlı
+    olduğu için ön yüzlerdedir (bkz. balik_cizici.BalikCizici'nin
+    `sekil_ciz` geri çağrısı).
+    """
+    ad: str                         # Kontrol noktası / koşu kaydı türü ve dosya öneki
+    ajan_adi: str                   # İletilerde ("Balık")
+    ajan_oneki: str                 # Kontrol noktası sütun öneki
+    ajan_sinifi: type               # Liste kipinin kayıt sınıfı (Ajan alt sınıfı)
+    renkler: Dict[str, Tuple[int, int, int]]
+    turler: type                    # Tür Enum'u
+    ortam_sinifi: type
+    ortam_guncelle: Callable        # (ortam, zaman, rng) -> None
+    ortam_fazi: str                 # Profil fazının adı ("su_ortami", "cevre")
+    ortam_oneki: str                # Geçmiş alanlarının öneki ("su", "cevre")
+    ortam_alanlari: Dict[str, str]  # Geçmiş alanı -> ortam niteliği
+    hareket: HareketKurallari
+    rakip_mesafesi: float
+    secilim: SecilimKurallari
+    ureme: UremeKurallari
+    yem: YemKurallari
+    avci: AvciKurallari
+    baslangic_sayilari: Tuple[int, int, int]  # birey, yem, avcı
+    baslangic_kenari: float
+    baslangic_araliklari: Dict[str, Tuple]    # boyut, hiz, enerji, max_enerji, yas, zeka, guc, dayaniklilik
+    acil_esigi: int
+    acil_sayisi: int
+    acil_sapmalari: Dict[str, float]
+
+class AjanMotoru:
+    """Pygame'den bağımsız, türden bağımsız ekosistem motoru
+
+    Tüm simülasyon mantığı buradadır; türe özgü her şey `tanim`dan
+    (TurTanimi) okunur, alt sınıflar TANIM ile kendi türlerini verir
+    (akvaryum_motoru.AkvaryumMotoru, bocek_motoru.BocekMotoru). Uzamsal
+    ızgara, vektörel çekirdekler, avcılar, soy ağacı, sayaçlar, geçmiş,
+    kontrol noktaları ve koşu kaydı her tür için aynıdır.
+
+    `step(n)` n tick ilerletir, `run(ticks)` gerekirse başlangıç dünyasını
+    kurup verilen tick sayısı kadar çalıştırır. Tüm rastgelelik `rastgele`
+    servisinin alt sistem akışlarından gelir; aynı tohumla kurulan iki motor
+    aynı koşuyu üretir.
+
+    `paralel` > 0 ise hareket dünya karolarına bölünüp o kadar işçi
+    süreçte çalışır (bkz. paralel_akvaryum.ParalelHareket); `karolar` karo
+    düzenini (sx, sy) sabitler. Bu kipte sütun deposu kullanılır ve sonuç
+    işçi sayısından değil karo düzeninden etkilenir. İş bitince `kapat()`.
+    """
+
+    TANIM: TurTanimi = None
+
+    def __init__(self, genislik=1200, yukseklik=800, dizi_deposu=False, rastgele: RastgeleServisi = None,
+                 paralel: int = 0, karolar: Tuple[int, int] = None, tanim: TurTanimi = None):
+        self.tanim = tanim = tanim or self.TANIM
+        self.genislik = genislik
+        self.yukseklik = yukseklik
+        self.yiyecek_kaynaklari: List[YiyecekKaynagi] = []
+        self.avcilar = AvciSistemi(yakalama_yaricapi=tanim.avci.yakalama_yaricapi,
+                                   yakalama_toklugu=tanim.avci.yakalama_toklugu,
+                                   tokluk_tuketimi=tanim.avci.tokluk_tuketimi)
+        self.nesil = 0
+        self.zaman = 0
+        self.ortam = tanim.ortam_sinifi()
+        self.rastgele = rastgele or RastgeleServisi()
+        # Başsız koşular (tarama işçileri) durum mesajlarını basmaz
+        self.sessiz = False
+
+        # Komşu/rakip/avcı sorguları için uzamsal ızgara (her tick yeniden kurulur)
+        halo = max(tanim.rakip_mesafesi, tanim.avci.menzil)
+        self.izgara = UzamsalIzgara(genislik, yukseklik, halo)
+        self._izgara_guncel = False
+        self.yem_izgarasi = UzamsalIzgara(genislik, yukseklik, tanim.yem.menzil)
+        self._baslangic_sayilari = tuple(tanim.baslangic_sayilari)
+
+        self.renkler = dict(tanim.renkler)
+        self._renk_kodlari = {renk: i for i, renk in enumerate(self.renkler)}
+
+        # Kategorik alanların ortak kod sırası (dizi deposu, sayaçlar ve toplu üreme)
+        self._kategoriler = {
+            'renk': list(self.renkler),
+            'tur': list(tanim.turler),
+            'davranis': list(Davranis),
+            'cinsiyet': ["erkek", "disi"],
+        }
+        self._kategori_kodlari = {ad: {deger: i for i, deger in enumerate(degerler)}
+                                  for ad, degerler in self._kategoriler.items()}
+
+        # Karolara bölünmüş paralel hareket (sütunlar paylaşımlı bellekte)
+        self.paralel_hareket: ParalelHareket = None
+        if paralel or karolar:
+            self.paralel_hareket = ParalelHareket(genislik, yukseklik, paralel, karolar, halo=halo)
+            dizi_deposu = True
+
+        # Popülasyon deposu: Ajan listesi ya da sütun tabanlı NumPy dizisi
+        if dizi_deposu:
+            self.ajanlar = BalikDizisi(self._kategoriler['renk'], self._kategoriler['tur'],
+                                       self._kategoriler['davranis'],
+                                       ayirici=self.paralel_hareket.bellek if self.paralel_hareket else None)
+        else:
+            self.ajanlar: List[Ajan] = []
+
+        # Canlı birey sayaçları (doğum/ölüm anında güncellenir)
+        self.sayaclar = PopulasyonSayaclari(self._kategoriler)
+
+        # Tamsayı kimlikler ve soy kaydı (ölen bireylerin nesneleri tutulmaz)
+        self.soy_agaci = SoyAgaci()
+
+        # İstatistik takibi: sütun tabanlı, sınırlı geçmiş deposu
+        # (son 3600 örnek tam çözünürlükte, eskileri 10'luk, 100'lük ve 1000'lik özetlerde)
+        onek = tanim.ortam_oneki
+        self.gecmis = GecmisDeposu(
+            ['populasyon']
+            + [f'renk.{renk}' for renk in self.renkler]
+            + [f'tur.{tur.value}' for tur in tanim.turler]
+            + [f'{onek}.{ad}' for ad in tanim.ortam_alanlari] + [f'{onek}.avci_sayisi']
+            + ['genetik.zeka', 'genetik.guc', 'genetik.dayaniklilik', 'genetik.mutasyon'],
+            adim=1, max_uzunluk=3600, toplama_orani=10, seviye_sayisi=4)
+
+        # Simülasyon ayarları
+        self.sikistirma_araligi = 1     # Ölü bireyler her K tickte bir temizlenir
+        self.sikistirma_modu = "takas"  # takas (sıra korunmaz) veya filtre (sıra korunur)
+        self.suru_yaricapi = 0.0        # > 0 ise sosyal bireyler bu yarıçapta sürü kuralıyla hareket eder
+
+        # İsteğe bağlı periyodik kontrol noktaları (bkz. kontrol_noktalarini_ac)
+        self.kontrol_noktalari: KontrolNoktalari = None
+
+        # İsteğe bağlı akışlı koşu kaydı (bkz. kosu_kaydini_ac)
+        self.kosu_kaydi: KosuKaydedici = None
+        self._kosu_kaydi_ayari = None
+
+        # Faz süreleri (ön yüzün profil görünümü ve performans_olcumu okur)
+        self.profil = FazProfilleyici()
+
+    def step(self, n: int = 1):
+        """Simülasyonu n tick ilerlet"""
+        for _ in range(n):
+            self._adim()
+
+    def run(self, ticks: int):
+        """Dünya boşsa kur, ardından verilen tick sayısı kadar çalıştır"""
+        if len(self.ajanlar) == 0:
+            self.baslangic_olustur(*self._baslangic_sayilari)
+        self.step(ticks)
+        return self
+
+    def kapat(self):
+        """Koşu kaydını kapat; paralel kipteki işçi süreçleri ve paylaşımlı belleği bırak"""
+        if self.kosu_kaydi is not None:
+            self.kosu_kaydi.kapat()
+        if self.paralel_hareket is not None:
+            self.paralel_hareket.kapat()
+
+    def _adim(self):
+        """Tek simülasyon tick'i"""
+        profil = self.profil
+        with profil.faz(self.tanim.ortam_fazi):
+            self.ortam_guncelle()
+
+        with profil.faz('hareket'):
+            self.ajanlari_hareket_ettir()
+
+        with profil.faz('avcilar'):
+            self.avcilari_hareket_ettir()
+
+        with profil.faz('yiyecek'):
+            self.yiyecek_sistemi_guncelle()
+        with profil.faz('secilim'):
+            self.dogal_secilim_uygula()
+
+        if self.zaman % self.sikistirma_araligi == 0:
+            with profil.faz('temizlik'):
+                self.olu_ajanlari_temizle()
+
+        # Üreme (her tanim.ureme.aralik zaman biriminde)
+        if self.zaman % self.tanim.ureme.aralik == 0:
+            with profil.faz('ureme'):
+                self.ureme_gerceklestir()
+            self.nesil += 1
+
+        with profil.faz('istatistik'):
+            self.istatistikleri_guncelle()
+        self.zaman += 1
+
+        # Popülasyon kontrolü
+        hayatta_sayi = self.sayaclar.sayi
+        if hayatta_sayi < self.tanim.acil_esigi:
+            if not self.sessiz:
+                print(f"{self.tanim.ajan_adi} popülasyonu kritik seviyede ({hayatta_sayi}), yeni bireyler ekleniyor...")
+            self._acil_populasyon_ekleme()
+
+        # Izgara tick sonunda kurulur: sonraki tickin hareketi aynı ızgarayı
+        # kullanır, aradaki çizim de güncel konumları sorgulayabilir
+        with profil.faz('izgara'):
+            self.izgara_guncelle()
+
+        if self.kontrol_noktalari is not None:
+            self.kontrol_noktalari.gerekirse_kaydet(self)
+
+    def baslangic_olustur(self, ajan_sayisi: int = None, yem_sayisi: int = None, avci_sayisi: int = None):
+        """Başlangıç dünyasını oluştur (verilmeyen sayılar türün varsayılanları; yeniden_baslat aynı sayıları kullanır)"""
+        varsayilan = self.tanim.baslangic_sayilari
+        ajan_sayisi = varsayilan[0] if ajan_sayisi is None else ajan_sayisi
+        yem_sayisi = varsayilan[1] if yem_sayisi is None else yem_sayisi
+        avci_sayisi = varsayilan[2] if avci_sayisi is None else avci_sayisi
+        self._izgara_guncel = False
+        self._baslangic_sayilari = (ajan_sayisi, yem_sayisi, avci_sayisi)
+        self.ajanlar.clear()
+        self.yiyecek_kaynaklari.clear()
+        self.avcilar.clear()
+        self.sayaclar.sifirla()
+
+        r = self.rastgele.baslangic
+        tanim = self.tanim
+        aralik = tanim.baslangic_araliklari
+        kenar = tanim.baslangic_kenari
+
+        # Çeşitli bireyler oluştur
+        renk_listesi = list(self.renkler.keys())
+        tur_listesi = list(tanim.turler)
+        davranis_listesi = list(Davranis)
+
+        for i in range(ajan_sayisi):
+            ajan = tanim.ajan_sinifi(
+                x=r.uniform(kenar, self.genislik - kenar),
+                y=r.uniform(kenar, self.yukseklik - kenar),
+                renk=r.choice(renk_listesi),
+                boyut=r.uniform(*aralik['boyut']),
+                hiz=r.uniform(*aralik['hiz']),
+                enerji=r.uniform(*aralik['enerji']),
+                max_enerji=r.uniform(*aralik['max_enerji']),
+                yas=r.randint(*aralik['yas']),
+                zeka=r.uniform(*aralik['zeka']),
+                guc=r.uniform(*aralik['guc']),
+                dayaniklilik=r.uniform(*aralik['dayaniklilik']),
+                tur=r.choice(tur_listesi),
+                davranis=r.choice(davranis_listesi),
+                cinsiyet=r.choice(["erkek", "disi"]),
+                nesil=0
+            )
+            self._dogum_kaydet(ajan)
+            self.ajanlar.append(ajan)
+
+        # Yiyecek kaynakları oluştur
+        yem = tanim.yem
+        for _ in range(yem_sayisi):
+            yiyecek = YiyecekKaynagi(
+                x=r.uniform(yem.kenar, self.genislik - yem.kenar),
+                y=r.uniform(yem.kenar, self.yukseklik - yem.kenar),
+                miktar=r.uniform(*yem.miktar),
+                yenilenme_hizi=yem.yenilenme_hizi
+            )
+            self.yiyecek_kaynaklari.append(yiyecek)
+
+        # Avcılar oluştur
+        avci = tanim.avci
+        for _ in range(avci_sayisi):
+            self._avci_ekle(r.uniform(avci.kenar, self.genislik - avci.kenar),
+                            r.uniform(avci.kenar, self.yukseklik - avci.kenar))
+
+    def _avci_ekle(self, x: float, y: float):
+        """Türün avcı değerleriyle tek avcı ekle"""
+        avci = self.tanim.avci
+        self.avcilar.toplu_ekle({'x': np.array([x]), 'y': np.array([y]), 'hiz': np.array([avci.hiz]),
+                                 'menzil': np.array([avci.menzil]), 'tokluk': np.array([avci.tokluk])})
+
+    def izgara_guncelle(self):
+        """Uzamsal ızgarayı bu tickin konumlarından yeniden kur"""
+        if isinstance(self.ajanlar, BalikDizisi):
+            dizi = self.ajanlar
+            self.izgara.yeniden_olustur(dizi.sutun('x').copy(), dizi.sutun('y').copy(),
+                                        aktif=dizi.sutun('hayatta'), etiketler=dizi.sutun('renk'),
+                                        nesneler=dizi,
+                                        yonler=(dizi.sutun('yon_x').copy(), dizi.sutun('yon_y').copy()))
+        else:
+            self.izgara.nesnelerden_olustur(self.ajanlar, etiket_alani='renk',
+                                            etiket_kodlari=self._renk_kodlari,
+                                            yon_alanlari=('yon_x', 'yon_y'))
+        self._izgara_guncel = True
+
+    def _izgarayi_hazirla(self):
+        """Izgara son tickten ya da dışarıdan bir değişiklikten beri eskidiyse yeniden kur"""
+        if not self._izgara_guncel or len(self.izgara.xs) != len(self.ajanlar):
+            self.izgara_guncelle()
+
+    def gorunenler(self, x0: float, y0: float, x1: float, y1: float) -> np.ndarray:
+        """Dikdörtgen içindeki canlı bireylerin indeksleri (liste sırasıyla)
+
+        Uzamsal ızgaradan okunur; maliyet yalnızca dikdörtgendeki birey
+        sayısına bağlıdır, toplam popülasyona değil.
+        """
+        self._izgarayi_hazirla()
+        return np.sort(self.izgara.dikdortgen(x0, y0, x1, y1))
+
+    def komsu_ozetleri(self, yaricap: float, k: int = 0) -> Dict[str, np.ndarray]:
+        """Her bireyin yarıçap içindeki komşu özeti (birey indeksine hizalı)
+
+        Sayı, ağırlık merkezi, ortalama yön ve en yakın k komşu tüm popülasyon
+        için tek toplu ızgara sorgusunda hesaplanır (bkz.
+        UzamsalIzgara.komsu_ozetleri); birey kendi komşusu sayılmaz. Ölü
+        bireylerin satırları boştur (sayı 0, komşu -1). Konumlar son tick sonundaki ızgaradandır.
+        """
+        self._izgarayi_hazirla()
+        izgara = self.izgara
+        canli = np.flatnonzero(self._sutunlari_al('hayatta')[0])
+        ozet = izgara.komsu_ozetleri(izgara.xs[canli], izgara.ys[canli], yaricap, k, haric=canli)
+        sonuc = {}
+        for ad, degerler in ozet.items():
+            bos = {'en_yakinlar': -1, 'en_yakin_mesafeler': np.inf}.get(ad, 0)
+            sonuc[ad] = np.full((len(izgara.xs),) + degerler.shape[1:], bos, dtype=degerler.dtype)
+            sonuc[ad][canli] = degerler
+        return sonuc
+
+    def ajanlari_hareket_ettir(self):
+        """Tüm bireyleri bir adım hareket ettir"""
+        self._izgarayi_hazirla()
+        # Bu noktadan sonra konumlar değişir; ızgara tick sonunda yeniden kurulur
+        self._izgara_guncel = False
+        tanim = self.tanim
+        if isinstance(self.ajanlar, BalikDizisi):
+            hayatta = self.ajanlar.sutun('hayatta')
+            onceki = hayatta.copy()
+            if self.paralel_hareket is not None:
+                self.paralel_hareket.hareket_et(self.ajanlar, self.ortam, tanim.rakip_mesafesi,
+                                                self.rastgele.hareket.np, self.suru_yaricapi, tanim.hareket)
+            else:
+                self.ajanlar.hareket_et(self.genislik, self.yukseklik, self.ortam,
+                                        self.izgara, tanim.rakip_mesafesi, self.rastgele.hareket.np,
+                                        self.suru_yaricapi, tanim.hareket)
+            self._olumleri_kaydet(np.flatnonzero(onceki & ~hayatta))
+            return
+        suru_yonleri = self._suru_yonleri() if self.suru_yaricapi > 0 else {}
+        hedefler = self._hareket_hedefleri(suru_yonleri)
+        rng = self.rastgele.hareket
+        for i, ajan in enumerate(self.ajanlar):
+            if not ajan.hayatta:
+                continue
+            ajan.hareket_et(self.genislik, self.yukseklik, self.ortam, self.ajanlar,
+                            self.izgara, i, rng, suru_yonleri.get(i), tanim.rakip_mesafesi, tanim.hareket,
+                            hedefler.get(i))
+            if not ajan.hayatta:
+                self._olum_kaydet(ajan)
+
+    def _hareket_hedefleri(self, suru_yonleri: Dict[int, Tuple[float, float]]) -> Dict[int, int]:
+        """Liste kipi: sosyal bireylerin en yakın komşusu, agresiflerin rakibi (ızgara indeksi)
+
+        Tüm bireyler için iki toplu ızgara sorgusuyla bulunur; bireyler
+        sırayla hareket ederken yalnızca bu indeksin nesnesine bakılır.
+        """
+        x, y, hayatta = self._sutunlari_al('x', 'y', 'hayatta')
+        davranis, = self._kod_sutunlari('davranis')
+        kodlar = self._kategori_kodlari['davranis']
+        sosyal = np.flatnonzero(hayatta & (davranis == kodlar[Davranis.SOSYAL]))
+        if suru_yonleri:
+            sosyal = sosyal[~np.isin(sosyal, list(suru_yonleri))]
+        agresif = np.flatnonzero(hayatta & (davranis == kodlar[Davranis.AGRESIF]))
+        izgara = self.izgara
+        hedefler = {}
+        if len(sosyal):
+            j, _ = izgara.toplu_en_yakin(x[sosyal], y[sosyal], sosyal)
+            hedefler.update(zip(sosyal.tolist(), j.tolist()))
+        if len(agresif):
+            j = izgara.toplu_ilk(x[agresif], y[agresif], self.tanim.rakip_mesafesi, agresif,
+                                 izgara.etiketler[agresif])
+            hedefler.update(zip(agresif.tolist(), j.tolist()))
+        return hedefler
+
+    def _suru_yonleri(self) -> Dict[int, Tuple[float, float]]:
+        """Liste kipi: komşusu olan sosyal bireylerin sürü yönleri (tick başı ızgarasından)"""
+        sosyal = np.array([i for i, b in enumerate(self.ajanlar)
+                           if b.hayatta and b.davranis == Davranis.SOSYAL], dtype=np.intp)
+        if len(sosyal) == 0:
+            return {}
+        izgara = self.izgara
+        vx, vy, suruda = suru_yonu(izgara, izgara.xs[sosyal], izgara.ys[sosyal], sosyal, self.suru_yaricapi)
+        return {i: (x, y) for i, x, y in zip(sosyal[suruda].tolist(), vx[suruda].tolist(), vy[suruda].tolist())}
+
+    def avcilari_hareket_ettir(self):
+        """Avcıları toplu olarak hareket ettir ve yakalanan bireyleri ölü say"""
+        x, y, hayatta, kimlikler = self._sutunlari_al('x', 'y', 'hayatta', 'id')
+        avlar = self.avcilar.adim(self.genislik, self.yukseklik, self.izgara, x, y, hayatta, kimlikler,
+                                  self.rastgele.hareket.np)
+        if len(avlar):
+            self._sutuna_yaz('hayatta', avlar, np.zeros(len(avlar), dtype=bool))
+            self._olumleri_kaydet(avlar)
+
+    def _dogum_kaydet(self, ajan: Ajan):
+        """Tek bireyi soy ağacına ve sayaçlara işle (kimliği burada alır)"""
+        ajan.id = self.soy_agaci.ekle(ajan.anne_id, ajan.baba_id, self.zaman, ajan.nesil)
+        self.sayaclar.ekle(ajan)
+
+    def _olum_kaydet(self, ajan: Ajan):
+        """Ölen bireyi sayaçlardan düş ve ölüm tick'ini soy ağacına yaz"""
+        self.sayaclar.cikar(ajan)
+        self.soy_agaci.olum_kaydet(ajan.id, self.zaman)
+
+    def _olumleri_kaydet(self, indeksler: np.ndarray):
+        """Verilen indekslerdeki (yeni ölmüş) bireyleri toplu olarak işle"""
+        if len(indeksler) == 0:
+            return
+        if isinstance(self.ajanlar, BalikDizisi):
+            self.sayaclar.dizi_guncelle(self.ajanlar, indeksler, -1)
+            self.soy_agaci.olum_kaydet(self.ajanlar.sutun('id')[indeksler], self.zaman)
+            return
+        for i in indeksler.tolist():
+            self._olum_kaydet(self.ajanlar[i])
+
+    def olu_ajanlari_temizle(self) -> int:
+        """Ölü bireyleri popülasyondan topluca çıkar"""
+        if isinstance(self.ajanlar, BalikDizisi):
+            return self.ajanlar.sikistir(sirayi_koru=self.sikistirma_modu == "filtre")
+        if self.sikistirma_modu == "takas":
+            return olu_ajanlari_takasla_cikar(self.ajanlar)
+        onceki = len(self.ajanlar)
+        self.ajanlar[:] = [b for b in self.ajanlar if b.hayatta]
+        return onceki - len(self.ajanlar)
+
+    def ortam_guncelle(self):
+        """Ortam koşullarını güncelle, yeni avcı getir ve aç kalanları çıkar"""
+        self.tanim.ortam_guncelle(self.ortam, self.zaman, self.rastgele.ortam)
+
+        # Rastgele avcı ekleme/çıkarma
+        avci = self.tanim.avci
+        felaket = self.rastgele.felaket
+        if felaket.random() < avci.dogma_olasiligi:
+            if len(self.avcilar) < avci.en_fazla:
+                self._avci_ekle(felaket.uniform(avci.kenar, self.genislik - avci.kenar),
+                                felaket.uniform(avci.kenar, self.yukseklik - avci.kenar))
+
+        # Aç kalan avcıları çıkar
+        self.avcilar.temizle()
+
+    def dogal_secilim_uygula(self):
+        """Gelişmiş doğal seçilim (tüm popülasyon için tek geçiş)
+
+        Ölüm riski renk/tür tablolarından ve bu tick için bir kez hesaplanan
+        ortam cezasından dizi olarak hesaplanır; hastalık başlangıcı ve ölüm
+        Bernoulli maskeleriyle uygulanır.
+        """
+        hayatta, hastalik, yas, dayaniklilik = self._sutunlari_al('hayatta', 'hastalık', 'yas', 'dayaniklilik')
+        canli = np.flatnonzero(hayatta)
+        if len(canli) == 0:
+            return
+
+        rng = self.rastgele.secilim.np
+        kural = self.tanim.secilim
+
+        # Hastalık riski
+        yeni_hasta = canli[(rng.random(len(canli)) < kural.hastalik_olasiligi) & ~hastalik[canli]]
+        if len(yeni_hasta):
+            self._sutuna_yaz('hastalık', yeni_hasta, np.ones(len(yeni_hasta), dtype=bool))
+            hastalik = hastalik.copy()
+            hastalik[yeni_hasta] = True
+
+        # Toplam ölüm riski
+        renk_avantaji = self._kategori_degerleri('renk', kural.renk_avantajlari, canli)
+        tur_avantaji = self._kategori_degerleri('tur', kural.tur_avantajlari, canli)
+        olum_riski = (kural.taban_risk - renk_avantaji * kural.renk_katsayisi - tur_avantaji * kural.tur_katsayisi
+                      + self._ortam_cezasi() - dayaniklilik[canli] * kural.dayaniklilik_katsayisi)
+        olum_riski += np.where(hastalik[canli], kural.hastalik_riski, 0.0)
+
+        # Yaşlılık etkisi
+        olum_riski += np.maximum(yas[canli] - kural.yaslilik_esigi, 0) * kural.yaslilik_katsayisi
+
+        olenler = canli[rng.random(len(canli)) < olum_riski]
+        if len(olenler) == 0:
+            return
+        if isinstance(self.ajanlar, BalikDizisi):
+            self.ajanlar.sutun('hayatta')[olenler] = False
+        else:
+            for i in olenler.tolist():
+                self.ajanlar[i].hayatta = False
+        self._olumleri_kaydet(olenler)
+
+    def _kategori_degerleri(self, alan: str, tablo: dict, indeksler: np.ndarray) -> np.ndarray:
+        """Kategorik alanı tablo üzerinden sayıya çevir (tabloda yoksa 0.5)"""
+        if isinstance(self.ajanlar, BalikDizisi):
+            degerler = self.ajanlar.degerler(alan)
+            arama = np.array([tablo.get(d, 0.5) for d in degerler])
+            return arama[self.ajanlar.sutun(alan)[indeksler]]
+        return np.fromiter((tablo.get(getattr(self.ajanlar[i], alan), 0.5) for i in indeksler.tolist()),
+                           dtype=np.float64, count=len(indeksler))
+
+    def _ortam_cezasi(self) -> float:
+        """Bu tickin ortam koşullarından gelen, tüm bireyler için ortak ölüm riski"""
+        return self.tanim.secilim.ortam_cezasi(self.ortam)
+
+    def ureme_gerceklestir(self):
+        """Gelişmiş üreme sistemi (toplu)
+
+        Uygun erkek ve dişiler karıştırılıp sırayla eşlenir (en fazla
+        `en_fazla_cift` çift); uyumluluk, yavru sayıları, kalıtılan özellikler
+        ve mutasyonlar dizi olarak çekilir ve tüm kuşak popülasyona tek
+        seferde eklenir.
+        """
+        kural = self.tanim.ureme
+        if self.sayaclar.sayi < kural.en_az_populasyon:
+            return
+
+        rng = self.rastgele.ureme.np
+        hayatta, enerji, yas, hamile = self._sutunlari_al('hayatta', 'enerji', 'yas', 'hamile')
+        cinsiyet, tur = self._kod_sutunlari('cinsiyet', 'tur')
+
+        # Üreme çiftleri oluştur
+        uygun = hayatta & (enerji > kural.enerji_esigi) & (yas > kural.yas_esigi)
+        erkek = self._kategori_kodlari['cinsiyet']["erkek"]
+        erkekler = np.flatnonzero(uygun & (cinsiyet == erkek))
+        disiler = np.flatnonzero(uygun & (cinsiyet != erkek) & ~hamile)
+        k = min(len(erkekler), len(disiler), kural.en_fazla_cift)
+        if k == 0:
+            return
+        erkekler = rng.permutation(erkekler)[:k]
+        disiler = rng.permutation(disiler)[:k]
+
+        # Uyumluluk kontrolü: aynı tür tercihi
+        uyumlu = rng.random(k) < np.where(tur[erkekler] == tur[disiler], kural.ayni_tur_uyumu, kural.farkli_tur_uyumu)
+        erkekler, disiler = erkekler[uyumlu], disiler[uyumlu]
+        if len(erkekler) == 0:
+            return
+
+        # Hamilelik ve ebeveyn enerji kaybı
+        self._sutuna_yaz('hamile', disiler, np.ones(len(disiler), dtype=bool))
+        self._sutuna_yaz('hamilelik_suresi', disiler, np.zeros(len(disiler), dtype=np.int64))
+        self._sutuna_yaz('enerji', erkekler, enerji[erkekler] - kural.erkek_enerji_kaybi)
+        self._sutuna_yaz('enerji', disiler, enerji[disiler] - kural.disi_enerji_kaybi)
+
+        # Her çift için yavrular
+        en_az, en_cok = kural.yavru_sayisi
+        yavru_sayilari = rng.integers(en_az, en_cok + 1, len(erkekler))
+        kusak = self._kusak_olustur(np.repeat(erkekler, yavru_sayilari), np.repeat(disiler, yavru_sayilari))
+        self._kusak_ekle(kusak)
+
+    def _kusak_olustur(self, babalar: np.ndarray, anneler: np.ndarray) -> dict:
+        """Ebeveyn indekslerinden yavru sütunlarını üret (kategoriler kod olarak)"""
+        m = len(babalar)
+        rng = self.rastgele.ureme.np
+        kural = self.tanim.ureme
+        sapma, sinir = kural.sapmalar, kural.sinirlar
+        x, y, boyut, hiz, max_enerji, zeka, guc, dayaniklilik, nesil, kimlik = self._sutunlari_al(
+            'x', 'y', 'boyut', 'hiz', 'max_enerji', 'zeka', 'guc', 'dayaniklilik', 'nesil', 'id')
+        kodlar = dict(zip(('renk', 'tur', 'davranis'), self._kod_sutunlari('renk', 'tur', 'davranis')))
+
+        def ortalama(sutun, ad):
+            return (sutun[babalar] + sutun[anneler]) / 2 + rng.uniform(-sapma[ad], sapma[ad], m)
+
+        yavru = {}
+        mutasyon_sayisi = np.zeros(m, dtype=np.int64)
+        # Genetik karışım ve mutasyon
+        for ad in ('renk', 'tur', 'davranis'):
+            kod = np.where(rng.random(m) < 0.5, kodlar[ad][babalar], kodlar[ad][anneler])
+            mutasyon = rng.random(m) < kural.mutasyon[ad]
+            kod[mutasyon] = rng.integers(0, len(self._kategoriler[ad]), int(mutasyon.sum()))
+            mutasyon_sayisi += mutasyon
+            yavru[ad] = kod
+
+        # Özellik kalıtımı ve sınır kontrolü
+        yavru['x'] = x[anneler] + rng.uniform(-kural.konum_sapmasi, kural.konum_sapmasi, m)
+        yavru['y'] = y[anneler] + rng.uniform(-kural.konum_sapmasi, kural.konum_sapmasi, m)
+        yavru['boyut'] = np.clip(ortalama(boyut, 'boyut'), *sinir['boyut'])
+        yavru['hiz'] = np.clip(ortalama(hiz, 'hiz'), *sinir['hiz'])
+        yavru['enerji'] = rng.uniform(*kural.yavru_enerjisi, m)
+        yavru['max_enerji'] = ortalama(max_enerji, 'max_enerji')
+        yavru['yas'] = np.zeros(m, dtype=np.int64)
+        yavru['zeka'] = np.clip(ortalama(zeka, 'zeka'), *sinir['zeka'])
+        yavru['guc'] = np.clip(ortalama(guc, 'guc'), *sinir['guc'])
+        yavru['dayaniklilik'] = np.clip(ortalama(dayaniklilik, 'dayaniklilik'), *sinir['dayaniklilik'])
+        yavru['cinsiyet'] = rng.integers(0, 2, m)
+        yavru['mutasyon_sayisi'] = mutasyon_sayisi
+        yavru['nesil'] = np.maximum(nesil[babalar], nesil[anneler]) + 1
+        yavru['hayatta'] = np.ones(m, dtype=bool)
+        yavru['anne_id'] = kimlik[anneler]
+        yavru['baba_id'] = kimlik[babalar]
+        yavru['id'] = self.soy_agaci.toplu_ekle(yavru['anne_id'], yavru['baba_id'], self.zaman, yavru['nesil'])
+        return yavru
+
+    def _kusak_ekle(self, yavru: dict):
+        """Yavru sütunlarını popülasyona ve sayaçlara tek seferde ekle"""
+        yeni_ajanlar = self._sutunlardan_ekle(yavru)
+        if isinstance(self.ajanlar, BalikDizisi):
+            self.sayaclar.dizi_guncelle(self.ajanlar, np.arange(yeni_ajanlar.start, yeni_ajanlar.stop))
+            return
+        for ajan in yeni_ajanlar:
+            self.sayaclar.ekle(ajan)
+
+    def _sutunlardan_ekle(self, sutunlar: dict):
+        """Sütun sözlüğünü (kategoriler kod olarak) popülasyona ekle
+
+        Dizi deposunda eklenen indeks aralığını, liste kipinde türün yeni
+        kayıt nesnelerini döndürür; sayaçlara dokunmaz.
+        """
+        if isinstance(self.ajanlar, BalikDizisi):
+            return self.ajanlar.toplu_ekle(sutunlar)
+
+        kategoriler = self._kategoriler
+        ajan_sinifi = self.tanim.ajan_sinifi
+        alanlar = [ad for ad in sutunlar if ad not in kategoriler]
+        degerler = [sutunlar[ad].tolist() for ad in alanlar]
+        kod_sutunlari = [(ad, sutunlar[ad].tolist()) for ad in kategoriler if ad in sutunlar]
+        yeni_ajanlar = []
+        for i in range(len(degerler[0])):
+            ozellikler = {ad: sutun[i] for ad, sutun in zip(alanlar, degerler)}
+            for ad, kodlar in kod_sutunlari:
+                ozellikler[ad] = kategoriler[ad][kodlar[i]]
+            yeni_ajanlar.append(ajan_sinifi(**ozellikler))
+        self.ajanlar.extend(yeni_ajanlar)
+        return yeni_ajanlar
+
+    def _kod_sutunlari(self, *alanlar) -> List[np.ndarray]:
+        """Kategorik alanları ortak kod sırasıyla sütun olarak döndür"""
+        if isinstance(self.ajanlar, BalikDizisi):
+            return [self.ajanlar.sutun(ad) for ad in alanlar]
+        n = len(self.ajanlar)
+        return [np.fromiter((self._kategori_kodlari[ad][getattr(b, ad)] for b in self.ajanlar),
+                            dtype=np.int64, count=n) for ad in alanlar]
+
+    def _sutunlari_al(self, *alanlar) -> List[np.ndarray]:
+        """Sayısal birey alanlarını sütun olarak döndür
+
+        Dizi deposunda doğrudan görünüm, liste kipinde kopya döner; liste
+        kipinde yapılan değişiklikler _sutuna_yaz ile geri yazılmalıdır.
+        """
+        if isinstance(self.ajanlar, BalikDizisi):
+            return [self.ajanlar.sutun(ad) for ad in alanlar]
+        n = len(self.ajanlar)
+        return [np.fromiter((getattr(b, ad) for b in self.ajanlar), dtype=SAYISAL_ALANLAR[ad], count=n)
+                for ad in alanlar]
+
+    def _sutuna_yaz(self, alan: str, indeksler: np.ndarray, degerler: np.ndarray):
+        """Seçili bireylerin bir alanını toplu olarak güncelle"""
+        if isinstance(self.ajanlar, BalikDizisi):
+            self.ajanlar.sutun(alan)[indeksler] = degerler
+            return
+        for i, deger in zip(indeksler.tolist(), degerler.tolist()):
+            setattr(self.ajanlar[i], alan, deger)
+
+    def yiyecek_sistemi_guncelle(self):
+        """Yiyecek sistemini güncelle (toplu eşleştirme)
+
+        Her canlı birey, tick başında dolu olan en yakın kaynağa (yem
+        menzili içinde) atanır. Aynı kaynağa düşen bireyler liste sırasına
+        göre dizilir; her bireyin payı, kendinden öncekilerin talebi
+        düşüldükten sonra kalan miktardır. Böylece sonuç tek tek tüketimle
+        aynı sırayı izler ama tek geçişte hesaplanır.
+        """
+        kaynaklar = self.yiyecek_kaynaklari
+        m = len(kaynaklar)
+        if m == 0:
+            return
+        kural = self.tanim.yem
+
+        # Yiyecek kaynaklarını güncelle
+        for kaynak in kaynaklar:
+            kaynak.guncelle()
+        miktar = np.fromiter((k.miktar for k in kaynaklar), dtype=np.float64, count=m)
+        kx = np.fromiter((k.x for k in kaynaklar), dtype=np.float64, count=m)
+        ky = np.fromiter((k.y for k in kaynaklar), dtype=np.float64, count=m)
+
+        x, y, boyut, enerji, max_enerji, hayatta = self._sutunlari_al(
+            'x', 'y', 'boyut', 'enerji', 'max_enerji', 'hayatta')
+        canli = np.flatnonzero(hayatta)
+        if len(canli) == 0:
+            return
+
+        # Birey -> kaynak yakınlık çiftleri (yalnızca dolu kaynaklar)
+        self.yem_izgarasi.yeniden_olustur(kx, ky, aktif=miktar > 0)
+        sorgu, kaynak_no, d2 = self.yem_izgarasi.komsu_ciftleri(x[canli], y[canli], kural.menzil)
+        if len(sorgu) == 0:
+            return
+
+        # Her birey için en yakın kaynak: (birey, mesafe) sırasında ilk çift
+        sira = np.lexsort((kaynak_no, d2, sorgu))
+        sorgu, kaynak_no = sorgu[sira], kaynak_no[sira]
+        ilk = np.ones(len(sorgu), dtype=bool)
+        ilk[1:] = sorgu[1:] != sorgu[:-1]
+        yiyenler = canli[sorgu[ilk]]
+        hedef = kaynak_no[ilk]
+
+        # Çekişme: kaynak içinde birey sırasına göre kümülatif talep
+        sira = np.lexsort((yiyenler, hedef))
+        yiyenler, hedef = yiyenler[sira], hedef[sira]
+        talep = boyut[yiyenler] * kural.talep_carpani
+        kumulatif = np.cumsum(talep)
+        grup_basi = np.ones(len(hedef), dtype=bool)
+        grup_basi[1:] = hedef[1:] != hedef[:-1]
+        grup_oncesi = np.maximum.accumulate(np.where(grup_basi, kumulatif - talep, 0.0))
+        onceki_talep = kumulatif - talep - grup_oncesi
+        tuketilen = np.clip(miktar[hedef] - onceki_talep, 0.0, talep)
+
+        yedi = tuketilen > 0
+        yiyenler = yiyenler[yedi]
+        self._sutuna_yaz('enerji', yiyenler,
+                         np.minimum(max_enerji[yiyenler], enerji[yiyenler] + tuketilen[yedi] * kural.kazanc))
+        kalan = miktar - np.bincount(hedef, weights=tuketilen, minlength=m)
+        for kaynak, deger in zip(kaynaklar, kalan.tolist()):
+            kaynak.miktar = max(0.0, deger)
+
+    def istatistikleri_guncelle(self):
+        """Gelişmiş istatistik takibi"""
+        sayac = self.sayaclar
+        toplam_sayi = sayac.sayi
+
+        # Renk ve tür dağılımı
+        renk_sayilari = sayac.dagilim('renk')
+        tur_sayilari = {tur.value: sayi for tur, sayi in sayac.dagilim('tur').items()}
+
+        # Genetik çeşitlilik
+        ortalama_zeka = sayac.ortalama('zeka')
+        ortalama_guc = sayac.ortalama('guc')
+        ortalama_dayaniklilik = sayac.ortalama('dayaniklilik')
+        toplam_mutasyon = int(round(sayac.toplam('mutasyon_sayisi'))) if toplam_sayi else 0
+
+        # Kayıt
+        kayit = {'populasyon': toplam_sayi}
+        for renk, sayi in renk_sayilari.items():
+            kayit[f'renk.{renk}'] = sayi
+        for tur, sayi in tur_sayilari.items():
+            kayit[f'tur.{tur}'] = sayi
+        onek = self.tanim.ortam_oneki
+        for ad, nitelik in self.tanim.ortam_alanlari.items():
+            kayit[f'{onek}.{ad}'] = getattr(self.ortam, nitelik)
+        kayit[f'{onek}.avci_sayisi'] = len(self.avcilar)
+        kayit['genetik.zeka'] = ortalama_zeka
+        kayit['genetik.guc'] = ortalama_guc
+        kayit['genetik.dayaniklilik'] = ortalama_dayaniklilik
+        kayit['genetik.mutasyon'] = toplam_mutasyon
+        self.gecmis.kaydet(self.zaman, kayit)
+        if self.kosu_kaydi is not None:
+            kayit['nesil'] = self.nesil
+            self.kosu_kaydi.ekle(self.zaman, kayit)
+
+    def _acil_populasyon_ekleme(self):
+        """Acil durum popülasyon ekleme"""
+        hayatta_ajanlar = [b for b in self.ajanlar if b.hayatta]
+        r = self.rastgele.baslangic
+        tanim = self.tanim
+        kenar = tanim.baslangic_kenari
+        sapma = tanim.acil_sapmalari
+
+        if len(hayatta_ajanlar) > 0:
+            # Mevcut bireylerden örnekleyerek yenilerini oluştur
+            for _ in range(tanim.acil_sayisi):
+                ornek = r.choice(hayatta_ajanlar)
+                yeni_ajan = tanim.ajan_sinifi(
+                    x=r.uniform(kenar, self.genislik - kenar),
+                    y=r.uniform(kenar, self.yukseklik - kenar),
+                    renk=ornek.renk,
+                    boyut=ornek.boyut + r.uniform(-sapma['boyut'], sapma['boyut']),
+                    hiz=ornek.hiz + r.uniform(-sapma['hiz'], sapma['hiz']),
+                    enerji=r.uniform(*tanim.ureme.yavru_enerjisi),
+                    max_enerji=ornek.max_enerji,
+                    yas=0,
+                    zeka=ornek.zeka + r.uniform(-sapma['zeka'], sapma['zeka']),
+                    guc=ornek.guc + r.uniform(-sapma['guc'], sapma['guc']),
+                    dayaniklilik=ornek.dayaniklilik + r.uniform(-sapma['dayaniklilik'], sapma['dayaniklilik']),
+                    tur=ornek.tur,
+                    davranis=ornek.davranis,
+                    cinsiyet=r.choice(["erkek", "disi"]),
+                    nesil=ornek.nesil + 1
+                )
+                self._dogum_kaydet(yeni_ajan)
+                self.ajanlar.append(yeni_ajan)
+        else:
+            # Tamamen yeni popülasyon
+            self.baslangic_olustur(*self._baslangic_sayilari)
+
+    def yeniden_baslat(self):
+        """Simülasyonu yeniden başlat"""
+        self.zaman = 0
+        self.nesil = 0
+        self.gecmis.temizle()
+        self.soy_agaci.temizle()
+        self._kosu_kaydini_yenile()
+        self.baslangic_olustur(*self._baslangic_sayilari)
+
+    # --- Kontrol noktası -------------------------------------------------
+
+    def kontrol_noktalarini_ac(self, klasor: str = "kontrol_noktalari", aralik: int = 3600,
+                               saklanan: int = 3) -> KontrolNoktalari:
+        """Her `aralik` tickte bir tam durum kaydı al; son `saklanan` dosya tutulur"""
+        self.kontrol_noktalari = KontrolNoktalari(klasor, self.tanim.ad, aralik, saklanan)
+        return self.kontrol_noktalari
+
+    def kontrol_noktasi_kaydet(self) -> str:
+        """Hemen kontrol noktası yaz (periyodik kayıt kapalıysa varsayılan klasöre)"""
+        return self._kontrol_noktalari().kaydet(self)
+
+    def kontrol_noktasi_geri_yukle(self, dosya: str = None) -> Optional[str]:
+        """Verilen ya da en son kontrol noktasını yükle; yüklenen dosyayı döndür (yoksa None)"""
+        return self._kontrol_noktalari().geri_yukle(self, dosya)
+
+    def _kontrol_noktalari(self) -> KontrolNoktalari:
+        # Periyodik kayıt kapalıyken elle kaydetme ve yükleme varsayılan klasörü kullanır
+        return self.kontrol_noktalari or KontrolNoktalari("kontrol_noktalari", self.tanim.ad)
+
+    @classmethod
+    def son_kontrol_noktasindan(cls, klasor: str = "kontrol_noktalari", paralel: int = 0) -> Optional['AjanMotoru']:
+        """`klasor`daki bu türün en son kontrol noktasından motor kur (nokta yoksa None)"""
+        dosya = KontrolNoktalari(klasor, cls.TANIM.ad).en_son()
+        return None if dosya is None else cls.kontrol_noktasindan(dosya, paralel)
+
+    @classmethod
+    def kontrol_noktasindan(cls, dosya: str, paralel: int = 0) -> 'AjanMotoru':
+        """Kontrol noktası dosyasından yeni bir motor kur
+
+        Karolu koşudan alınan nokta aynı karo düzeniyle sürdürülür (`paralel`
+        0 ise karolar bu süreçte işlenir).
+        """
+        sutunlar, meta = npz_yukle(dosya)
+        motor = cls(meta['genislik'], meta['yukseklik'], meta['dizi_deposu'],
+                    paralel=paralel, karolar=meta.get('karolar'))
+        motor.durum_yukle(sutunlar, meta)
+        return motor
+
+    def durum_al(self):
+        """Dünyanın tam durumu: sütunlar ve JSON meta başlığı
+
+        Bireyler, yem kaynakları, avcılar, soy ağacı, sayaçlar, geçmiş ve
+        rastgele sayı akışları dahildir; uzamsal ızgaralar her tick yeniden
+        kurulduğu için saklanmaz.
+        """
+        onek = self.tanim.ajan_oneki
+        sutunlar = {}
+        for ad, sutun in zip(SAYISAL_ALANLAR, self._sutunlari_al(*SAYISAL_ALANLAR)):
+            sutunlar[f'{onek}.{ad}'] = sutun
+        for ad, sutun in zip(KOD_ALANLARI, self._kod_sutunlari(*KOD_ALANLARI)):
+            sutunlar[f'{onek}.{ad}'] = sutun.astype(np.int8)
+
+        kaynaklar = self.yiyecek_kaynaklari
+        for ad in ('x', 'y', 'miktar', 'max_miktar', 'yenilenme_hizi'):
+            sutunlar[f'yem.{ad}'] = np.array([getattr(k, ad) for k in kaynaklar], dtype=np.float64)
+        for ad in ('x', 'y', 'hiz', 'menzil', 'tokluk'):
+            sutunlar[f'avci.{ad}'] = self.avcilar.sutun(ad).copy()
+        sutunlar['avci.hedef'] = self.avcilar.sutun('hedef_id').copy()
+
+        sutunlar.update(onekle('soy', self.soy_agaci.durum()))
+        sutunlar.update(onekle('sayac', self.sayaclar.durum()))
+        sutunlar.update(onekle('gecmis', self.gecmis.durum()))
+
+        meta = {
+            'tur': self.tanim.ad,
+            'genislik': self.genislik,
+            'yukseklik': self.yukseklik,
+            'dizi_deposu': isinstance(self.ajanlar, BalikDizisi),
+            'karolar': self.paralel_hareket.karo_duzeni if self.paralel_hareket else None,
+            'zaman': self.zaman,
+            'nesil': self.nesil,
+            'ortam': asdict(self.ortam),
+            'sikistirma_araligi': self.sikistirma_araligi,
+            'sikistirma_modu': self.sikistirma_modu,
+            'suru_yaricapi': self.suru_yaricapi,
+            'kategoriler': {ad: [getattr(d, 'value', d) for d in degerler]
+                            for ad, degerler in self._kategoriler.items()},
+            'tohum': self.rastgele.tohum,
+            'rng': self.rastgele.durum(),
+        }
+        return sutunlar, meta
+
+    def durum_yukle(self, sutunlar: dict, meta: dict):
+        """durum_al çıktısını bu motora yükle (mevcut dünya silinir)"""
+        kategoriler = {ad: [getattr(d, 'value', d) for d in degerler]
+                       for ad, degerler in self._kategoriler.items()}
+        # Ortak motordan önceki böcek noktalarında sütun deposu bilgisi ve soy ağacı yoktu
+        if meta.get('tur') != self.tanim.ad or 'dizi_deposu' not in meta or meta['kategoriler'] != kategoriler:
+            raise ValueError(f"Kontrol noktası bu {self.tanim.ad} motoruyla uyumlu değil")
+        # Farklı boyuttaki dünyaya yüklenen bireyler ilk tickte kenarlara sıkışırdı
+        if (meta['genislik'], meta['yukseklik']) != (self.genislik, self.yukseklik):
+            raise ValueError(f"Kontrol noktasının dünyası {meta['genislik']}x{meta['yukseklik']}, "
+                             f"bu motorunki {self.genislik}x{self.yukseklik}")
+
+        self.zaman = meta['zaman']
+        self.nesil = meta['nesil']
+        # Eski akvaryum noktalarında ortam 'su_ortami' adıyla saklanırdı
+        self.ortam = self.tanim.ortam_sinifi(**meta.get('ortam', meta.get('su_ortami')))
+        self.sikistirma_araligi = meta['sikistirma_araligi']
+        self.sikistirma_modu = meta['sikistirma_modu']
+        self.suru_yaricapi = meta.get('suru_yaricapi', 0.0)
+
+        self.ajanlar.clear()
+        ajanlar = onek_ayikla(self.tanim.ajan_oneki, sutunlar)
+        if len(ajanlar['id']):
+            self._sutunlardan_ekle(ajanlar)
+
+        self.yiyecek_kaynaklari.clear()
+        yem = onek_ayikla('yem', sutunlar)
+        for i in range(len(yem['x'])):
+            kaynak = YiyecekKaynagi(float(yem['x'][i]), float(yem['y'][i]), float(yem['max_miktar'][i]),
+                                    float(yem['yenilenme_hizi'][i]))
+            kaynak.miktar = float(yem['miktar'][i])
+            self.yiyecek_kaynaklari.append(kaynak)
+
+        # Hedef indeksleri ilk adımda kimlikten bulunur
+        self.avcilar.clear()
+        avci_sutunlari = onek_ayikla('avci', sutunlar)
+        avci_sutunlari['hedef_id'] = avci_sutunlari.pop('hedef')
+        if len(avci_sutunlari['x']):
+            self.avcilar.toplu_ekle(avci_sutunlari)
+
+        self.soy_agaci.durumu_yukle(onek_ayikla('soy', sutunlar))
+        self.sayaclar.durumu_yukle(onek_ayikla('sayac', sutunlar))
+        self.gecmis.durumu_yukle(onek_ayikla('gecmis', sutunlar))
+        # Sürdürülen koşunun tohumu noktanınkidir (yeni akışlar ve koşu kaydı için);
+        # tohumu saklanmayan eski noktalarda bilinmez
+        if meta.get('tohum') is not None:
+            self.rastgele.tohumu_degistir(meta['tohum'])
+        else:
+            self.rastgele.tohum = None
+        self.rastgele.durumu_yukle(meta['rng'])
+        self._izgara_guncel = False
+        self._kosu_kaydini_yenile()
+
+    # --- Koşu kaydı -----------------------------------------------------
+
+    def kosu_kaydini_ac(self, klasor: str = "kosu_kayitlari", parca_boyu: int = 600) -> KosuKaydedici:
+        """İstatistikleri her tick `klasor/<tür>_<tarih>_<tick>.kayit` dosyasına akıt
+
+        Kayıt her `parca_boyu` tickte bir arka planda diske yazılır; okumak
+        için `kosu_kaydi.KosuOkuyucu`. Zaman geri sardığında (yeniden başlatma,
+        kontrol noktası yükleme) yeni bir dosyaya geçilir.
+        """
+        self._kosu_kaydi_ayari = (klasor, parca_boyu)
+        if self.kosu_kaydi is not None:
+            self.kosu_kaydi.kapat()
+        ad = self.tanim.ad
+        meta = {'tur': ad, 'genislik': self.genislik, 'yukseklik': self.yukseklik,
+                'tohum': self.rastgele.tohum, 'dizi_deposu': isinstance(self.ajanlar, BalikDizisi)}
+        self.kosu_kaydi = KosuKaydedici(yeni_dosya_adi(klasor, ad, self.zaman),
+                                        self.gecmis.alanlar + ['nesil'], parca_boyu, meta)
+        return self.kosu_kaydi
+
+    def _kosu_kaydini_yenile(self):
+        if self.kosu_kaydi is not None:
+            self.kosu_kaydini_ac(*self._kosu_kaydi_ayari)
+
+    def veri_kaydet(self) -> str:
+        """Koşu kaydını diske indir (kayıt kapalıysa şimdiden itibaren aç)"""
+        if self.kosu_kaydi is None:
+            self.kosu_kaydini_ac()
+        else:
+            self.kosu_kaydi.bosalt(bekle=True)
+        print(f"Koşu kaydı: {self.kosu_kaydi.dosya} (zaman {self.zaman})")
+        return self.kosu_kaydi.dosya
@@ -0,0 +1,217 @@
+import random
+from dataclasses import dataclass
+from enum import Enum
+from balik_dizisi import BALIK_HAREKETI
+from avci_sistemi import YAKALAMA_YARICAPI, YAKALAMA_TOKLUGU, TOKLUK_TUKETIMI
+from ajan_motoru import (
+    Ajan, AjanMotoru,
+    TurTanimi, SecilimKurallari, UremeKurallari, YemKurallari, AvciKurallari
+)
+
+# Sorgu yarıçapları (uzamsal ızgaranın hücre boyutu bunlardan en büyüğüne göre seçilir)
+RAKIP_MESAFESI = 80.0
+AVCI_MENZILI = 90.0
+YEM_MENZILI = 35.0
+
+# Doğal seçilimde renk ve türe göre hayatta kalma avantajları
+RENK_AVANTAJLARI = {
+    'kirmizi': 0.7,  # Kırmızı balıklar daha güçlü
+    'beyaz': 0.9     # Beyaz balıklar daha dayanıklı
+}
+
+class BalikTuru(Enum):
+    """Balık türleri"""
+    JAPON_BALIGI = "japon_baligi"
+    KOI = "koi"
+    GUPPY = "guppy"
+    NEON = "neon"
+
+TUR_AVANTAJLARI = {
+    BalikTuru.KOI: 0.8,          # En dayanıklı
+    BalikTuru.JAPON_BALIGI: 0.7,
+    BalikTuru.GUPPY: 0.6,
+    BalikTuru.NEON: 0.5
+}
+
+@dataclass
+class SuOrtami:
+    """Su ortamı koşulları"""
+    sicaklik: float = 25.0  # Celsius
+    ph: float = 7.0         # pH seviyesi
+    oksijen: float = 100.0  # Oksijen miktarı
+    yiyecek_miktari: float = 100.0
+    avcı_sayisi: int = 0
+    mevsim: str = "ilkbahar"
+
+@dataclass
+class Balik(Ajan):
+    """Gelişmiş balık sınıfı (hareket ve ölüm kuralları ajan_motoru.Ajan'da)"""
+    def yiyecek_ye(self, yiyecek_miktari: float) -> float:
+        """Yiyecek tüketimi"""
+        if not self.hayatta:
+            return 0
+
+        ihtiyac = min(self.max_enerji - self.enerji, yiyecek_miktari * 0.12)
+        self.enerji = min(self.max_enerji, self.enerji + ihtiyac)
+        return ihtiyac
+
+class Avcı:
+    """Avcı balık (büyük balık)
+
+    Yalnızca başlangıç değerlerini taşır; motor avcıları AvciSistemi
+    sütunlarında tutar ve hepsini birlikte hareket ettirir.
+    """
+    def __init__(self, x: float, y: float):
+        self.x = x
+        self.y = y
+        self.hiz = 1.8
+        self.menzil = AVCI_MENZILI
+        self.tokluk = 120.0
+
+def su_ortami_guncelle(su_ortami: SuOrtami, zaman: int, r: random.Random):
+    """Su ortamı koşullarını güncelle"""
+    # Mevsimsel değişiklikler
+    mevsim_dongusu = (zaman // 1200) % 4
+    mevsimler = ["ilkbahar", "yaz", "sonbahar", "kis"]
+    su_ortami.mevsim = mevsimler[mevsim_dongusu]
+
+    # Sıcaklık değişimi
+    if su_ortami.mevsim == "yaz":
+        su_ortami.sicaklik = 26 + r.uniform(-3, 6)
+    elif su_ortami.mevsim == "kis":
+        su_ortami.sicaklik = 20 + r.uniform(-5, 3)
+    else:
+        su_ortami.sicaklik = 23 + r.uniform(-3, 3)
+
+    # pH değişimi
+    su_ortami.ph = 7.0 + r.uniform(-0.8, 0.8)
+
+    # Oksijen seviyesi
+    su_ortami.oksijen = 100 + r.uniform(-15, 10)
+
+    # Yiyecek miktarı mevsimsel
+    if su_ortami.mevsim == "ilkbahar":
+        su_ortami.yiyecek_miktari = min(180, su_ortami.yiyecek_miktari + 1.2)
+    elif su_ortami.mevsim == "kis":
+        su_ortami.yiyecek_miktari = max(30, su_ortami.yiyecek_miktari - 0.6)
+
+def su_ortami_cezasi(su_ortami: SuOrtami) -> float:
+    """Bu tickin su koşullarından gelen, tüm balıklar için ortak ölüm riski"""
+    etki = 0.0
+
+    # Sıcaklık etkisi
+    if su_ortami.sicaklik < 15 or su_ortami.sicaklik > 35:
+        etki += 0.004
+
+    # pH etkisi
+    if su_ortami.ph < 6.0 or su_ortami.ph > 8.5:
+        etki += 0.003
+
+    # Oksijen etkisi
+    if su_ortami.oksijen < 70:
+        etki += 0.005
+
+    return etki
+
+BALIK_TANIMI = TurTanimi(
+    ad="akvaryum",
+    ajan_adi="Balık",
+    ajan_oneki="balik",
+    ajan_sinifi=Balik,
+    # Sadece kırmızı ve beyaz renkler
+    renkler={
+        'kirmizi': (255, 50, 50),    # Parlak kırmızı
+        'beyaz': (255, 255, 255)     # Beyaz
+    },
+    turler=BalikTuru,
+    ortam_sinifi=SuOrtami,
+    ortam_guncelle=su_ortami_guncelle,
+    ortam_fazi="su_ortami",
+    ortam_oneki="su",
+    ortam_alanlari={'sicaklik': 'sicaklik', 'ph': 'ph', 'oksijen': 'oksijen'},
+    hareket=BALIK_HAREKETI,
+    rakip_mesafesi=RAKIP_MESAFESI,
+    secilim=SecilimKurallari(
+        renk_avantajlari=RENK_AVANTAJLARI,
+        tur_avantajlari=TUR_AVANTAJLARI,
+        ortam_cezasi=su_ortami_cezasi,
+        hastalik_olasiligi=0.0015,   # %0.15
+        taban_risk=0.006,
+        renk_katsayisi=0.0015,
+        tur_katsayisi=0.0008,
+        dayaniklilik_katsayisi=0.0015,
+        hastalik_riski=0.008,
+        yaslilik_esigi=600,
+        yaslilik_katsayisi=0.000008,
+    ),
+    ureme=UremeKurallari(
+        aralik=120,
+        en_az_populasyon=15,
+        enerji_esigi=50,
+        yas_esigi=100,
+        en_fazla_cift=25,
+        ayni_tur_uyumu=0.85,         # Aynı tür %85, farklı tür %25
+        farkli_tur_uyumu=0.25,
+        erkek_enerji_kaybi=12,
+        disi_enerji_kaybi=18,
+        yavru_sayisi=(2, 6),
+        mutasyon={'renk': 0.06, 'tur': 0.04, 'davranis': 0.05},
+        konum_sapmasi=25,
+        yavru_enerjisi=(80, 110),
+        sapmalar={'boyut': 1.5, 'hiz': 0.4, 'max_enerji': 12, 'zeka': 0.12, 'guc': 0.12, 'dayaniklilik': 0.12},
+        sinirlar={'boyut': (3, 20), 'hiz': (0.8, 5), 'zeka': (0.1, 1.0), 'guc': (0.1, 1.0),
+                  'dayaniklilik': (0.1, 1.0)},
+    ),
+    yem=YemKurallari(menzil=YEM_MENZILI, talep_carpani=2.5, kazanc=0.6, yenilenme_hizi=0.6,
+                     kenar=50, miktar=(80, 180)),
+    avci=AvciKurallari(hiz=1.8, menzil=AVCI_MENZILI, tokluk=120.0, yakalama_yaricapi=YAKALAMA_YARICAPI,
+                       yakalama_toklugu=YAKALAMA_TOKLUGU, tokluk_tuketimi=TOKLUK_TUKETIMI,
+                       dogma_olasiligi=0.0008, en_fazla=6, kenar=50),  # %0.08 şans
+    baslangic_sayilari=(180, 12, 2),
+    baslangic_kenari=80,
+    baslangic_araliklari={
+        'boyut': (5, 15), 'hiz': (1.0, 3.0), 'enerji': (70, 110), 'max_enerji': (90, 130),
+        'yas': (0, 120), 'zeka': (0.2, 1.0), 'guc': (0.2, 1.0), 'dayaniklilik': (0.2, 1.0),
+    },
+    acil_esigi=25,
+    acil_sayisi=40,
+    acil_sapmalari={'boyut': 1.5, 'hiz': 0.3, 'zeka': 0.12, 'guc': 0.12, 'dayaniklilik': 0.12},
+)
+
+class AkvaryumMotoru(AjanMotoru):
+    """Pygame'den bağımsız akvaryum simülasyon motoru
+
+    Ortak ajan motorunun (ajan_motoru.AjanMotoru) balık türüyle kurulmuş
+    halidir. Pygame penceresi (balik_simulasyonu.BalikSimulasyonu) bu
+    motorun durumunu okuyan isteğe bağlı bir ön yüzdür.
+    """
+
+    TANIM = BALIK_TANIMI
+
+    @property
+    def baliklar(self):
+        return self.ajanlar
+
+    @property
+    def su_ortami(self) -> SuOrtami:
+        return self.ortam
+
+    @su_ortami.setter
+    def su_ortami(self, deger: SuOrtami):
+        self.ortam = deger
+
+    def baslangic_akvaryumu_olustur(self, balik_sayisi: int = 180, yem_sayisi: int = 12, avci_sayisi: int = 2):
+        """Başlangıç akvaryumunu oluştur (yeniden_baslat aynı sayıları kullanır)"""
+        self.baslangic_olustur(balik_sayisi, yem_sayisi, avci_sayisi)
+
+    def baliklari_hareket_ettir(self):
+        """Tüm balıkları bir adım hareket ettir"""
+        self.ajanlari_hareket_ettir()
+
+    def olu_baliklari_temizle(self) -> int:
+        """Ölü balıkları popülasyondan topluca çıkar"""
+        return self.olu_ajanlari_temizle()
+
+    def su_ortami_guncelle(self):
+        """Su ortamı koşullarını güncelle"""
+        self.ortam_guncelle()
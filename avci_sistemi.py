@@ -0,0 +1,228 @@
+from typing import Dict, Iterator
+
+import numpy as np
+
+# Hedefe bu mesafeden yakın avcı onu yakalar (piksel)
+YAKALAMA_YARICAPI = 18.0
+# Yakalamayla kazanılan ve her tick harcanan tokluk
+YAKALAMA_TOKLUGU = 60.0
+TOKLUK_TUKETIMI = 0.4
+
+AVCI_ALANLARI = {
+    'x': np.float64,
+    'y': np.float64,
+    'hiz': np.float64,
+    'menzil': np.float64,
+    'tokluk': np.float64,
+    'hedef': np.intp,      # Hedef balığın son bilinen indeksi
+    'hedef_id': np.int64,  # Hedef balığın kimliği (-1: hedef yok)
+}
+
+
+def _ozellik(ad: str):
+    def oku(self):
+        return float(self._sistem._sutunlar[ad][self._i])
+
+    def yaz(self, deger):
+        self._sistem._sutunlar[ad][self._i] = deger
+
+    return property(oku, yaz)
+
+
+class AvciGorunumu:
+    """AvciSistemi içindeki tek bir avcıya Avcı benzeri erişim (çizim için)"""
+    __slots__ = ('_sistem', '_i')
+
+    def __init__(self, sistem: 'AvciSistemi', i: int):
+        self._sistem = sistem
+        self._i = i
+
+    @property
+    def hedef_id(self) -> int:
+        return int(self._sistem._sutunlar['hedef_id'][self._i])
+
+    def __repr__(self):
+        return f"AvciGorunumu(x={self.x:.1f}, y={self.y:.1f}, tokluk={self.tokluk:.1f})"
+
+
+for _ad in ('x', 'y', 'hiz', 'menzil', 'tokluk'):
+    setattr(AvciGorunumu, _ad, _ozellik(_ad))
+
+
+class AvciSistemi:
+    """Avcılar için sütun tabanlı depo ve toplu takip adımı
+
+    Liste gibi kullanılabilir (len, döngü, indeks, append, clear); döngü
+    AvciGorunumu döndürür. `adim` tüm avcıların hedef seçimini, hareketini
+    ve yakalamalarını tek seferde yapar. Hedefler balık kimliğiyle tutulur:
+    balık dizisi sıkıştırılıp indeksler kaysa da takip sürer. Aç kalan
+    avcılar `temizle` ile yeni liste kurulmadan çıkarılır. Yakalama
+    yarıçapı ve tokluk değerleri türe göre verilebilir (varsayılanlar balık
+    avcısınındır).
+    """
+
+    def __init__(self, kapasite: int = 8, yakalama_yaricapi: float = YAKALAMA_YARICAPI,
+                 yakalama_toklugu: float = YAKALAMA_TOKLUGU, tokluk_tuketimi: float = TOKLUK_TUKETIMI):
+        self.n = 0
+        self.yakalama_yaricapi = yakalama_yaricapi
+        self.yakalama_toklugu = yakalama_toklugu
+        self.tokluk_tuketimi = tokluk_tuketimi
+        self._sutunlar: Dict[str, np.ndarray] = {ad: np.zeros(max(1, kapasite), dtype=tip)
+                                                 for ad, tip in AVCI_ALANLARI.items()}
+
+    # --- Liste arayüzü -------------------------------------------------
+
+    def __len__(self) -> int:
+        return self.n
+
+    def __iter__(self) -> Iterator[AvciGorunumu]:
+        return (AvciGorunumu(self, i) for i in range(self.n))
+
+    def __getitem__(self, i: int) -> AvciGorunumu:
+        if i < 0:
+            i += self.n
+        if not 0 <= i < self.n:
+            raise IndexError("AvciSistemi indeksi aralık dışında")
+        return AvciGorunumu(self, i)
+
+    def append(self, avci):
+        """Avcı (veya x, y, hiz, menzil, tokluk niteliklerine sahip nesne) ekle"""
+        self.toplu_ekle({ad: np.array([getattr(avci, ad)]) for ad in ('x', 'y', 'hiz', 'menzil', 'tokluk')})
+
+    def toplu_ekle(self, sutunlar: Dict[str, np.ndarray]) -> range:
+        """Sütun sözlüğünden avcı ekle; verilmeyen hedef alanları 'hedef yok' olur"""
+        m = len(sutunlar['x'])
+        bas, son = self.n, self.n + m
+        if son > len(self._sutunlar['x']):
+            yeni_kapasite = 1 << (son - 1).bit_length()
+            for ad, dizi in self._sutunlar.items():
+                buyuk = np.zeros(yeni_kapasite, dtype=dizi.dtype)
+                buyuk[:self.n] = dizi[:self.n]
+                self._sutunlar[ad] = buyuk
+        for ad, dizi in self._sutunlar.items():
+            dizi[bas:son] = sutunlar[ad] if ad in sutunlar or not ad.startswith('hedef') else -1
+        self.n = son
+        return range(bas, son)
+
+    def clear(self):
+        self.n = 0
+
+    def sutun(self, ad: str) -> np.ndarray:
+        """Bir alanın canlı görünümü (kopya değil)"""
+        return self._sutunlar[ad][:self.n]
+
+    def temizle(self) -> int:
+        """Tokluğu bitmiş avcıları sırayı koruyarak çıkar, çıkarılan sayıyı döndür"""
+        tok = self.sutun('tokluk') > 0
+        k = int(np.count_nonzero(tok))
+        if k == self.n:
+            return 0
+        for dizi in self._sutunlar.values():
+            dizi[:k] = dizi[:self.n][tok]
+        cikan, self.n = self.n - k, k
+        return cikan
+
+    # --- Toplu takip ---------------------------------------------------
+
+    def adim(self, genislik: int, yukseklik: int, izgara, balik_x: np.ndarray, balik_y: np.ndarray,
+             hayatta: np.ndarray, kimlikler: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+        """Tüm avcıları bir tick ilerlet; yakalanan balıkların indekslerini döndür
+
+        Hedefi olmayan ya da hedefi ölmüş avcılara menzildeki en yakın canlı
+        balık tek bir ızgara sorgusuyla atanır (ızgara tick başı konumlarıdır).
+        Hedefli avcılar hedefin güncel konumuna `hiz` kadar yaklaşır, diğerleri
+        rastgele dolaşır. Adım öncesi hedefine `yakalama_yaricapi`ndan yakın olan
+        avcı yakalar; aynı balığa birden çok avcı ulaştıysa en yakın olan
+        (eşitlikte küçük indeksli) kazanır, diğerleri hedefsiz kalır ve sonraki
+        tick yeni hedef arar. Balıkları öldürmek çağıranın işidir.
+        """
+        n = self.n
+        if n == 0:
+            return np.empty(0, dtype=np.intp)
+        s = {ad: dizi[:n] for ad, dizi in self._sutunlar.items()}
+        aktif = s['tokluk'] > 0
+        hedef, hedef_id = s['hedef'], s['hedef_id']
+
+        # Hedef indeksini kimlikle doğrula; sıkıştırmayla kaymışsa kimlikten yeniden bul
+        m = len(kimlikler)
+        hedefli = hedef_id >= 0
+        gecerli = hedefli & (hedef >= 0) & (hedef < m)
+        gecerli[gecerli] = kimlikler[hedef[gecerli]] == hedef_id[gecerli]
+        kaymis = np.flatnonzero(hedefli & ~gecerli)
+        if len(kaymis):
+            hedef[kaymis] = _kimlikten_bul(kimlikler, hedef_id[kaymis])
+        hedefli &= hedef >= 0
+        hedefli[hedefli] = hayatta[hedef[hedefli]]
+
+        # Hedefsiz avcılara menzildeki en yakın canlı balık
+        arayan = np.flatnonzero(aktif & ~hedefli)
+        if len(arayan) and izgara is not None:
+            bulunan = _en_yakin_canlilar(izgara, s['x'][arayan], s['y'][arayan], s['menzil'][arayan], hayatta)
+            hedef[arayan] = bulunan
+            hedefli[arayan] = bulunan >= 0
+
+        # Hareket: hedefe doğru ya da rastgele
+        takip = np.flatnonzero(aktif & hedefli)
+        dx = balik_x[hedef[takip]] - s['x'][takip]
+        dy = balik_y[hedef[takip]] - s['y'][takip]
+        mesafe = np.hypot(dx, dy)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            oran = np.where(mesafe > 0, s['hiz'][takip] / mesafe, 0.0)
+        s['x'][takip] += dx * oran
+        s['y'][takip] += dy * oran
+        gezen = np.flatnonzero(aktif & ~hedefli)
+        if len(gezen):
+            h = s['hiz'][gezen]
+            s['x'][gezen] += rng.uniform(-h, h)
+            s['y'][gezen] += rng.uniform(-h, h)
+
+        # Yakalama: aynı balığa ulaşanlar arasında en yakın avcı kazanır
+        yakin = mesafe < self.yakalama_yaricapi
+        avlar = np.empty(0, dtype=np.intp)
+        if yakin.any():
+            ulasan = takip[yakin]
+            sira = np.lexsort((ulasan, mesafe[yakin], hedef[ulasan]))
+            ulasan = ulasan[sira]
+            avlar = hedef[ulasan]
+            ilk = np.ones(len(avlar), dtype=bool)
+            ilk[1:] = avlar[1:] != avlar[:-1]
+            avlar = avlar[ilk]
+            s['tokluk'][ulasan[ilk]] += self.yakalama_toklugu
+            hedefli[ulasan] = False
+
+        hedef_id[:] = -1
+        hedef_id[hedefli] = kimlikler[hedef[hedefli]]
+        hedef[~hedefli] = -1
+
+        np.clip(s['x'], 0, genislik, out=s['x'])
+        np.clip(s['y'], 0, yukseklik, out=s['y'])
+        s['tokluk'][aktif] -= self.tokluk_tuketimi
+        return avlar
+
+
+def _kimlikten_bul(kimlikler: np.ndarray, arananlar: np.ndarray) -> np.ndarray:
+    """Aranan kimliklerin balık indeksleri (bulunamayan -1); tek geçişte"""
+    tekil, ters = np.unique(arananlar, return_inverse=True)
+    konum = np.minimum(np.searchsorted(tekil, kimlikler), len(tekil) - 1)
+    eslesen = np.flatnonzero(tekil[konum] == kimlikler)
+    bulunan = np.full(len(tekil), -1, dtype=np.intp)
+    bulunan[konum[eslesen]] = eslesen
+    return bulunan[ters]
+
+
+def _en_yakin_canlilar(izgara, x: np.ndarray, y: np.ndarray, menzil: np.ndarray,
+                       hayatta: np.ndarray) -> np.ndarray:
+    """Her sorgu için menzil içindeki en yakın canlı balık (yoksa -1)
+
+    Izgara bu tick içinde ölenleri de içerir; `hayatta` ile elenirler.
+    """
+    q, o, d2 = izgara.komsu_ciftleri(x, y, float(menzil.max()))
+    uygun = hayatta[o] & (d2 < menzil[q] ** 2)
+    q, o, d2 = q[uygun], o[uygun], d2[uygun]
+    sira = np.lexsort((o, d2, q))
+    q, o = q[sira], o[sira]
+    ilk = np.ones(len(q), dtype=bool)
+    ilk[1:] = q[1:] != q[:-1]
+    sonuc = np.full(len(x), -1, dtype=np.intp)
+    sonuc[q[ilk]] = o[ilk]
+    return sonuc
@@ -0,0 +1,293 @@
+import pygame
+import numpy as np
+from typing import Callable, Dict, List, Sequence, Tuple
+from akvaryum_motoru import BalikTuru
+from balik_dizisi import BalikDizisi
+
+SAYDAM_RENK = (255, 0, 255)  # Atlas renk anahtarı
+ENERJI_RENKLERI = [(255, 0, 0), (255, 255, 0), (0, 255, 0)]
+HAMILE_RENGI = (255, 192, 203)
+ENERJI_CUBUGU = 20  # piksel
+
+
+def balik_sekli_ciz(yuzey: pygame.Surface, tur: BalikTuru, renk: Tuple[int, int, int],
+                    x: int, y: int, boyut: int):
+    """Türe göre balık şeklini (x, y) merkezli çiz"""
+    if tur == BalikTuru.KOI:
+        # Gövde (büyük oval), kuyruk ve yüzgeçler
+        pygame.draw.ellipse(yuzey, renk, (x-boyut, y-boyut//2, boyut*2, boyut))
+        pygame.draw.polygon(yuzey, renk,
+                            [(x-boyut, y), (x-boyut*1.6, y-boyut//2), (x-boyut*1.6, y+boyut//2)])
+        pygame.draw.ellipse(yuzey, renk, (x-boyut//2, y-boyut*1.2, boyut//2, boyut//2))
+        pygame.draw.ellipse(yuzey, renk, (x-boyut//2, y+boyut//2, boyut//2, boyut//2))
+    elif tur == BalikTuru.JAPON_BALIGI:
+        # Yuvarlak gövde ve kuyruk
+        pygame.draw.circle(yuzey, renk, (x, y), boyut)
+        pygame.draw.polygon(yuzey, renk,
+                            [(x-boyut, y), (x-boyut*1.4, y-boyut//3), (x-boyut*1.4, y+boyut//3)])
+    else:
+        # Basit balık şekli
+        pygame.draw.ellipse(yuzey, renk, (x - boyut, y - boyut//2, boyut * 2, boyut))
+        pygame.draw.polygon(yuzey, renk,
+                            [(x - boyut, y), (int(x - boyut * 1.5), y - boyut//2),
+                             (int(x - boyut * 1.5), y + boyut//2)])
+
+
+class SpriteAtlasi:
+    """Birey sprite'larının önceden çizildiği tek yüzeylik atlas
+
+    Her (tür, renk, tamsayı boyut) için gövde, her renk/genişlik için enerji
+    çubuğu ve her boyut için hamilelik halkası bir kez çizilir. Çizimde her
+    öğe yalnızca atlastaki alanı ve merkeze göre kaydırmasıyla anılır.
+    Gövdeler `sekil_ciz(yuzey, tur, renk, x, y, boyut)` ile çizilir
+    (varsayılan balık şekilleri; böcekler için bkz. gelismis_bocek_simulasyonu).
+    """
+
+    def __init__(self, renkler: Dict[str, Tuple[int, int, int]], turler: Sequence = tuple(BalikTuru),
+                 en_kucuk_boyut: int = 3, en_buyuk_boyut: int = 20, atlas_genisligi: int = 1024,
+                 sekil_ciz: Callable = balik_sekli_ciz):
+        self.renk_listesi = list(renkler)
+        self.tur_listesi = list(turler)
+        self.en_kucuk_boyut = en_kucuk_boyut
+        self.en_buyuk_boyut = en_buyuk_boyut
+        boyut_sayisi = en_buyuk_boyut - en_kucuk_boyut + 1
+
+        parcalar = []
+        for tur in self.tur_listesi:
+            for renk in self.renk_listesi:
+                for boyut in range(en_kucuk_boyut, en_buyuk_boyut + 1):
+                    parcalar.append(self._parca(lambda s, x, y, t=tur, r=renkler[renk], b=boyut:
+                                                sekil_ciz(s, t, r, x, y, b), en_buyuk_boyut * 2 + 4))
+        for renk in ENERJI_RENKLERI:
+            for genislik in range(ENERJI_CUBUGU + 1):
+                yuzey = pygame.Surface((max(1, genislik), 4), pygame.SRCALPHA)
+                yuzey.fill(renk if genislik else (0, 0, 0, 0))
+                parcalar.append((yuzey, yuzey.get_rect(), 0, 0))
+        for boyut in range(en_kucuk_boyut, en_buyuk_boyut + 1):
+            parcalar.append(self._parca(lambda s, x, y, b=boyut:
+                                        pygame.draw.circle(s, HAMILE_RENGI, (x, y), b + 3, 2), boyut + 6))
+
+        self.yuzey, alanlar, kaydirmalar = self._yerlestir(parcalar, atlas_genisligi)
+        self.alanlar: List[pygame.Rect] = alanlar
+        self.kaydirma_x = np.array([k[0] for k in kaydirmalar], dtype=np.int64)
+        self.kaydirma_y = np.array([k[1] for k in kaydirmalar], dtype=np.int64)
+
+        self.govde_sayisi = len(self.tur_listesi) * len(self.renk_listesi) * boyut_sayisi
+        self.cubuk_basi = self.govde_sayisi
+        self.halka_basi = self.cubuk_basi + len(ENERJI_RENKLERI) * (ENERJI_CUBUGU + 1)
+        self._boyut_sayisi = boyut_sayisi
+
+    @staticmethod
+    def _parca(cizim, yaricap: int):
+        """Çizimi geçici yüzeye yap, dolu alanı kırp ve merkez kaydırmasını hesapla"""
+        yuzey = pygame.Surface((yaricap * 2, yaricap * 2), pygame.SRCALPHA)
+        cizim(yuzey, yaricap, yaricap)
+        sinir = yuzey.get_bounding_rect()
+        if sinir.width == 0 or sinir.height == 0:
+            sinir = pygame.Rect(yaricap, yaricap, 1, 1)
+        return yuzey, sinir, yaricap - sinir.x, yaricap - sinir.y
+
+    @staticmethod
+    def _yerlestir(parcalar, atlas_genisligi: int):
+        """Parçaları raf yöntemiyle tek yüzeye yerleştir"""
+        sira = sorted(range(len(parcalar)), key=lambda i: -parcalar[i][1].height)
+        konumlar = [None] * len(parcalar)
+        x = y = raf_yuksekligi = 0
+        for i in sira:
+            sinir = parcalar[i][1]
+            if x + sinir.width > atlas_genisligi:
+                x = 0
+                y += raf_yuksekligi + 1
+                raf_yuksekligi = 0
+            konumlar[i] = (x, y)
+            x += sinir.width + 1
+            raf_yuksekligi = max(raf_yuksekligi, sinir.height)
+
+        atlas = pygame.Surface((atlas_genisligi, y + raf_yuksekligi + 1))
+        atlas.fill(SAYDAM_RENK)
+        alanlar = []
+        kaydirmalar = []
+        for (yuzey, sinir, kx, ky), (ax, ay) in zip(parcalar, konumlar):
+            atlas.blit(yuzey, (ax, ay), sinir)
+            alanlar.append(pygame.Rect(ax, ay, sinir.width, sinir.height))
+            kaydirmalar.append((kx, ky))
+        atlas.set_colorkey(SAYDAM_RENK)
+        if pygame.display.get_surface() is not None:
+            atlas = atlas.convert()
+            atlas.set_colorkey(SAYDAM_RENK)
+        return atlas, alanlar, kaydirmalar
+
+    def govde_indeksi(self, tur_kodu, renk_kodu, boyut):
+        """Gövde sprite indeksi (dizi ya da tek değer kabul eder)"""
+        boyut = np.clip(boyut, self.en_kucuk_boyut, self.en_buyuk_boyut) - self.en_kucuk_boyut
+        return (tur_kodu * len(self.renk_listesi) + renk_kodu) * self._boyut_sayisi + boyut
+
+
+class BalikCizici:
+    """Popülasyonu sprite atlası üzerinden tek `Surface.blits` çağrısıyla çizer"""
+
+    def __init__(self, renkler: Dict[str, Tuple[int, int, int]], en_buyuk_boyut: int = 20,
+                 turler: Sequence = tuple(BalikTuru), sekil_ciz: Callable = balik_sekli_ciz):
+        self.atlas = SpriteAtlasi(renkler, turler, en_buyuk_boyut=en_buyuk_boyut, sekil_ciz=sekil_ciz)
+        self._tur_kodlari = {tur: i for i, tur in enumerate(self.atlas.tur_listesi)}
+        self._renk_kodlari = {renk: i for i, renk in enumerate(self.atlas.renk_listesi)}
+
+    @staticmethod
+    def _kod_cevirisi(dizi: BalikDizisi, ad: str, kodlar: Dict) -> np.ndarray:
+        """Dizi deposundaki kategori kodlarını atlas kodlarına çeviren tablo"""
+        ceviri = np.zeros(len(kodlar), dtype=np.int64)
+        for deger, kod in kodlar.items():
+            ceviri[dizi.kod(ad, deger)] = kod
+        return ceviri
+
+    def _sutunlar(self, baliklar, indeksler: np.ndarray = None):
+        """Çizim için gereken alanlar: canlı balıkların (ya da yalnızca `indeksler`in) sütunları"""
+        if isinstance(baliklar, BalikDizisi):
+            hayatta = baliklar.sutun('hayatta')
+            canli = np.flatnonzero(hayatta) if indeksler is None else indeksler[hayatta[indeksler]]
+            tur_ceviri = self._kod_cevirisi(baliklar, 'tur', self._tur_kodlari)
+            renk_ceviri = self._kod_cevirisi(baliklar, 'renk', self._renk_kodlari)
+            return (baliklar.sutun('x')[canli], baliklar.sutun('y')[canli], baliklar.sutun('boyut')[canli],
+                    tur_ceviri[baliklar.sutun('tur')[canli]], renk_ceviri[baliklar.sutun('renk')[canli]],
+                    baliklar.sutun('enerji')[canli], baliklar.sutun('max_enerji')[canli],
+                    baliklar.sutun('hamile')[canli])
+        if indeksler is not None:
+            baliklar = [baliklar[i] for i in indeksler.tolist()]
+        canlilar = [b for b in baliklar if b.hayatta]
+        n = len(canlilar)
+        return (np.fromiter((b.x for b in canlilar), np.float64, n),
+                np.fromiter((b.y for b in canlilar), np.float64, n),
+                np.fromiter((b.boyut for b in canlilar), np.float64, n),
+                np.fromiter((self._tur_kodlari[b.tur] for b in canlilar), np.int64, n),
+                np.fromiter((self._renk_kodlari[b.renk] for b in canlilar), np.int64, n),
+                np.fromiter((b.enerji for b in canlilar), np.float64, n),
+                np.fromiter((b.max_enerji for b in canlilar), np.float64, n),
+                np.fromiter((b.hamile for b in canlilar), bool, n))
+
+    def ciz(self, ekran: pygame.Surface, baliklar, kamera=None, indeksler: np.ndarray = None):
+        """Gövde, enerji çubuğu ve hamilelik halkalarını toplu çiz
+
+        `kamera` verilirse konumlar ve boyutlar ekrana dönüştürülür (sprite
+        boyutu atlas aralığına kırpılır); `indeksler` verilirse yalnızca o
+        balıklar çizilir.
+        """
+        x, y, boyut, tur, renk, enerji, max_enerji, hamile = self._sutunlar(baliklar, indeksler)
+        if len(x) == 0:
+            return
+        if kamera is not None:
+            x, y = kamera.dunyadan_ekrana(x, y)
+            boyut = boyut * kamera.olcek
+        atlas = self.atlas
+        xi = x.astype(np.int64)
+        yi = y.astype(np.int64)
+        tam_boyut = boyut.astype(np.int64)
+
+        # Gövdeler
+        indeks = atlas.govde_indeksi(tur, renk, tam_boyut)
+        # Enerji çubukları: renk eşiği ve 1 piksellik genişlik adımları
+        oran = enerji / max_enerji
+        cubuk_rengi = (oran >= 0.3).astype(np.int64) + (oran >= 0.6)
+        genislik = np.clip((ENERJI_CUBUGU * oran).astype(np.int64), 0, ENERJI_CUBUGU)
+        cubuk = atlas.cubuk_basi + cubuk_rengi * (ENERJI_CUBUGU + 1) + genislik
+        cubuk_var = genislik > 0
+        cubuk_x = (x - 10).astype(np.int64)[cubuk_var]
+        cubuk_y = (y - boyut - 12).astype(np.int64)[cubuk_var]
+        # Hamilelik halkaları
+        halka = atlas.halka_basi + np.clip(tam_boyut, atlas.en_kucuk_boyut, atlas.en_buyuk_boyut) - atlas.en_kucuk_boyut
+
+        hedef_x = np.concatenate((xi - atlas.kaydirma_x[indeks], cubuk_x,
+                                  xi[hamile] - atlas.kaydirma_x[halka[hamile]]))
+        hedef_y = np.concatenate((yi - atlas.kaydirma_y[indeks], cubuk_y,
+                                  yi[hamile] - atlas.kaydirma_y[halka[hamile]]))
+        indeksler = np.concatenate((indeks, cubuk[cubuk_var], halka[hamile]))
+
+        yuzey = atlas.yuzey
+        alanlar = atlas.alanlar
+        ekran.blits([(yuzey, hedef, alanlar[i])
+                     for hedef, i in zip(zip(hedef_x.tolist(), hedef_y.tolist()), indeksler.tolist())],
+                    doreturn=False)
+
+
+class YogunlukHaritasi:
+    """Kalabalık görünümler için renk başına yoğunluk haritası (ayrıntı düzeyi)
+
+    Görünen canlı balıklar ekranda `hucre` piksellik kaba bir ızgaraya
+    sayılır; tüm renkler tek bir `np.bincount` çağrısıyla sayılır. Hücre
+    rengi renklerin sayıya göre ağırlıklı ortalaması, saydamlığı
+    logaritmik yoğunluktur. Küçük yüzey tek ölçekleme ve tek blit ile çizilir.
+    """
+
+    def __init__(self, renkler: Dict[str, Tuple[int, int, int]], hucre: int = 8):
+        self.renk_listesi = list(renkler)
+        self._renk_kodlari = {renk: i for i, renk in enumerate(self.renk_listesi)}
+        self._rgb = np.array([renkler[renk] for renk in self.renk_listesi], dtype=np.float64)
+        self.hucre = hucre
+        self._yuzey: pygame.Surface = None
+
+    def _sutunlar(self, baliklar, indeksler: np.ndarray):
+        """Canlı balıkların x, y ve renk kodu (haritanın renk sırasıyla)"""
+        if isinstance(baliklar, BalikDizisi):
+            canli = indeksler[baliklar.sutun('hayatta')[indeksler]]
+            ceviri = BalikCizici._kod_cevirisi(baliklar, 'renk', self._renk_kodlari)
+            return baliklar.sutun('x')[canli], baliklar.sutun('y')[canli], ceviri[baliklar.sutun('renk')[canli]]
+        canlilar = [b for b in (baliklar[i] for i in indeksler.tolist()) if b.hayatta]
+        n = len(canlilar)
+        return (np.fromiter((b.x for b in canlilar), np.float64, n),
+                np.fromiter((b.y for b in canlilar), np.float64, n),
+                np.fromiter((self._renk_kodlari[b.renk] for b in canlilar), np.int64, n))
+
+    def ciz(self, ekran: pygame.Surface, baliklar, kamera, indeksler: np.ndarray):
+        x, y, renk = self._sutunlar(baliklar, indeksler)
+        if len(x) == 0:
+            return
+        h = self.hucre
+        genislik, yukseklik = ekran.get_size()
+        gx, gy = -(-genislik // h), -(-yukseklik // h)
+        sx, sy = kamera.dunyadan_ekrana(x, y)
+        cx = (sx // h).astype(np.int64)
+        cy = (sy // h).astype(np.int64)
+        icerde = (cx >= 0) & (cx < gx) & (cy >= 0) & (cy < gy)
+
+        # Tek histogram: (renk, hücre satırı, hücre sütunu) düz numarası
+        k = len(self.renk_listesi)
+        kod = (renk[icerde] * gy + cy[icerde]) * gx + cx[icerde]
+        sayim = np.bincount(kod, minlength=k * gy * gx).reshape(k, gy, gx)
+        toplam = sayim.sum(axis=0)
+        en_cok = toplam.max()
+        if en_cok == 0:
+            return
+        rgb = np.tensordot(sayim, self._rgb, axes=(0, 0)) / np.maximum(toplam, 1)[..., None]
+        alfa = np.where(toplam > 0, 60 + 195 * np.log1p(toplam) / np.log1p(en_cok), 0)
+
+        if self._yuzey is None or self._yuzey.get_size() != (gx, gy):
+            self._yuzey = pygame.Surface((gx, gy), pygame.SRCALPHA)
+        # surfarray dizileri (genişlik, yükseklik) sıralıdır
+        piksel = pygame.surfarray.pixels3d(self._yuzey)
+        piksel[...] = rgb.transpose(1, 0, 2)
+        del piksel
+        saydamlik = pygame.surfarray.pixels_alpha(self._yuzey)
+        saydamlik[...] = alfa.T
+        del saydamlik
+        ekran.blit(pygame.transform.scale(self._yuzey, (gx * h, gy * h)), (0, 0))
+
+
+class MetinOnbellegi:
+    """Satır bazında metin yüzeyi önbelleği
+
+    Her satır yuvası son çizilen metni ve rengi saklar; yalnızca değeri
+    değişen satırlar yeniden render edilir.
+    """
+
+    def __init__(self):
+        self._yuvalar: Dict = {}
+
+    def yuzey(self, yuva, font: pygame.font.Font, metin: str, renk: Tuple[int, int, int]) -> pygame.Surface:
+        onceki = self._yuvalar.get(yuva)
+        if onceki is not None and onceki[0] == metin and onceki[1] == renk and onceki[2] is font:
+            return onceki[3]
+        yuzey = font.render(metin, True, renk)
+        self._yuvalar[yuva] = (metin, renk, font, yuzey)
+        return yuzey
+
+    def temizle(self):
+        self._yuvalar.clear()
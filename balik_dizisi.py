@@ -0,0 +1,512 @@
+import math
+import numpy as np
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+# Sayısal sütunlar ve tipleri
+SAYISAL_ALANLAR = {
+    'x': np.float64,
+    'y': np.float64,
+    'yon_x': np.float64,  # Son adımın birim yönü (duran balıkta önceki yön)
+    'yon_y': np.float64,
+    'boyut': np.float64,
+    'hiz': np.float64,
+    'enerji': np.float64,
+    'yas': np.int64,
+    'max_enerji': np.float64,
+    'zeka': np.float64,
+    'guc': np.float64,
+    'dayaniklilik': np.float64,
+    'hamile': np.bool_,
+    'hamilelik_suresi': np.int32,
+    'hayatta': np.bool_,
+    'hastalık': np.bool_,
+    'mutasyon_sayisi': np.int32,
+    'nesil': np.int32,
+    'anne_id': np.int64,
+    'baba_id': np.int64,
+    'id': np.int64,
+}
+
+# Kodlanmış (kategorik) sütunlar: değerler listedeki sırasıyla saklanır
+KOD_ALANLARI = ('renk', 'tur', 'davranis', 'cinsiyet')
+
+# Python nesnesi olarak saklanan sütunlar
+NESNE_ALANLARI = ()
+
+TUM_ALANLAR = tuple(SAYISAL_ALANLAR) + KOD_ALANLARI + NESNE_ALANLARI
+
+# Sürü kuralı ağırlıkları: komşu merkezine yaklaşma, komşularla aynı yöne
+# dönme ve ayrılma mesafesinden yakın komşulardan uzaklaşma
+SURU_YAKINLASMA = 1.0
+SURU_HIZALANMA = 1.0
+SURU_AYRILMA = 1.5
+SURU_AYRILMA_MESAFESI = 20.0
+SURU_KOMSU_SAYISI = 4
+
+
+def su_hiz_carpani(su_ortami) -> float:
+    """Su sıcaklığına ve pH'a göre hareket hızı çarpanı"""
+    hiz_carpani = 1.0
+    if su_ortami.sicaklik < 15 or su_ortami.sicaklik > 35:
+        hiz_carpani = 0.4
+    elif 20 <= su_ortami.sicaklik <= 28:
+        hiz_carpani = 1.3
+    if su_ortami.ph < 6.0 or su_ortami.ph > 8.5:
+        hiz_carpani *= 0.7
+    return hiz_carpani
+
+
+@dataclass
+class HareketKurallari:
+    """Hareket çekirdeğinin türe bağlı sabitleri (varsayılanlar balık kurallarıdır)
+
+    İşçi süreçlere gönderildiği için `hiz_carpani` modül düzeyinde bir
+    fonksiyon olmalıdır (ortam -> çarpan).
+    """
+    hiz_carpani: Callable = su_hiz_carpani
+    sosyal_esik: float = 40.0        # Sosyal birey en yakın komşu bundan uzaksa ona yaklaşır
+    agresif_carpan: float = 1.4      # Rakip kovalarken hız çarpanı
+    hedef_adim: float = 0.9          # Hedefe yürürken adım çarpanı
+    rastgele_adim: float = 0.8       # Rastgele adım çarpanı
+    kenar: float = 15.0              # Dünya kenarından uzaklık
+    tuketim_taban: float = 0.04      # Enerji tüketimi: taban + boyut * k + hız * k
+    tuketim_boyut: float = 0.008
+    tuketim_hiz: float = 0.015
+    hamile_carpani: float = 1.4
+    hasta_carpani: float = 2.2
+    hamilelik_suresi: int = 180      # Bu kadar tick sonra doğum
+    omur_taban: float = 900.0        # En büyük yaş: taban + dayanıklılık * k
+    omur_dayaniklilik: float = 120.0
+
+
+BALIK_HAREKETI = HareketKurallari()
+
+
+def suru_yonu(izgara, x: np.ndarray, y: np.ndarray, haric: np.ndarray,
+              yaricap: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Sorgu balıkları için sürü kuralının (yaklaşma, hizalanma, ayrılma) bileşke yönü
+
+    Komşuluk özetleri tek bir toplu ızgara sorgusundan gelir. (yon_x, yon_y,
+    gecerli) döndürür; `gecerli`, yarıçap içinde komşusu olan ve bileşkesi
+    sıfır olmayan balıklardır.
+    """
+    ozet = izgara.komsu_ozetleri(x, y, yaricap, SURU_KOMSU_SAYISI, haric)
+    vx = (ozet['merkez_x'] - x) / yaricap * SURU_YAKINLASMA
+    vy = (ozet['merkez_y'] - y) / yaricap * SURU_YAKINLASMA
+    if 'yon_x' in ozet:
+        vx += ozet['yon_x'] * SURU_HIZALANMA
+        vy += ozet['yon_y'] * SURU_HIZALANMA
+
+    # Ayrılma: en yakın komşulardan, yaklaştıkça güçlenerek uzaklaş
+    komsular = ozet['en_yakinlar']
+    mesafe = ozet['en_yakin_mesafeler']
+    with np.errstate(invalid='ignore', divide='ignore'):
+        guc = np.where((mesafe < SURU_AYRILMA_MESAFESI) & (mesafe > 0),
+                       (1 - mesafe / SURU_AYRILMA_MESAFESI) / mesafe, 0.0)
+    komsular = np.maximum(komsular, 0)
+    vx += SURU_AYRILMA * ((x[:, None] - izgara.xs[komsular]) * guc).sum(axis=1)
+    vy += SURU_AYRILMA * ((y[:, None] - izgara.ys[komsular]) * guc).sum(axis=1)
+    return vx, vy, (ozet['sayi'] > 0) & ((vx != 0) | (vy != 0))
+
+
+def hareket_cekirdegi(s: Dict[str, np.ndarray], satirlar: np.ndarray, genislik: int, yukseklik: int,
+                      hiz_carpani: float, izgara=None, rakip_mesafesi: float = 80.0, rng=None,
+                      sosyal_kodu: int = -1, agresif_kodu: int = -1, suru_yaricapi: float = 0.0,
+                      kurallar: HareketKurallari = BALIK_HAREKETI):
+    """`satirlar` indeksli canlı balıkları bir tick ilerlet
+
+    `s` sütun adından sütun dizisine sözlüktür; yalnızca `satirlar`
+    satırları okunup yazılır. Hedef konumları ızgaranın kendi koordinat
+    kopyasından okunur: ızgara tick başındaki konumlarla kurulduysa başka
+    satırların aynı anda güncellenmesi (paralel bölgeler) sonucu etkilemez.
+    `suru_yaricapi` > 0 ise sosyal balıklar bu yarıçaptaki komşularıyla
+    sürü kuralına uyar; komşusu olmayanlar en yakın balığa yaklaşır.
+    Türe bağlı sabitler `kurallar`dan okunur.
+    """
+    m = len(satirlar)
+    if m == 0:
+        return
+    x = s['x'][satirlar]
+    y = s['y'][satirlar]
+    hiz = s['hiz'][satirlar]
+
+    # Davranışa göre hedefler (sosyal: en yakın balık, agresif: rakip);
+    # ızgarada yalnızca tick başında canlı olan balıklar bulunur
+    hedef_x = np.zeros(m)
+    hedef_y = np.zeros(m)
+    hedefli = np.zeros(m, dtype=bool)
+    carpan = np.full(m, hiz_carpani)
+    if izgara is not None:
+        davranis = s['davranis'][satirlar]
+        sosyal = np.flatnonzero(davranis == sosyal_kodu)
+        if suru_yaricapi > 0 and len(sosyal):
+            vx, vy, suruda = suru_yonu(izgara, x[sosyal], y[sosyal], satirlar[sosyal], suru_yaricapi)
+            hedef_x[sosyal] = x[sosyal] + vx
+            hedef_y[sosyal] = y[sosyal] + vy
+            hedefli[sosyal] = suruda
+            sosyal = sosyal[~suruda]
+        # En yakın balık ve en küçük indeksli rakip tüm balıklar için toplu sorgulanır
+        if len(sosyal):
+            j, mesafe = izgara.toplu_en_yakin(x[sosyal], y[sosyal], satirlar[sosyal])
+            yaklas = (j >= 0) & (mesafe > kurallar.sosyal_esik)
+            k, j = sosyal[yaklas], j[yaklas]
+            hedef_x[k] = izgara.xs[j]
+            hedef_y[k] = izgara.ys[j]
+            hedefli[k] = True
+        agresif = np.flatnonzero(davranis == agresif_kodu)
+        if len(agresif):
+            j = izgara.toplu_ilk(x[agresif], y[agresif], rakip_mesafesi, satirlar[agresif],
+                                 s['renk'][satirlar[agresif]])
+            k, j = agresif[j >= 0], j[j >= 0]
+            hedef_x[k] = izgara.xs[j]
+            hedef_y[k] = izgara.ys[j]
+            hedefli[k] = True
+            carpan[k] = hiz_carpani * kurallar.agresif_carpan
+
+    hareket_hizi = hiz * carpan
+    dx = hedef_x - x
+    dy = hedef_y - y
+    mesafe = np.hypot(dx, dy)
+    yonlu = hedefli & (mesafe > 0)
+    rastgele = ~hedefli
+    with np.errstate(invalid='ignore', divide='ignore'):
+        adim_x = np.where(yonlu, dx / mesafe * hareket_hizi * kurallar.hedef_adim, 0.0)
+        adim_y = np.where(yonlu, dy / mesafe * hareket_hizi * kurallar.hedef_adim, 0.0)
+    sayi = int(rastgele.sum())
+    if sayi:
+        h = hareket_hizi[rastgele]
+        rng = rng if rng is not None else np.random
+        adim_x[rastgele] = rng.uniform(-h, h) * kurallar.rastgele_adim
+        adim_y[rastgele] = rng.uniform(-h, h) * kurallar.rastgele_adim
+
+    kenar = kurallar.kenar
+    yeni_x = np.clip(x + adim_x, kenar, genislik - kenar)
+    yeni_y = np.clip(y + adim_y, kenar, yukseklik - kenar)
+    s['x'][satirlar] = yeni_x
+    s['y'][satirlar] = yeni_y
+
+    # Yön: bu tickteki gerçek yer değiştirme (duvara dayanıp duranlar eski yönü korur)
+    yer_x = yeni_x - x
+    yer_y = yeni_y - y
+    uzunluk = np.hypot(yer_x, yer_y)
+    hareketli = uzunluk > 0
+    s['yon_x'][satirlar[hareketli]] = yer_x[hareketli] / uzunluk[hareketli]
+    s['yon_y'][satirlar[hareketli]] = yer_y[hareketli] / uzunluk[hareketli]
+
+    # Enerji tüketimi
+    hamile = s['hamile'][satirlar]
+    tuketim = kurallar.tuketim_taban + s['boyut'][satirlar] * kurallar.tuketim_boyut + hiz * kurallar.tuketim_hiz
+    tuketim = np.where(hamile, tuketim * kurallar.hamile_carpani, tuketim)
+    tuketim = np.where(s['hastalık'][satirlar], tuketim * kurallar.hasta_carpani, tuketim)
+    enerji = s['enerji'][satirlar] - tuketim
+    yas = s['yas'][satirlar] + 1
+    s['enerji'][satirlar] = enerji
+    s['yas'][satirlar] = yas
+
+    # Hamilelik kontrolü
+    sure = s['hamilelik_suresi'][satirlar]
+    sure[hamile] += 1
+    dogum = hamile & (sure >= kurallar.hamilelik_suresi)
+    sure[dogum] = 0
+    s['hamile'][satirlar] = hamile & ~dogum
+    s['hamilelik_suresi'][satirlar] = sure
+
+    # Yaşlanma ve ölüm kontrolü
+    max_yas = kurallar.omur_taban + s['dayaniklilik'][satirlar] * kurallar.omur_dayaniklilik
+    s['hayatta'][satirlar] = ~((enerji <= 0) | (yas > max_yas))
+
+
+def _sayisal_ozellik(ad: str, donustur):
+    def oku(self):
+        if self._dizi is None:
+            return self._kopya[ad]
+        return donustur(self._dizi._sutunlar[ad][self._i])
+
+    def yaz(self, deger):
+        if self._dizi is None:
+            self._kopya[ad] = deger
+        else:
+            self._dizi._sutunlar[ad][self._i] = deger
+
+    return property(oku, yaz)
+
+
+def _kod_ozelligi(ad: str):
+    def oku(self):
+        if self._dizi is None:
+            return self._kopya[ad]
+        return self._dizi._degerler[ad][self._dizi._sutunlar[ad][self._i]]
+
+    def yaz(self, deger):
+        if self._dizi is None:
+            self._kopya[ad] = deger
+        else:
+            self._dizi._sutunlar[ad][self._i] = self._dizi._kodlar[ad][deger]
+
+    return property(oku, yaz)
+
+
+def _nesne_ozelligi(ad: str):
+    def oku(self):
+        if self._dizi is None:
+            return self._kopya[ad]
+        return self._dizi._sutunlar[ad][self._i]
+
+    def yaz(self, deger):
+        if self._dizi is None:
+            self._kopya[ad] = deger
+        else:
+            self._dizi._sutunlar[ad][self._i] = deger
+
+    return property(oku, yaz)
+
+
+class BalikGorunumu:
+    """BalikDizisi içindeki tek bir satıra Balik benzeri erişim
+
+    Çizim, üreme gibi tek tek kayıt isteyen kodlar için vardır; değerler
+    doğrudan dizideki sütunlardan okunur ve sütunlara yazılır.
+    """
+    __slots__ = ('_dizi', '_i', '_kopya')
+
+    def __init__(self, dizi: 'BalikDizisi', i: int):
+        self._dizi = dizi
+        self._i = i
+        self._kopya = None
+
+    def _ayir(self):
+        """Satır diziden çıkarılırken son değerleri görünümde sakla"""
+        self._kopya = self.kayit()
+        self._dizi = None
+        self._i = -1
+
+    def kayit(self) -> Dict:
+        """Satırı sözlük olarak döndür"""
+        return {ad: getattr(self, ad) for ad in TUM_ALANLAR}
+
+    def _mesafe_hesapla(self, diger_balik) -> float:
+        """İki balık arasındaki mesafe"""
+        dx = self.x - diger_balik.x
+        dy = self.y - diger_balik.y
+        return math.sqrt(dx*dx + dy*dy)
+
+    def yiyecek_ye(self, yiyecek_miktari: float) -> float:
+        """Yiyecek tüketimi"""
+        if not self.hayatta:
+            return 0
+
+        ihtiyac = min(self.max_enerji - self.enerji, yiyecek_miktari * 0.12)
+        self.enerji = min(self.max_enerji, self.enerji + ihtiyac)
+        return ihtiyac
+
+    def __repr__(self):
+        return f"BalikGorunumu(id={self.id!r}, x={self.x:.1f}, y={self.y:.1f}, hayatta={self.hayatta})"
+
+
+for _ad, _tip in SAYISAL_ALANLAR.items():
+    if _tip is np.bool_:
+        _donustur = bool
+    elif np.issubdtype(_tip, np.integer):
+        _donustur = int
+    else:
+        _donustur = float
+    setattr(BalikGorunumu, _ad, _sayisal_ozellik(_ad, _donustur))
+for _ad in KOD_ALANLARI:
+    setattr(BalikGorunumu, _ad, _kod_ozelligi(_ad))
+for _ad in NESNE_ALANLARI:
+    setattr(BalikGorunumu, _ad, _nesne_ozelligi(_ad))
+
+
+class BalikDizisi:
+    """Balık popülasyonu için sütun tabanlı (structure-of-arrays) depo
+
+    Liste gibi kullanılabilir (len, döngü, indeks, append, extend, clear);
+    döngü ve indeks BalikGorunumu döndürür. Hareket, enerji, yaşlanma ve
+    ölüm kontrolleri `hareket_et` ile tüm popülasyona tek seferde uygulanır.
+    Ortak ajan motoru (ajan_motoru.AjanMotoru) böcekleri de bu depoda tutar.
+    `ayirici` verilirse sayısal ve kategorik sütunlar `ayirici(kapasite)`
+    çağrısının döndürdüğü (sıfırlanmış) dizilerde tutulur; örneğin paylaşımlı
+    bellek için (bkz. paralel_akvaryum.PaylasimliSutunlar).
+    """
+
+    def __init__(self, renk_listesi: Sequence[str], tur_listesi: Sequence, davranis_listesi: Sequence,
+                 kapasite: int = 256, ayirici: Callable[[int], Dict[str, np.ndarray]] = None):
+        self._degerler = {
+            'renk': list(renk_listesi),
+            'tur': list(tur_listesi),
+            'davranis': list(davranis_listesi),
+            'cinsiyet': ["erkek", "disi"],
+        }
+        self._kodlar = {ad: {deger: i for i, deger in enumerate(degerler)}
+                        for ad, degerler in self._degerler.items()}
+        self.n = 0
+        self._kapasite = 0
+        self._ayirici = ayirici
+        self._sutunlar: Dict[str, np.ndarray] = {}
+        self._gorunumler: List[BalikGorunumu] = []
+        self._kapasiteyi_ayarla(max(1, kapasite))
+
+    # --- Liste arayüzü -------------------------------------------------
+
+    def __len__(self) -> int:
+        return self.n
+
+    def __iter__(self):
+        return iter(self._gorunumler[:self.n])
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return self._gorunumler[:self.n][i]
+        if i < 0:
+            i += self.n
+        if not 0 <= i < self.n:
+            raise IndexError("BalikDizisi indeksi aralık dışında")
+        return self._gorunumler[i]
+
+    def append(self, balik):
+        """Balik (veya aynı niteliklere sahip bir nesne) ekle"""
+        if self.n == self._kapasite:
+            self._kapasiteyi_ayarla(self._kapasite * 2)
+        i = self.n
+        for ad in SAYISAL_ALANLAR:
+            self._sutunlar[ad][i] = getattr(balik, ad)
+        for ad in KOD_ALANLARI:
+            self._sutunlar[ad][i] = self._kodlar[ad][getattr(balik, ad)]
+        for ad in NESNE_ALANLARI:
+            self._sutunlar[ad][i] = getattr(balik, ad)
+        self.n += 1
+
+    def extend(self, baliklar: Iterable):
+        for balik in baliklar:
+            self.append(balik)
+
+    def toplu_ekle(self, sutunlar: Dict[str, np.ndarray]) -> range:
+        """Sütun sözlüğünden birden çok satırı tek seferde ekle
+
+        Kategorik alanlar kod olarak verilir; verilmeyen alanlar 0/False/None
+        olur. Eklenen satırların indeks aralığını döndürür.
+        """
+        m = len(next(iter(sutunlar.values())))
+        bas, son = self.n, self.n + m
+        if son > self._kapasite:
+            self._kapasiteyi_ayarla(1 << (son - 1).bit_length())
+        for ad, dizi in self._sutunlar.items():
+            dizi[bas:son] = sutunlar[ad] if ad in sutunlar else (None if dizi.dtype == object else 0)
+        self.n = son
+        return range(bas, son)
+
+    def clear(self):
+        for gorunum in self._gorunumler[:self.n]:
+            gorunum._ayir()
+        self._gorunumler[:self.n] = [BalikGorunumu(self, i) for i in range(self.n)]
+        self.n = 0
+
+    # --- Ölü satırların temizlenmesi ------------------------------------
+
+    def sikistir(self, sirayi_koru: bool = False) -> int:
+        """Ölü satırları topluca çıkar, çıkarılan satır sayısını döndür
+
+        Varsayılan takas kipinde sondaki canlı satırlar öndeki boşluklara
+        taşınır (yalnızca ölü sayısı kadar kopya). `sirayi_koru` ile canlılar
+        eski sıralarıyla öne alınır. Canlı sayısı kapasitenin dörtte birinin
+        altına düşerse diziler küçültülür; bellek canlı popülasyonla orantılı kalır.
+        """
+        n = self.n
+        canli = self._sutunlar['hayatta'][:n]
+        k = int(np.count_nonzero(canli))
+        if k == n:
+            return 0
+
+        gor = self._gorunumler
+        olu = np.flatnonzero(~canli)
+        for i in olu:
+            gor[i]._ayir()
+
+        if sirayi_koru:
+            kalan = np.flatnonzero(canli)
+            for dizi in self._sutunlar.values():
+                dizi[:k] = dizi[kalan]
+            gor[:k] = [gor[i] for i in kalan]
+            for i in range(k):
+                gor[i]._i = i
+        else:
+            delikler = olu[olu < k]
+            kaynaklar = np.flatnonzero(canli[k:]) + k
+            for dizi in self._sutunlar.values():
+                dizi[delikler] = dizi[kaynaklar]
+            for hedef, kaynak in zip(delikler.tolist(), kaynaklar.tolist()):
+                gor[hedef] = gor[kaynak]
+                gor[hedef]._i = hedef
+
+        for i in range(k, n):
+            gor[i] = BalikGorunumu(self, i)
+        for ad in NESNE_ALANLARI:
+            self._sutunlar[ad][k:n] = None
+        self.n = k
+
+        if self._kapasite > 256 and k < self._kapasite // 4:
+            self._kapasiteyi_ayarla(max(256, 1 << (2 * k - 1).bit_length()))
+        return n - k
+
+    # --- Sütun erişimi ---------------------------------------------------
+
+    def sutun(self, ad: str) -> np.ndarray:
+        """Kullanılan satırlar için sütun görünümü (kopya değil)"""
+        return self._sutunlar[ad][:self.n]
+
+    def kod(self, ad: str, deger) -> int:
+        """Kategorik bir değerin sütundaki kodu"""
+        return self._kodlar[ad][deger]
+
+    def degerler(self, ad: str) -> list:
+        """Kategorik alanın değerleri, kod sırasıyla"""
+        return self._degerler[ad]
+
+    def _kapasiteyi_ayarla(self, yeni_kapasite: int):
+        if self._ayirici is not None:
+            yeni = self._ayirici(yeni_kapasite)
+        else:
+            yeni = {}
+            for ad, tip in SAYISAL_ALANLAR.items():
+                yeni[ad] = np.zeros(yeni_kapasite, dtype=tip)
+            for ad in KOD_ALANLARI:
+                yeni[ad] = np.zeros(yeni_kapasite, dtype=np.int8)
+        for ad in NESNE_ALANLARI:
+            yeni[ad] = np.empty(yeni_kapasite, dtype=object)
+        if self._sutunlar:
+            for ad, dizi in self._sutunlar.items():
+                yeni[ad][:self.n] = dizi[:self.n]
+        self._sutunlar = yeni
+        for i in range(len(self._gorunumler), yeni_kapasite):
+            self._gorunumler.append(BalikGorunumu(self, i))
+        del self._gorunumler[yeni_kapasite:]
+        self._kapasite = yeni_kapasite
+
+    # --- Vektörel hareket ------------------------------------------------
+
+    def hareket_et(self, genislik: int, yukseklik: int, su_ortami, izgara=None,
+                   rakip_mesafesi: float = 80.0, rng=None, suru_yaricapi: float = 0.0,
+                   kurallar: HareketKurallari = BALIK_HAREKETI):
+        """Balik.hareket_et kurallarını tüm popülasyona aynı anda uygula
+
+        Rastgele adımlar `rng` (numpy Generator) üretecinden çekilir.
+        """
+        n = self.n
+        if n == 0:
+            return
+        s = {ad: dizi[:n] for ad, dizi in self._sutunlar.items()}
+        sosyal_kodu, agresif_kodu = self.davranis_kodlari()
+        hareket_cekirdegi(s, np.flatnonzero(s['hayatta']), genislik, yukseklik, kurallar.hiz_carpani(su_ortami),
+                          izgara, rakip_mesafesi, rng, sosyal_kodu, agresif_kodu, suru_yaricapi, kurallar)
+
+    def davranis_kodlari(self) -> Tuple[int, int]:
+        """Hareket çekirdeğinin kullandığı (sosyal, agresif) davranış kodları"""
+        return self._kod_bul('davranis', 'sosyal'), self._kod_bul('davranis', 'agresif')
+
+    def _kod_bul(self, ad: str, deger_adi: str) -> int:
+        """Enum değerinin (ör. 'sosyal') koduna bak; yoksa -1"""
+        for deger, kod in self._kodlar[ad].items():
+            if getattr(deger, 'value', deger) == deger_adi:
+                return kod
+        return -1
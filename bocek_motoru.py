@@ -0,0 +1,217 @@
+import random
+from dataclasses import dataclass
+from enum import Enum
+from balik_dizisi import HareketKurallari
+from ajan_motoru import (
+    Ajan, AjanMotoru,
+    TurTanimi, SecilimKurallari, UremeKurallari, YemKurallari, AvciKurallari
+)
+
+# Sorgu yarıçapları (uzamsal ızgaranın hücre boyutu bunlardan en büyüğüne göre seçilir)
+RAKIP_MESAFESI = 100.0
+AVCI_MENZILI = 80.0
+YEM_MENZILI = 30.0
+
+class BocekTuru(Enum):
+    """Böcek türleri"""
+    KELEBEK = "kelebek"
+    KARINCA = "karinca"
+    ARICIK = "aricik"
+    BOCEK = "bocek"
+
+# Doğal seçilimde renk ve türe göre hayatta kalma avantajları
+RENK_AVANTAJLARI = {
+    'kirmizi': 0.8,
+    'mavi': 0.6,
+    'yesil': 0.7,
+    'sari': 0.4,
+    'mor': 0.3,
+    'turuncu': 0.5,
+    'pembe': 0.2,
+    'kahverengi': 0.9  # Kamuflaj avantajı
+}
+
+TUR_AVANTAJLARI = {
+    BocekTuru.KELEBEK: 0.6,
+    BocekTuru.KARINCA: 0.8,  # Sosyal avantaj
+    BocekTuru.ARICIK: 0.7,
+    BocekTuru.BOCEK: 0.5
+}
+
+@dataclass
+class Cevre:
+    """Çevre koşulları"""
+    sicaklik: float = 25.0  # Celsius
+    nem: float = 50.0       # %
+    yiyecek_miktari: float = 100.0
+    avcı_sayisi: int = 0
+    mevsim: str = "ilkbahar"
+
+@dataclass
+class Bocek(Ajan):
+    """Gelişmiş böcek sınıfı (hareket ve ölüm kuralları ajan_motoru.Ajan'da)"""
+
+    def yiyecek_ye(self, yiyecek_miktari: float) -> float:
+        """Yiyecek tüketimi"""
+        if not self.hayatta:
+            return 0
+
+        ihtiyac = min(self.max_enerji - self.enerji, yiyecek_miktari * 0.1)
+        self.enerji = min(self.max_enerji, self.enerji + ihtiyac)
+        return ihtiyac
+
+def cevre_hiz_carpani(cevre: Cevre) -> float:
+    """Sıcaklığa göre hareket hızı çarpanı"""
+    if cevre.sicaklik < 10 or cevre.sicaklik > 40:
+        return 0.5  # Aşırı sıcaklıkta yavaşla
+    if 20 <= cevre.sicaklik <= 30:
+        return 1.2  # İdeal sıcaklıkta hızlan
+    return 1.0
+
+def cevre_guncelle(cevre: Cevre, zaman: int, r: random.Random):
+    """Çevre koşullarını güncelle"""
+    # Mevsimsel değişiklikler
+    mevsim_dongusu = (zaman // 1000) % 4
+    mevsimler = ["ilkbahar", "yaz", "sonbahar", "kis"]
+    cevre.mevsim = mevsimler[mevsim_dongusu]
+
+    # Sıcaklık değişimi
+    if cevre.mevsim == "yaz":
+        cevre.sicaklik = 25 + r.uniform(-5, 10)
+    elif cevre.mevsim == "kis":
+        cevre.sicaklik = 15 + r.uniform(-10, 5)
+    else:
+        cevre.sicaklik = 20 + r.uniform(-5, 5)
+
+    # Nem değişimi
+    cevre.nem = 50 + r.uniform(-20, 20)
+
+    # Yiyecek miktarı mevsimsel
+    if cevre.mevsim == "ilkbahar":
+        cevre.yiyecek_miktari = min(150, cevre.yiyecek_miktari + 1)
+    elif cevre.mevsim == "kis":
+        cevre.yiyecek_miktari = max(20, cevre.yiyecek_miktari - 0.5)
+
+def cevre_cezasi(cevre: Cevre) -> float:
+    """Bu tickin çevre koşullarından gelen, tüm böcekler için ortak ölüm riski"""
+    etki = 0.0
+
+    # Sıcaklık etkisi
+    if cevre.sicaklik < 5 or cevre.sicaklik > 45:
+        etki += 0.005
+
+    # Yiyecek kıtlığı
+    if cevre.yiyecek_miktari < 30:
+        etki += 0.003
+
+    return etki
+
+BOCEK_HAREKETI = HareketKurallari(
+    hiz_carpani=cevre_hiz_carpani,
+    sosyal_esik=50.0,
+    agresif_carpan=1.5,
+    hedef_adim=1.0,
+    rastgele_adim=1.0,
+    kenar=10.0,
+    tuketim_taban=0.05,
+    tuketim_boyut=0.01,
+    tuketim_hiz=0.02,
+    hamile_carpani=1.5,
+    hasta_carpani=2.0,
+    hamilelik_suresi=200,
+    omur_taban=800.0,
+    omur_dayaniklilik=100.0,
+)
+
+BOCEK_TANIMI = TurTanimi(
+    ad="bocek",
+    ajan_adi="Böcek",
+    ajan_oneki="bocek",
+    ajan_sinifi=Bocek,
+    renkler={
+        'kirmizi': (255, 0, 0),
+        'mavi': (0, 0, 255),
+        'yesil': (0, 255, 0),
+        'sari': (255, 255, 0),
+        'mor': (128, 0, 128),
+        'turuncu': (255, 165, 0),
+        'pembe': (255, 192, 203),
+        'kahverengi': (139, 69, 19)
+    },
+    turler=BocekTuru,
+    ortam_sinifi=Cevre,
+    ortam_guncelle=cevre_guncelle,
+    ortam_fazi="cevre",
+    ortam_oneki="cevre",
+    ortam_alanlari={'sicaklik': 'sicaklik', 'nem': 'nem', 'yiyecek': 'yiyecek_miktari'},
+    hareket=BOCEK_HAREKETI,
+    rakip_mesafesi=RAKIP_MESAFESI,
+    secilim=SecilimKurallari(
+        renk_avantajlari=RENK_AVANTAJLARI,
+        tur_avantajlari=TUR_AVANTAJLARI,
+        ortam_cezasi=cevre_cezasi,
+        hastalik_olasiligi=0.002,    # %0.2
+        taban_risk=0.008,
+        renk_katsayisi=0.002,
+        tur_katsayisi=0.001,
+        dayaniklilik_katsayisi=0.002,
+        hastalik_riski=0.01,
+        yaslilik_esigi=500,
+        yaslilik_katsayisi=0.00001,
+    ),
+    ureme=UremeKurallari(
+        aralik=150,
+        en_az_populasyon=10,
+        enerji_esigi=40,
+        yas_esigi=80,
+        en_fazla_cift=30,
+        ayni_tur_uyumu=0.8,          # Aynı tür %80, farklı tür %30
+        farkli_tur_uyumu=0.3,
+        erkek_enerji_kaybi=15,
+        disi_enerji_kaybi=20,
+        yavru_sayisi=(1, 4),
+        mutasyon={'renk': 0.08, 'tur': 0.05, 'davranis': 0.06},
+        konum_sapmasi=20,
+        yavru_enerjisi=(70, 100),
+        sapmalar={'boyut': 1, 'hiz': 0.3, 'max_enerji': 10, 'zeka': 0.1, 'guc': 0.1, 'dayaniklilik': 0.1},
+        sinirlar={'boyut': (2, 15), 'hiz': (0.5, 4), 'zeka': (0.1, 1.0), 'guc': (0.1, 1.0),
+                  'dayaniklilik': (0.1, 1.0)},
+    ),
+    yem=YemKurallari(menzil=YEM_MENZILI, talep_carpani=2, kazanc=0.5, yenilenme_hizi=0.5,
+                     kenar=0, miktar=(50, 150)),
+    avci=AvciKurallari(hiz=2.0, menzil=AVCI_MENZILI, tokluk=100.0, yakalama_yaricapi=15.0,
+                       yakalama_toklugu=50.0, tokluk_tuketimi=0.5,
+                       dogma_olasiligi=0.001, en_fazla=8, kenar=0),  # %0.1 şans
+    baslangic_sayilari=(200, 15, 3),
+    baslangic_kenari=50,
+    baslangic_araliklari={
+        'boyut': (4, 12), 'hiz': (0.8, 2.5), 'enerji': (60, 100), 'max_enerji': (80, 120),
+        'yas': (0, 100), 'zeka': (0.1, 1.0), 'guc': (0.1, 1.0), 'dayaniklilik': (0.1, 1.0),
+    },
+    acil_esigi=20,
+    acil_sayisi=50,
+    acil_sapmalari={'boyut': 1, 'hiz': 0.2, 'zeka': 0.1, 'guc': 0.1, 'dayaniklilik': 0.1},
+)
+
+class BocekMotoru(AjanMotoru):
+    """Pygame'den bağımsız böcek ekosistemi motoru
+
+    Ortak ajan motorunun (ajan_motoru.AjanMotoru) böcek türüyle kurulmuş
+    halidir; pencere gelismis_bocek_simulasyonu.GelismisSimulasyon'dadır.
+    Böcek kuralları (8 renk, 4 tür, sıcaklık/nem/mevsim çevresi, avcılar)
+    BOCEK_TANIMI'ndadır.
+    """
+
+    TANIM = BOCEK_TANIMI
+
+    @property
+    def bocekler(self):
+        return self.ajanlar
+
+    @property
+    def cevre(self) -> Cevre:
+        return self.ortam
+
+    @cevre.setter
+    def cevre(self, deger: Cevre):
+        self.ortam = deger
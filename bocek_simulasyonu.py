@@ -6,6 +6,7 @@ import sys
 from dataclasses import dataclass
 from typing import List, Tuple
 import time
+from rastgele import RastgeleServisi
 
 @dataclass
 class Bocek:
@@ -19,11 +20,11 @@ class Bocek:
     yas: int
     hayatta: bool = True
     
-    def hareket_et(self, genislik: int, yukseklik: int):
+    def hareket_et(self, genislik: int, yukseklik: int, rng=random):
         """Böceğin rastgele hareketi"""
         if self.hayatta:
-            self.x += random.uniform(-self.hiz, self.hiz)
-            self.y += random.uniform(-self.hiz, self.hiz)
+            self.x += rng.uniform(-self.hiz, self.hiz)
+            self.y += rng.uniform(-self.hiz, self.hiz)
             
             # Sınırları kontrol et
             self.x = max(0, min(genislik, self.x))
@@ -40,12 +41,13 @@ class Bocek:
 class BocekSimulasyonu:
     """Ana simülasyon sınıfı"""
     
-    def __init__(self, genislik=800, yukseklik=600):
+    def __init__(self, genislik=800, yukseklik=600, rastgele: RastgeleServisi = None):
         self.genislik = genislik
         self.yukseklik = yukseklik
         self.bocekler: List[Bocek] = []
         self.nesil = 0
         self.zaman = 0
+        self.rastgele = rastgele or RastgeleServisi()
         
         # Renk tanımları
         self.renkler = {
@@ -68,23 +70,26 @@ class BocekSimulasyonu:
         
     def baslangic_populasyonu_olustur(self, sayi=100):
         """Başlangıç böcek popülasyonunu oluştur"""
+        r = self.rastgele.baslangic
         self.bocekler.clear()
         renk_listesi = list(self.renkler.keys())
         
         for _ in range(sayi):
             bocek = Bocek(
-                x=random.uniform(0, self.genislik),
-                y=random.uniform(0, self.yukseklik),
-                renk=random.choice(renk_listesi),
-                boyut=random.uniform(3, 8),
-                hiz=random.uniform(1, 3),
-                enerji=random.uniform(50, 100),
+                x=r.uniform(0, self.genislik),
+                y=r.uniform(0, self.yukseklik),
+                renk=r.choice(renk_listesi),
+                boyut=r.uniform(3, 8),
+                hiz=r.uniform(1, 3),
+                enerji=r.uniform(50, 100),
                 yas=0
             )
             self.bocekler.append(bocek)
     
     def dogal_secilim_uygula(self):
         """Doğal seçilim kurallarını uygula"""
+        r = self.rastgele.secilim
+
         # Kırmızı böcekler daha avantajlı (daha yüksek hayatta kalma şansı)
         # Mavi böcekler orta seviye
         # Diğer renkler daha dezavantajlı
@@ -101,11 +106,12 @@ class BocekSimulasyonu:
                 else:
                     olum_sansi = 0.04
                 
-                if random.random() < olum_sansi:
+                if r.random() < olum_sansi:
                     bocek.hayatta = False
     
     def ureme_gerceklestir(self):
         """Böceklerin üremesini simüle et"""
+        r = self.rastgele.ureme
         hayatta_bocekler = [b for b in self.bocekler if b.hayatta]
         
         if len(hayatta_bocekler) < 2:
@@ -117,23 +123,23 @@ class BocekSimulasyonu:
         yeni_bocekler = []
         for _ in range(min(len(ureme_adaylari) // 2, 20)):  # Maksimum 20 yeni böcek
             if len(ureme_adaylari) >= 2:
-                ebeveyn1 = random.choice(ureme_adaylari)
-                ebeveyn2 = random.choice(ureme_adaylari)
+                ebeveyn1 = r.choice(ureme_adaylari)
+                ebeveyn2 = r.choice(ureme_adaylari)
                 
                 # Yavru böcek özellikleri (genetik karışım)
-                yavru_renk = random.choice([ebeveyn1.renk, ebeveyn2.renk])
+                yavru_renk = r.choice([ebeveyn1.renk, ebeveyn2.renk])
                 
                 # Mutasyon şansı (%5)
-                if random.random() < 0.05:
-                    yavru_renk = random.choice(list(self.renkler.keys()))
+                if r.random() < 0.05:
+                    yavru_renk = r.choice(list(self.renkler.keys()))
                 
                 yavru = Bocek(
-                    x=random.uniform(0, self.genislik),
-                    y=random.uniform(0, self.yukseklik),
+                    x=r.uniform(0, self.genislik),
+                    y=r.uniform(0, self.yukseklik),
                     renk=yavru_renk,
-                    boyut=(ebeveyn1.boyut + ebeveyn2.boyut) / 2 + random.uniform(-0.5, 0.5),
-                    hiz=(ebeveyn1.hiz + ebeveyn2.hiz) / 2 + random.uniform(-0.2, 0.2),
-                    enerji=random.uniform(60, 90),
+                    boyut=(ebeveyn1.boyut + ebeveyn2.boyut) / 2 + r.uniform(-0.5, 0.5),
+                    hiz=(ebeveyn1.hiz + ebeveyn2.hiz) / 2 + r.uniform(-0.2, 0.2),
+                    enerji=r.uniform(60, 90),
                     yas=0
                 )
                 yeni_bocekler.append(yavru)
@@ -219,7 +225,7 @@ class BocekSimulasyonu:
             
             # Simülasyon adımları
             for bocek in self.bocekler:
-                bocek.hareket_et(self.genislik, self.yukseklik)
+                bocek.hareket_et(self.genislik, self.yukseklik, self.rastgele.hareket)
             
             self.dogal_secilim_uygula()
             
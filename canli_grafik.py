@@ -0,0 +1,187 @@
+import math
+import time
+from multiprocessing import get_context
+from typing import Callable, List, Sequence
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+# Bir çizgide gönderilen en çok nokta (pencere genişliğinden fazlası görünmez)
+EN_FAZLA_NOKTA = 2000
+
+
+def cizgi(x, y, etiket: str = None, **stil) -> dict:
+    """Panel çizgisi; `stil` doğrudan Axes.plot'a geçer"""
+    return {'x': np.asarray(x), 'y': np.asarray(y), 'etiket': etiket, 'stil': stil}
+
+
+def bant(x, alt, ust, **stil) -> dict:
+    """Panel dolgu bandı (Axes.fill_between)"""
+    return {'x': np.asarray(x), 'alt': np.asarray(alt), 'ust': np.asarray(ust), 'stil': stil}
+
+
+def panel(baslik: str, x_etiketi: str, y_etiketi: str, cizgiler: Sequence[dict],
+          bantlar: Sequence[dict] = (), lejant: bool = True) -> dict:
+    return {'baslik': baslik, 'x_etiketi': x_etiketi, 'y_etiketi': y_etiketi,
+            'cizgiler': list(cizgiler), 'bantlar': list(bantlar), 'lejant': lejant}
+
+
+def seyrelt(paneller: List[dict], en_fazla: int = EN_FAZLA_NOKTA) -> List[dict]:
+    """Uzun serileri eşit aralıklı örnekle kısalt (son nokta korunur)"""
+    def kisalt(dizi: np.ndarray, adim: int) -> np.ndarray:
+        if adim <= 1:
+            return dizi
+        return np.append(dizi[::adim], dizi[-1])
+
+    sonuc = []
+    for p in paneller:
+        p = dict(p)
+        p['cizgiler'] = [dict(c, x=kisalt(c['x'], -(-len(c['x']) // en_fazla)),
+                              y=kisalt(c['y'], -(-len(c['y']) // en_fazla)))
+                         for c in p['cizgiler']]
+        p['bantlar'] = [dict(b, **{ad: kisalt(b[ad], -(-len(b['x']) // en_fazla)) for ad in ('x', 'alt', 'ust')})
+                        for b in p['bantlar']]
+        sonuc.append(p)
+    return sonuc
+
+
+def paneller_ciz(fig, paneller: List[dict]) -> list:
+    """Panelleri figüre iki sütunlu ızgara olarak çiz, eksenleri döndür"""
+    fig.clear()
+    satir_sayisi = max(1, math.ceil(len(paneller) / 2))
+    eksenler = []
+    for i, p in enumerate(paneller, 1):
+        ax = fig.add_subplot(satir_sayisi, 2, i)
+        for b in p['bantlar']:
+            ax.fill_between(b['x'], b['alt'], b['ust'], **b['stil'])
+        for c in p['cizgiler']:
+            ax.plot(c['x'], c['y'], label=c['etiket'] or '_nolegend_', **c['stil'])
+        ax.set_title(p['baslik'], fontweight='bold')
+        ax.set_xlabel(p['x_etiketi'])
+        ax.set_ylabel(p['y_etiketi'])
+        if p['lejant'] and any(c['etiket'] for c in p['cizgiler']):
+            ax.legend()
+        ax.grid(True, alpha=0.3)
+        eksenler.append(ax)
+    fig.tight_layout()
+    return eksenler
+
+
+def _yerinde_guncelle(eksenler: list, paneller: List[dict]) -> bool:
+    """Çizgiler aynıysa yalnızca verilerini değiştir; yapı değiştiyse False"""
+    if len(eksenler) != len(paneller):
+        return False
+    for ax, p in zip(eksenler, paneller):
+        etiketler = [c['etiket'] or '_nolegend_' for c in p['cizgiler']]
+        if [cizgi.get_label() for cizgi in ax.get_lines()] != etiketler:
+            return False
+    for ax, p in zip(eksenler, paneller):
+        for cizgi_nesnesi, c in zip(ax.get_lines(), p['cizgiler']):
+            cizgi_nesnesi.set_data(c['x'], c['y'])
+        for koleksiyon in list(ax.collections):
+            koleksiyon.remove()
+        for b in p['bantlar']:
+            ax.fill_between(b['x'], b['alt'], b['ust'], **b['stil'])
+        ax.relim()
+        ax.autoscale_view()
+    return True
+
+
+def paneller_goster(paneller: List[dict]):
+    """Panelleri tek seferlik (engelleyici) pencerede göster"""
+    fig = plt.figure(figsize=(16, 12))
+    paneller_ciz(fig, paneller)
+    plt.show()
+
+
+def _grafik_sureci(baglanti, baslik: str, yenileme_araligi: float):
+    """Grafik sürecinin döngüsü: veri iste, gelince çiz, pencere olaylarını işle"""
+    fig = plt.figure(baslik, figsize=(16, 12))
+    eksenler = []
+    bekleniyor = False
+    sonraki = 0.0
+    try:
+        while plt.fignum_exists(fig.number):
+            if not bekleniyor and time.monotonic() >= sonraki:
+                baglanti.send(True)
+                bekleniyor = True
+            # Yanıt genellikle bir simülasyon karesi içinde gelir; beklerken
+            # okumak, büyük verinin boruda ana süreci bekletmesini önler
+            if bekleniyor and baglanti.poll(0.5):
+                paneller = baglanti.recv()
+                if paneller is None:
+                    break
+                bekleniyor = False
+                sonraki = time.monotonic() + yenileme_araligi
+                if paneller and not (eksenler and _yerinde_guncelle(eksenler, paneller)):
+                    eksenler = paneller_ciz(fig, paneller)
+                fig.canvas.draw_idle()
+            plt.pause(0.05)
+    except (EOFError, BrokenPipeError, ConnectionResetError):
+        pass  # simülasyon kapandı
+    plt.close('all')
+
+
+class CanliGrafikPenceresi:
+    """Simülasyonu durdurmadan canlı grafik gösteren ayrı süreçli pencere
+
+    Çizim (matplotlib) tümüyle ayrı bir süreçtedir. Grafik süreci her
+    `yenileme_araligi` saniyede bir boru üzerinden veri ister; ana döngü
+    her karede `guncelle()` çağırır ve bekleyen istek varsa
+    `veri_fonksiyonu()` panellerini seyreltip gönderir. İstek yokken
+    karenin maliyeti tek bir `poll` çağrısıdır.
+    """
+
+    def __init__(self, veri_fonksiyonu: Callable[[], List[dict]], baslik: str = "Canlı Grafikler",
+                 yenileme_araligi: float = 1.0):
+        self.veri_fonksiyonu = veri_fonksiyonu
+        self.baslik = baslik
+        self.yenileme_araligi = yenileme_araligi
+        self._surec = None
+        self._baglanti = None
+
+    def acik(self) -> bool:
+        return self._surec is not None and self._surec.is_alive()
+
+    def ac(self):
+        if self.acik():
+            return
+        self.kapat()
+        baglam = get_context('spawn')
+        self._baglanti, alt_uc = baglam.Pipe()
+        self._surec = baglam.Process(target=_grafik_sureci, daemon=True,
+                                     args=(alt_uc, self.baslik, self.yenileme_araligi))
+        self._surec.start()
+        alt_uc.close()
+
+    def ac_kapat(self):
+        if self.acik():
+            self.kapat()
+        else:
+            self.ac()
+
+    def guncelle(self):
+        """Her karede çağrılır; grafik süreci veri istediyse gönder"""
+        if self._baglanti is None:
+            return
+        try:
+            if not self._baglanti.poll():
+                return
+            self._baglanti.recv()
+            self._baglanti.send(seyrelt(self.veri_fonksiyonu()))
+        except (EOFError, BrokenPipeError, ConnectionResetError):
+            self.kapat()  # pencere kullanıcı tarafından kapatıldı
+
+    def kapat(self):
+        if self._baglanti is not None:
+            try:
+                self._baglanti.send(None)
+            except (BrokenPipeError, ConnectionResetError, OSError):
+                pass
+            self._baglanti.close()
+            self._baglanti = None
+        if self._surec is not None:
+            self._surec.join(timeout=2)
+            if self._surec.is_alive():
+                self._surec.terminate()
+            self._surec = None
@@ -0,0 +1 @@
+# Kök dizindeki modüllerin tests/ altından içe aktarılabilmesi için (pytest kökü sys.path'e ekler)
@@ -0,0 +1,132 @@
+import csv
+import functools
+import time
+from contextlib import nullcontext
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+_BOS_BAGLAM = nullcontext()
+
+
+class _Faz:
+    """Tek fazın halka tampondaki son süreleri ve birikimli toplamı"""
+    __slots__ = ('ad', 'saat', 'ornekler', 'sira', 'sayi', 'toplam', '_bas')
+
+    def __init__(self, ad: str, pencere: int, saat: Callable[[], float]):
+        self.ad = ad
+        self.saat = saat
+        self.ornekler = [0.0] * pencere
+        self.sira = 0
+        self.sayi = 0
+        self.toplam = 0.0
+        self._bas = 0.0
+
+    def __enter__(self):
+        self._bas = self.saat()
+        return self
+
+    def __exit__(self, *hata):
+        self.ekle(self.saat() - self._bas)
+        return False
+
+    def ekle(self, sure: float):
+        self.ornekler[self.sira] = sure
+        self.sira = (self.sira + 1) % len(self.ornekler)
+        self.sayi += 1
+        self.toplam += sure
+
+    def son_ornekler(self) -> List[float]:
+        return self.ornekler[:min(self.sayi, len(self.ornekler))]
+
+
+class FazProfilleyici:
+    """Faz başına dönen süre istatistikleri (p50/p95/maks)
+
+    Her faz son `pencere` ölçümünü önceden ayrılmış bir halka tamponda
+    tutar; toplam süre ve çağrı sayısı ayrıca birikir. Ölçüm yalnızca iki
+    saat okuması ve bir liste yazımıdır, yüzdelikler okunurken hesaplanır.
+    Kullanım:
+
+        with profil.faz('hareket'):
+            ...
+
+    ya da var olan metotları yerinde sarmak için `profil.sar(nesne, 'metot')`.
+    `etkin` False iken `faz` paylaşılan boş bağlamı döndürür.
+    """
+
+    def __init__(self, pencere: int = 240, etkin: bool = True, saat: Callable[[], float] = time.perf_counter):
+        self.pencere = max(1, int(pencere))
+        self.etkin = etkin
+        self.saat = saat
+        self._fazlar: Dict[str, _Faz] = {}
+
+    def faz(self, ad: str):
+        """`with` bloğunun süresini `ad` fazına yaz"""
+        if not self.etkin:
+            return _BOS_BAGLAM
+        faz = self._fazlar.get(ad)
+        if faz is None:
+            faz = self._fazlar[ad] = _Faz(ad, self.pencere, self.saat)
+        return faz
+
+    def kaydet(self, ad: str, sure: float):
+        """Dışarıda ölçülmüş bir süreyi (saniye) ekle"""
+        if self.etkin:
+            self.faz(ad).ekle(sure)
+
+    def sar(self, nesne, *metotlar: str, adlar: Optional[Dict[str, str]] = None):
+        """Nesnenin metotlarını süre ölçen sarmalayıcılarla değiştir
+
+        Döngü koduna dokunmadan (örneğin tkinter simülatörlerinde) faz
+        ölçümü eklemek içindir; faz adı varsayılan olarak metot adıdır.
+        """
+        adlar = adlar or {}
+        for metot in metotlar:
+            asil = getattr(nesne, metot)
+            ad = adlar.get(metot, metot)
+
+            @functools.wraps(asil)
+            def sarili(*args, _asil=asil, _ad=ad, **kwargs):
+                with self.faz(_ad):
+                    return _asil(*args, **kwargs)
+            setattr(nesne, metot, sarili)
+
+    def sifirla(self):
+        self._fazlar.clear()
+
+    def fazlar(self) -> List[str]:
+        """Faz adları, ilk ölçülme sırasıyla"""
+        return list(self._fazlar)
+
+    # --- Okuma ----------------------------------------------------------
+
+    def istatistik(self, ad: str) -> Dict[str, float]:
+        """Fazın pencere içindeki p50/p95/maks/ortalama süreleri (ms)"""
+        faz = self._fazlar[ad]
+        ornekler = sorted(faz.son_ornekler())
+        n = len(ornekler)
+        if n == 0:
+            return {'sayi': 0, 'p50': 0.0, 'p95': 0.0, 'maks': 0.0, 'ort': 0.0, 'toplam_s': 0.0}
+        return {
+            'sayi': faz.sayi,
+            'p50': 1000 * ornekler[(n - 1) // 2],
+            'p95': 1000 * ornekler[min(n - 1, int(0.95 * n))],
+            'maks': 1000 * ornekler[-1],
+            'ort': 1000 * sum(ornekler) / n,
+            'toplam_s': faz.toplam,
+        }
+
+    def ozet(self) -> Dict[str, Dict[str, float]]:
+        return {ad: self.istatistik(ad) for ad in self._fazlar}
+
+    def csv_kaydet(self, dosya: Optional[str] = None) -> str:
+        """Özeti CSV olarak yaz; dosya adını döndür"""
+        if dosya is None:
+            dosya = f"faz_profili_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+        with open(dosya, 'w', newline='', encoding='utf-8') as f:
+            yazici = csv.writer(f)
+            yazici.writerow(['faz', 'sayi', 'p50_ms', 'p95_ms', 'maks_ms', 'ort_ms', 'toplam_s'])
+            for ad, ist in self.ozet().items():
+                yazici.writerow([ad, ist['sayi'], f"{ist['p50']:.4f}", f"{ist['p95']:.4f}",
+                                 f"{ist['maks']:.4f}", f"{ist['ort']:.4f}", f"{ist['toplam_s']:.6f}"])
+        return dosya
@@ -0,0 +1,195 @@
+import numpy as np
+from typing import Dict, List, Optional, Sequence, Tuple
+
+ISTATISTIKLER = ('min', 'ort', 'max')
+
+
+class _Halka:
+    """Önceden ayrılmış satırlardan oluşan halka tampon
+
+    Sınırsız kipte kapasite dolunca ikiye katlanır; sınırlı kipte en eski
+    satırın üzerine yazılır ve çıkan satır döndürülür.
+    """
+
+    def __init__(self, sutun_sayisi: int, kapasite: Optional[int] = None, baslangic_kapasitesi: int = 1024):
+        self.sinirli = kapasite is not None
+        self.veri = np.zeros((kapasite if self.sinirli else baslangic_kapasitesi, sutun_sayisi), order='F')
+        self.bas = 0
+        self.n = 0
+
+    def __len__(self) -> int:
+        return self.n
+
+    def ekle(self, satir: np.ndarray) -> Optional[np.ndarray]:
+        kapasite = len(self.veri)
+        if self.n == kapasite:
+            if self.sinirli:
+                cikan = self.veri[self.bas].copy()
+                self.veri[self.bas] = satir
+                self.bas = (self.bas + 1) % kapasite
+                return cikan
+            yeni = np.zeros((kapasite * 2, self.veri.shape[1]), order='F')
+            yeni[:kapasite] = self.veri
+            self.veri = yeni
+            kapasite *= 2
+        self.veri[(self.bas + self.n) % kapasite] = satir
+        self.n += 1
+        return None
+
+    def sirali(self) -> np.ndarray:
+        """Satırlar eskiden yeniye"""
+        kapasite = len(self.veri)
+        son = self.bas + self.n
+        if son <= kapasite:
+            return self.veri[self.bas:son]
+        return np.concatenate((self.veri[self.bas:], self.veri[:son - kapasite]))
+
+    def son(self) -> np.ndarray:
+        return self.veri[(self.bas + self.n - 1) % len(self.veri)]
+
+    def temizle(self):
+        self.bas = 0
+        self.n = 0
+
+
+class GecmisDeposu:
+    """Sütun tabanlı, sınırlı ve seyreltilmiş zaman serisi deposu
+
+    Her `adim` kayıttan biri saklanır. `max_uzunluk` verilirse son kayıtlar
+    tam çözünürlükte bir halka tamponda tutulur; tampondan düşen kayıtlar
+    `toplama_orani`'lık bloklar halinde min/ortalama/maks özetlerine
+    katlanır. Özetler de kendi halkalarından düştükçe bir üst seviyeye
+    katlanır, böylece bellek sınırlı kalırken uzun koşular çizilebilir.
+    """
+
+    def __init__(self, alanlar: Sequence[str], adim: int = 1, max_uzunluk: Optional[int] = None,
+                 toplama_orani: int = 10, seviye_sayisi: int = 3):
+        self.alanlar = list(alanlar)
+        self._sutun_no = {ad: j for j, ad in enumerate(self.alanlar)}
+        self.adim = max(1, int(adim))
+        self.max_uzunluk = max_uzunluk
+        self.toplama_orani = max(2, int(toplama_orani))
+
+        m = len(self.alanlar)
+        # Seviye 0: [zaman, değerler...]; üst seviyeler: [zaman, min..., ort..., max...]
+        self._seviyeler: List[_Halka] = [_Halka(1 + m, max_uzunluk)]
+        if max_uzunluk is not None:
+            for _ in range(1, max(1, seviye_sayisi)):
+                self._seviyeler.append(_Halka(1 + 3 * m, max_uzunluk))
+        self._satir = np.zeros(1 + m)
+        self.temizle()
+
+    def temizle(self):
+        """Tüm kayıtları sil"""
+        for seviye in self._seviyeler:
+            seviye.temizle()
+        self._cagri = 0
+        # Seviyeler arası yarım kalmış bloklar: (ilk zaman, min, toplam, max, sayı)
+        self._birikim: List[Optional[list]] = [None] * len(self._seviyeler)
+
+    def __len__(self) -> int:
+        """Tam çözünürlükteki kayıt sayısı"""
+        return len(self._seviyeler[0])
+
+    def kaydet(self, zaman: float, degerler: Dict[str, float]) -> bool:
+        """Bir örnek ekle; adım nedeniyle atlanırsa False döner"""
+        self._cagri += 1
+        if (self._cagri - 1) % self.adim:
+            return False
+        satir = self._satir
+        satir[0] = zaman
+        for ad, deger in degerler.items():
+            satir[1 + self._sutun_no[ad]] = deger
+        cikan = self._seviyeler[0].ekle(satir)
+        if cikan is not None:
+            self._katla(0, cikan[0], cikan[1:], cikan[1:], cikan[1:])
+        return True
+
+    def _katla(self, seviye: int, zaman: float, en_kucuk: np.ndarray, ortalama: np.ndarray, en_buyuk: np.ndarray):
+        """Seviyeden düşen satırı bir üst seviyenin bloğuna ekle"""
+        if seviye + 1 >= len(self._seviyeler):
+            return
+        birikim = self._birikim[seviye]
+        if birikim is None:
+            self._birikim[seviye] = [zaman, en_kucuk.copy(), ortalama.copy(), en_buyuk.copy(), 1]
+            birikim = self._birikim[seviye]
+        else:
+            np.minimum(birikim[1], en_kucuk, out=birikim[1])
+            birikim[2] += ortalama
+            np.maximum(birikim[3], en_buyuk, out=birikim[3])
+            birikim[4] += 1
+        if birikim[4] < self.toplama_orani:
+            return
+
+        self._birikim[seviye] = None
+        ust = self._seviyeler[seviye + 1]
+        cikan = ust.ekle(np.concatenate(([birikim[0]], birikim[1], birikim[2] / birikim[4], birikim[3])))
+        if cikan is not None:
+            m = len(self.alanlar)
+            self._katla(seviye + 1, cikan[0], cikan[1:1 + m], cikan[1 + m:1 + 2 * m], cikan[1 + 2 * m:])
+
+    # --- Okuma ----------------------------------------------------------
+
+    def son(self) -> Optional[Dict[str, float]]:
+        """En son kaydedilen örnek"""
+        if len(self) == 0:
+            return None
+        satir = self._seviyeler[0].son()
+        return {ad: float(satir[1 + j]) for j, ad in enumerate(self.alanlar)}
+
+    def seri(self, ad: str, istatistik: str = 'ort') -> Tuple[np.ndarray, np.ndarray]:
+        """Bir alanın tüm çözünürlüklerdeki (zaman, değer) dizisi, eskiden yeniye
+
+        Özet seviyelerinden `istatistik` ('min', 'ort' veya 'max') okunur; tam
+        çözünürlükteki kayıtlarda üçü de ham değere eşittir.
+        """
+        j = self._sutun_no[ad]
+        m = len(self.alanlar)
+        k = ISTATISTIKLER.index(istatistik)
+        zamanlar = []
+        degerler = []
+        for seviye in range(len(self._seviyeler) - 1, 0, -1):
+            satirlar = self._seviyeler[seviye].sirali()
+            zamanlar.append(satirlar[:, 0])
+            degerler.append(satirlar[:, 1 + k * m + j])
+            birikim = self._birikim[seviye - 1]
+            if birikim is not None:
+                ozet = (birikim[1], birikim[2] / birikim[4], birikim[3])[k]
+                zamanlar.append(np.array([birikim[0]]))
+                degerler.append(np.array([ozet[j]]))
+        satirlar = self._seviyeler[0].sirali()
+        zamanlar.append(satirlar[:, 0])
+        degerler.append(satirlar[:, 1 + j])
+        return np.concatenate(zamanlar), np.concatenate(degerler)
+
+    # --- Kontrol noktası -----------------------------------------------
+
+    def durum(self) -> Dict[str, np.ndarray]:
+        """Tüm seviyeleri ve yarım blokları sütunlar halinde döndür"""
+        durum = {'cagri': np.array(self._cagri)}
+        for i, seviye in enumerate(self._seviyeler):
+            durum[f'seviye{i}'] = seviye.sirali()
+            birikim = self._birikim[i]
+            if birikim is not None:
+                durum[f'birikim{i}'] = np.concatenate(([birikim[0]], birikim[1], birikim[2], birikim[3], [birikim[4]]))
+        return durum
+
+    def durumu_yukle(self, durum: Dict[str, np.ndarray]):
+        """durum() çıktısından geri yükle"""
+        self.temizle()
+        self._cagri = int(durum['cagri'])
+        m = len(self.alanlar)
+        for i, seviye in enumerate(self._seviyeler):
+            satirlar = durum[f'seviye{i}']
+            if len(satirlar) > len(seviye.veri):
+                seviye.veri = np.zeros((len(satirlar), seviye.veri.shape[1]), order='F')
+            seviye.veri[:len(satirlar)] = satirlar
+            seviye.n = len(satirlar)
+            birikim = durum.get(f'birikim{i}')
+            if birikim is not None:
+                self._birikim[i] = [float(birikim[0]), birikim[1:1 + m].copy(), birikim[1 + m:1 + 2 * m].copy(),
+                                    birikim[1 + 2 * m:1 + 3 * m].copy(), int(birikim[-1])]
+
+    def bellek(self) -> int:
+        """Ayrılmış toplam bayt"""
+        return sum(seviye.veri.nbytes for seviye in self._seviyeler)
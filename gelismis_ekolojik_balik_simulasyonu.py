@@ -11,6 +11,8 @@ from typing import List, Dict, Tuple
 import json
 from datetime import datetime
 import math
+from rastgele import RastgeleServisi
+from faz_profilleyici import FazProfilleyici
 
 @dataclass
 class CevreselParametreler:
@@ -39,55 +41,55 @@ class Mevsim:
     def mevcut_mevsim_adi(self):
         return self.mevsimler[self.mevcut_mevsim]
         
-    def mevsimsel_faktorler(self) -> CevreselParametreler:
+    def mevsimsel_faktorler(self, rng=random) -> CevreselParametreler:
         """Mevsime göre çevresel faktörleri ayarla"""
         if self.mevcut_mevsim == 0:  # İlkbahar
             return CevreselParametreler(
-                su_sicakligi=15.0 + random.uniform(-2, 2),
-                oksijen_seviyesi=9.0 + random.uniform(-0.5, 0.5),
-                yiyecek_miktari=1.2 + random.uniform(-0.2, 0.3),
-                avci_yogunlugu=0.4 + random.uniform(-0.1, 0.1),
-                hastalik_riski=0.15 + random.uniform(-0.05, 0.05),
-                kirlilik_seviyesi=0.1 + random.uniform(0, 0.1)
+                su_sicakligi=15.0 + rng.uniform(-2, 2),
+                oksijen_seviyesi=9.0 + rng.uniform(-0.5, 0.5),
+                yiyecek_miktari=1.2 + rng.uniform(-0.2, 0.3),
+                avci_yogunlugu=0.4 + rng.uniform(-0.1, 0.1),
+                hastalik_riski=0.15 + rng.uniform(-0.05, 0.05),
+                kirlilik_seviyesi=0.1 + rng.uniform(0, 0.1)
             )
         elif self.mevcut_mevsim == 1:  # Yaz
             return CevreselParametreler(
-                su_sicakligi=25.0 + random.uniform(-3, 5),
-                oksijen_seviyesi=7.0 + random.uniform(-1, 0.5),
-                yiyecek_miktari=1.5 + random.uniform(-0.3, 0.5),
-                avci_yogunlugu=0.6 + random.uniform(-0.1, 0.2),
-                hastalik_riski=0.25 + random.uniform(-0.05, 0.15),
-                kirlilik_seviyesi=0.3 + random.uniform(0, 0.2)
+                su_sicakligi=25.0 + rng.uniform(-3, 5),
+                oksijen_seviyesi=7.0 + rng.uniform(-1, 0.5),
+                yiyecek_miktari=1.5 + rng.uniform(-0.3, 0.5),
+                avci_yogunlugu=0.6 + rng.uniform(-0.1, 0.2),
+                hastalik_riski=0.25 + rng.uniform(-0.05, 0.15),
+                kirlilik_seviyesi=0.3 + rng.uniform(0, 0.2)
             )
         elif self.mevcut_mevsim == 2:  # Sonbahar
             return CevreselParametreler(
-                su_sicakligi=12.0 + random.uniform(-2, 3),
-                oksijen_seviyesi=8.5 + random.uniform(-0.5, 0.5),
-                yiyecek_miktari=0.8 + random.uniform(-0.3, 0.2),
-                avci_yogunlugu=0.3 + random.uniform(-0.1, 0.1),
-                hastalik_riski=0.2 + random.uniform(-0.05, 0.1),
-                kirlilik_seviyesi=0.15 + random.uniform(0, 0.1)
+                su_sicakligi=12.0 + rng.uniform(-2, 3),
+                oksijen_seviyesi=8.5 + rng.uniform(-0.5, 0.5),
+                yiyecek_miktari=0.8 + rng.uniform(-0.3, 0.2),
+                avci_yogunlugu=0.3 + rng.uniform(-0.1, 0.1),
+                hastalik_riski=0.2 + rng.uniform(-0.05, 0.1),
+                kirlilik_seviyesi=0.15 + rng.uniform(0, 0.1)
             )
         else:  # Kış
             return CevreselParametreler(
-                su_sicakligi=5.0 + random.uniform(-2, 3),
-                oksijen_seviyesi=9.5 + random.uniform(-0.3, 0.3),
-                yiyecek_miktari=0.4 + random.uniform(-0.2, 0.1),
-                avci_yogunlugu=0.2 + random.uniform(-0.05, 0.05),
-                hastalik_riski=0.3 + random.uniform(-0.1, 0.2),
-                kirlilik_seviyesi=0.25 + random.uniform(0, 0.15)
+                su_sicakligi=5.0 + rng.uniform(-2, 3),
+                oksijen_seviyesi=9.5 + rng.uniform(-0.3, 0.3),
+                yiyecek_miktari=0.4 + rng.uniform(-0.2, 0.1),
+                avci_yogunlugu=0.2 + rng.uniform(-0.05, 0.05),
+                hastalik_riski=0.3 + rng.uniform(-0.1, 0.2),
+                kirlilik_seviyesi=0.25 + rng.uniform(0, 0.15)
             )
 
 class BalikBireyi:
     """Gelişmiş balık bireyini temsil eden sınıf"""
-    def __init__(self, genotip: str, cinsiyet: str, yas: int = 0):
+    def __init__(self, genotip: str, cinsiyet: str, yas: int = 0, rng=random):
         self.genotip = genotip  # Çoklu gen: renk, boyut, direnç
         self.cinsiyet = cinsiyet
         self.yas = yas
         self.hayatta = True
         self.saglik = 1.0  # 0-1 arası
-        self.boyut = self.boyut_hesapla()
-        self.direnc = self.direnc_hesapla()
+        self.boyut = self.boyut_hesapla(rng)
+        self.direnc = self.direnc_hesapla(rng)
         self.uretkenlik = self.uretkenlik_hesapla()
         self.son_ureme = 0
         
@@ -108,25 +110,25 @@ class BalikBireyi:
             
         return {"renk": renk, "boyut": boyut}
     
-    def boyut_hesapla(self):
+    def boyut_hesapla(self, rng=random):
         """Boyutu genetiğe göre hesapla"""
         boyut_gen = self.genotip[2:4]
         if boyut_gen == "BB":
-            return random.uniform(0.8, 1.0)
+            return rng.uniform(0.8, 1.0)
         elif boyut_gen in ["BK", "KB"]:
-            return random.uniform(0.6, 0.8) 
+            return rng.uniform(0.6, 0.8) 
         else:
-            return random.uniform(0.4, 0.6)
+            return rng.uniform(0.4, 0.6)
     
-    def direnc_hesapla(self):
+    def direnc_hesapla(self, rng=random):
         """Hastalık direncini hesapla"""
         direnc_gen = self.genotip[4:6] if len(self.genotip) >= 6 else "DD"
         if direnc_gen == "DD":
-            return random.uniform(0.8, 1.0)
+            return rng.uniform(0.8, 1.0)
         elif direnc_gen in ["DY", "YD"]:
-            return random.uniform(0.5, 0.8)
+            return rng.uniform(0.5, 0.8)
         else:
-            return random.uniform(0.2, 0.5)
+            return rng.uniform(0.2, 0.5)
     
     def uretkenlik_hesapla(self):
         """Üretkenlik hesapla"""
@@ -188,9 +190,14 @@ class BalikBireyi:
         return min(0.5, temel_risk + yas_riski + saglik_riski + cevresel_risk + yiyecek_riski)
 
 class EkolojikBalikSimulasyonu:
-    """Ana ekolojik balık simülasyonu sınıfı"""
+    """Ana ekolojik balık simülasyonu sınıfı
+
+    Başlangıç, günlük yaşam (seçilim), üreme, mevsim (ortam) ve kritik
+    olaylar (felaket) `rastgele` servisinin ayrı akışlarını kullanır.
+    """
     
-    def __init__(self):
+    def __init__(self, rastgele: RastgeleServisi = None):
+        self.rastgele = rastgele or RastgeleServisi()
         self.populasyon: List[BalikBireyi] = []
         self.mevsim = Mevsim()
         self.cevre = CevreselParametreler()
@@ -208,6 +215,11 @@ class EkolojikBalikSimulasyonu:
         # Kritik olaylar
         self.kritik_olaylar = []
         
+        # Döngü fazlarının süreleri (⏱ Profil butonu CSV olarak yazar)
+        self.profil = FazProfilleyici()
+        self.profil.sar(self, 'kritik_olaylari_kontrol_et', 'gunluk_yasam_dongusu', 'ureme_gerceklestir',
+                        'verileri_kaydet', 'grafikleri_guncelle')
+        
         self.arayuz_olustur()
         
     def arayuz_olustur(self):
@@ -252,6 +264,10 @@ class EkolojikBalikSimulasyonu:
                                     bg='#e74c3c', fg='white', font=("Arial", 12, "bold"))
         self.sifirla_btn.pack(side=tk.LEFT, padx=5)
         
+        self.profil_btn = tk.Button(buton_frame, text="⏱ Profil", command=self.profil_kaydet,
+                                   bg='#8e44ad', fg='white', font=("Arial", 12, "bold"))
+        self.profil_btn.pack(side=tk.LEFT, padx=5)
+        
         # Durum paneli
         self.durum_paneli_olustur()
         
@@ -294,6 +310,7 @@ class EkolojikBalikSimulasyonu:
         
     def baslangic_populasyonu_olustur(self):
         """Başlangıç popülasyonunu oluştur"""
+        r = self.rastgele.baslangic
         self.populasyon.clear()
         self.zaman_verileri.clear()
         self.populasyon_verileri.clear()
@@ -304,17 +321,17 @@ class EkolojikBalikSimulasyonu:
         # İlk popülasyon - çeşitli genetik kombinasyonlar
         for i in range(200):
             # Renk geni (K=kırmızı, B=beyaz)
-            renk = random.choices(["K", "B"], weights=[0.6, 0.4], k=2)
+            renk = r.choices(["K", "B"], weights=[0.6, 0.4], k=2)
             # Boyut geni (B=büyük, K=küçük) 
-            boyut = random.choices(["B", "K"], weights=[0.3, 0.7], k=2)
+            boyut = r.choices(["B", "K"], weights=[0.3, 0.7], k=2)
             # Direnç geni (D=dirençli, Y=zayıf)
-            direnc = random.choices(["D", "Y"], weights=[0.7, 0.3], k=2)
+            direnc = r.choices(["D", "Y"], weights=[0.7, 0.3], k=2)
             
             genotip = "".join(sorted(renk, reverse=True)) + "".join(sorted(boyut, reverse=True)) + "".join(sorted(direnc, reverse=True))
-            cinsiyet = random.choice(["erkek", "disi"])
-            yas = random.randint(1, 5)
+            cinsiyet = r.choice(["erkek", "disi"])
+            yas = r.randint(1, 5)
             
-            birey = BalikBireyi(genotip, cinsiyet, yas)
+            birey = BalikBireyi(genotip, cinsiyet, yas, r)
             self.populasyon.append(birey)
         
         self.nesil = 0
@@ -340,6 +357,14 @@ class EkolojikBalikSimulasyonu:
         self.baslangic_populasyonu_olustur()
         self.grafikleri_guncelle()
         
+    def profil_kaydet(self):
+        """Faz sürelerini (p50/p95/maks) CSV olarak kaydet"""
+        try:
+            dosya = self.profil.csv_kaydet()
+            messagebox.showinfo("Başarılı", f"Faz süreleri {dosya} dosyasına kaydedildi.")
+        except OSError as e:
+            messagebox.showerror("Hata", f"Profil kaydetme hatası: {e}")
+    
     def simulasyon_dongusu(self):
         """Ana simülasyon döngüsü"""
         while self.calisir and len(self.populasyon) > 0:
@@ -349,7 +374,7 @@ class EkolojikBalikSimulasyonu:
             self.mevsim.guncelle()
             
             # Çevresel faktörleri güncelle
-            self.cevre = self.mevsim.mevsimsel_faktorler()
+            self.cevre = self.mevsim.mevsimsel_faktorler(self.rastgele.ortam)
             
             # Kritik olayları kontrol et
             self.kritik_olaylari_kontrol_et()
@@ -367,8 +392,10 @@ class EkolojikBalikSimulasyonu:
             
     def kritik_olaylari_kontrol_et(self):
         """Kritik çevresel olayları kontrol et"""
+        r = self.rastgele.felaket
+
         # Hastalık salgını (düşük olasılık)
-        if random.random() < 0.001:
+        if r.random() < 0.001:
             self.cevre.hastalik_riski = min(1.0, self.cevre.hastalik_riski * 3)
             self.kritik_olaylar.append({
                 'gun': self.gun,
@@ -377,7 +404,7 @@ class EkolojikBalikSimulasyonu:
             })
             
         # Kirlilik artışı
-        if random.random() < 0.002:
+        if r.random() < 0.002:
             self.cevre.kirlilik_seviyesi = min(1.0, self.cevre.kirlilik_seviyesi * 2)
             self.kritik_olaylar.append({
                 'gun': self.gun,
@@ -386,7 +413,7 @@ class EkolojikBalikSimulasyonu:
             })
             
         # Avcı istilası
-        if random.random() < 0.0015:
+        if r.random() < 0.0015:
             self.cevre.avci_yogunlugu = min(1.0, self.cevre.avci_yogunlugu * 2)
             self.kritik_olaylar.append({
                 'gun': self.gun,
@@ -396,9 +423,11 @@ class EkolojikBalikSimulasyonu:
     
     def gunluk_yasam_dongusu(self):
         """Günlük yaşam döngüsü"""
+        r = self.rastgele.secilim
+
         # Yaşlanma
         for balik in self.populasyon:
-            if random.random() < 0.01:  # Her 100 günde bir yaşlanır
+            if r.random() < 0.01:  # Her 100 günde bir yaşlanır
                 balik.yaslan()
             
             # Çevresel stress uygula
@@ -408,7 +437,7 @@ class EkolojikBalikSimulasyonu:
         yeni_populasyon = []
         for balik in self.populasyon:
             olum_riski = balik.olum_riski_hesapla(self.cevre)
-            if random.random() > olum_riski:
+            if r.random() > olum_riski:
                 yeni_populasyon.append(balik)
                 
         self.populasyon = yeni_populasyon
@@ -419,6 +448,7 @@ class EkolojikBalikSimulasyonu:
     
     def ureme_gerceklestir(self):
         """Üreme işlemi"""
+        r = self.rastgele.ureme
         if len(self.populasyon) < 2:
             return
             
@@ -432,18 +462,19 @@ class EkolojikBalikSimulasyonu:
         ureme_orani = min(0.3, self.cevre.yiyecek_miktari * 0.2)
         
         for disi in uygun_disiler:
-            if random.random() < ureme_orani * disi.uretkenlik:
-                erkek = random.choice(uygun_erkekler)
-                yavru_sayisi = random.randint(1, 5)
+            if r.random() < ureme_orani * disi.uretkenlik:
+                erkek = r.choice(uygun_erkekler)
+                yavru_sayisi = r.randint(1, 5)
                 
                 for _ in range(yavru_sayisi):
                     yavru_genotip = self.genotip_olustur(disi.genotip, erkek.genotip)
-                    yavru_cinsiyet = random.choice(["erkek", "disi"])
-                    yavru = BalikBireyi(yavru_genotip, yavru_cinsiyet, 0)
+                    yavru_cinsiyet = r.choice(["erkek", "disi"])
+                    yavru = BalikBireyi(yavru_genotip, yavru_cinsiyet, 0, r)
                     self.populasyon.append(yavru)
     
     def genotip_olustur(self, anne_genotip: str, baba_genotip: str) -> str:
         """Çaprazlama ile yavru genotipi oluştur"""
+        r = self.rastgele.ureme
         yavru_genotip = ""
         
         # Her gen için çaprazlama
@@ -451,13 +482,13 @@ class EkolojikBalikSimulasyonu:
             anne_gen = anne_genotip[i:i+2]
             baba_gen = baba_genotip[i:i+2]
             
-            anne_allel = random.choice([anne_gen[0], anne_gen[1]])
-            baba_allel = random.choice([baba_gen[0], baba_gen[1]])
+            anne_allel = r.choice([anne_gen[0], anne_gen[1]])
+            baba_allel = r.choice([baba_gen[0], baba_gen[1]])
             
             # Mutasyon kontrolü
-            if random.random() < 0.01:  # %1 mutasyon şansı
+            if r.random() < 0.01:  # %1 mutasyon şansı
                 anne_allel = self.mutasyon_uygula(anne_allel)
-            if random.random() < 0.01:
+            if r.random() < 0.01:
                 baba_allel = self.mutasyon_uygula(baba_allel)
                 
             yavru_gen = "".join(sorted([anne_allel, baba_allel], reverse=True))
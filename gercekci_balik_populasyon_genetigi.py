@@ -3,12 +3,12 @@ import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import tkinter as tk
 from tkinter import ttk, messagebox
-import random
 import math
 from dataclasses import dataclass
 from typing import List, Dict, Tuple
 import json
 from datetime import datetime
+from rastgele import RastgeleServisi
 
 @dataclass
 class CevreselFaktorler:
@@ -21,11 +21,16 @@ class CevreselFaktorler:
     yirtici_yogunlugu: float = 0.3    # 0.0-1.0 arası
 
 class BalikPopulasyonu:
-    """Balık popülasyonunu ve genetik yapısını modelleyen sınıf"""
+    """Balık popülasyonunu ve genetik yapısını modelleyen sınıf
+
+    Rastgele olaylar `rastgele` servisinin ortam, felaket ve üreme
+    akışlarından çekilir; aynı tohum aynı koşuyu üretir.
+    """
     
-    def __init__(self, baslangic_boyutu: int = 1000):
+    def __init__(self, baslangic_boyutu: int = 1000, rastgele: RastgeleServisi = None):
         # Genetik yapı: K (kırmızı dominant), B (beyaz resesif)
         self.baslangic_boyutu = baslangic_boyutu
+        self.rastgele = rastgele or RastgeleServisi()
         self.reset_populasyon()
         
         # Çevresel faktörler
@@ -69,6 +74,8 @@ class BalikPopulasyonu:
         
     def mevsimsel_etki_hesapla(self):
         """Mevsime göre çevresel faktörleri güncelle"""
+        r = self.rastgele.ortam
+
         # Sıcaklık değişimi (sinüzoidal)
         mevsim_radyan = (self.mevsim / 4.0) * 2 * math.pi
         sicaklik_degisimi = self.cevre.sicaklik_varyasyon * math.cos(mevsim_radyan)
@@ -88,24 +95,25 @@ class BalikPopulasyonu:
             self.cevre.besin_bolluğu * 0.9 + besin_carpani * 0.1))
         
         # Rastgele çevresel değişimler
-        self.cevre.kirlilik_seviyesi += random.uniform(-0.02, 0.02)
+        self.cevre.kirlilik_seviyesi += r.uniform(-0.02, 0.02)
         self.cevre.kirlilik_seviyesi = max(0.0, min(1.0, self.cevre.kirlilik_seviyesi))
         
         return mevcut_sicaklik
     
     def catastrofik_olay_kontrol(self):
         """Nadir ama etkili olayları simüle et"""
+        r = self.rastgele.felaket
         olay_listesi = []
         
         # Hastalık salgını (% 3 şans)
-        if random.random() < 0.03:
-            olum_orani = random.uniform(0.3, 0.7)
+        if r.random() < 0.03:
+            olum_orani = r.uniform(0.3, 0.7)
             self.populasyon_azalt(olum_orani)
             olay_listesi.append(f"Hastalık Salgını - %{olum_orani*100:.1f} kayıp")
             
         # Yırtıcı istilası (% 2 şans)
-        if random.random() < 0.02:
-            yirtici_olum = random.uniform(0.2, 0.5)
+        if r.random() < 0.02:
+            yirtici_olum = r.uniform(0.2, 0.5)
             # Renkli balıklar daha çok hedef alınır (kamuflaj eksikliği)
             kk_kayip = int(self.populasyon['KK'] * yirtici_olum * 1.3)
             kb_kayip = int(self.populasyon['KB'] * yirtici_olum * 1.1)
@@ -118,14 +126,14 @@ class BalikPopulasyonu:
             olay_listesi.append(f"Yırtıcı İstilası - Renkli balıklar daha çok etkilendi")
             
         # İklim değişikliği olayı (% 1 şans)
-        if random.random() < 0.01:
-            self.cevre.sicaklik_ortalama += random.uniform(-2, 3)
-            self.cevre.kirlilik_seviyesi += random.uniform(0.05, 0.15)
+        if r.random() < 0.01:
+            self.cevre.sicaklik_ortalama += r.uniform(-2, 3)
+            self.cevre.kirlilik_seviyesi += r.uniform(0.05, 0.15)
             olay_listesi.append("İklim Değişikliği - Sıcaklık ve kirlilik artışı")
             
         # Habitat bozulması (% 1.5 şans)
-        if random.random() < 0.015:
-            habitat_kaybi = random.uniform(0.1, 0.3)
+        if r.random() < 0.015:
+            habitat_kaybi = r.uniform(0.1, 0.3)
             self.populasyon_azalt(habitat_kaybi)
             self.cevre.besin_bolluğu *= (1 - habitat_kaybi)
             olay_listesi.append(f"Habitat Bozulması - %{habitat_kaybi*100:.1f} habitat kaybı")
@@ -215,6 +223,7 @@ class BalikPopulasyonu:
     
     def mutasyon_uygula(self):
         """Düşük oranlı mutasyon uygula"""
+        r = self.rastgele.ureme
         mutasyon_orani = 0.001  # %0.1
         
         for genotip in list(self.populasyon.keys()):
@@ -226,11 +235,12 @@ class BalikPopulasyonu:
                 # Rastgele diğer genotiplere dağıt
                 for _ in range(mutasyon_sayisi):
                     hedef_genotipler = [g for g in self.populasyon.keys() if g != genotip]
-                    hedef = random.choice(hedef_genotipler)
+                    hedef = r.choice(hedef_genotipler)
                     self.populasyon[hedef] += 1
     
     def genetik_suruklenme_uygula(self):
         """Küçük popülasyonlarda genetik sürüklenme"""
+        r = self.rastgele.ureme
         toplam = sum(self.populasyon.values())
         
         if toplam < 100:
@@ -243,7 +253,7 @@ class BalikPopulasyonu:
             return
             
         for genotip in self.populasyon:
-            degisim = int(self.populasyon[genotip] * suruklenme_gucu * random.uniform(-1, 1))
+            degisim = int(self.populasyon[genotip] * suruklenme_gucu * r.uniform(-1, 1))
             self.populasyon[genotip] = max(0, self.populasyon[genotip] + degisim)
     
     def bir_mevsim_simule_et(self):
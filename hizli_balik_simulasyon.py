@@ -3,18 +3,19 @@ import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import tkinter as tk
 from tkinter import ttk, messagebox
-import random
 import threading
 import time
 from datetime import datetime
 import json
+from rastgele import RastgeleServisi
 
 class HizliBalikSimulasyonu:
     """Hızlı ve optimize edilmiş balık popülasyon simülasyonu"""
     
-    def __init__(self, baslangic_populasyonu=1000, simulasyon_yili=200):
+    def __init__(self, baslangic_populasyonu=1000, simulasyon_yili=200, rastgele=None):
         self.baslangic_populasyonu = baslangic_populasyonu
         self.simulasyon_yili = simulasyon_yili
+        self.rastgele = rastgele or RastgeleServisi()
         
         # Genetik yapı - basit tutalım
         self.reset_populasyon()
@@ -51,19 +52,20 @@ class HizliBalikSimulasyonu:
         
         # Rastgele olaylar (düşük olasılık)
         olay = ""
-        if random.random() < 0.05:  # %5 şans
-            if random.random() < 0.5:
+        felaket = self.rastgele.felaket
+        if felaket.random() < 0.05:  # %5 şans
+            if felaket.random() < 0.5:
                 # Hastalık
-                kayip = random.uniform(0.1, 0.3)
+                kayip = felaket.uniform(0.1, 0.3)
                 self.kk_sayisi = int(self.kk_sayisi * (1 - kayip))
                 self.kb_sayisi = int(self.kb_sayisi * (1 - kayip))
                 self.bb_sayisi = int(self.bb_sayisi * (1 - kayip))
                 olay = f"Hastalık (%{kayip*100:.0f} kayıp)"
             else:
                 # Yırtıcı saldırısı - renkli balıklar daha çok etkilenir
-                kk_kayip = random.uniform(0.15, 0.25)
-                kb_kayip = random.uniform(0.10, 0.20)
-                bb_kayip = random.uniform(0.05, 0.15)
+                kk_kayip = felaket.uniform(0.15, 0.25)
+                kb_kayip = felaket.uniform(0.10, 0.20)
+                bb_kayip = felaket.uniform(0.05, 0.15)
                 
                 self.kk_sayisi = int(self.kk_sayisi * (1 - kk_kayip))
                 self.kb_sayisi = int(self.kb_sayisi * (1 - kb_kayip))
@@ -83,7 +85,7 @@ class HizliBalikSimulasyonu:
             yeni_toplam = max(50, min(yeni_toplam, self.baslangic_populasyonu * 2))
             
             # Hafif heterozygot avantajı
-            k_freq_yeni = k_freq + random.uniform(-0.01, 0.01)  # Küçük değişim
+            k_freq_yeni = k_freq + self.rastgele.ureme.uniform(-0.01, 0.01)  # Küçük değişim
             k_freq_yeni = max(0.05, min(0.95, k_freq_yeni))
             b_freq_yeni = 1 - k_freq_yeni
             
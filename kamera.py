@@ -0,0 +1,78 @@
+from typing import Tuple
+
+
+class Kamera:
+    """Dünyanın ekranda görünen bölümü: kaydırma ve yakınlaştırma
+
+    Dünya boyutu ekran boyutundan bağımsızdır. `x`, `y` görünen alanın sol
+    üst köşesinin dünya koordinatı, `olcek` dünya biriminin ekrandaki piksel
+    karşılığıdır. Dönüşümler hem tek sayılarla hem NumPy dizileriyle çalışır.
+    Görünen alan dünyadan taşmaz; dünya ekrandan küçükse ortalanır.
+    """
+
+    def __init__(self, dunya_genisligi: float, dunya_yuksekligi: float,
+                 ekran_genisligi: int, ekran_yuksekligi: int, en_buyuk_olcek: float = 4.0):
+        self.dunya_genisligi = dunya_genisligi
+        self.dunya_yuksekligi = dunya_yuksekligi
+        self.ekran_genisligi = ekran_genisligi
+        self.ekran_yuksekligi = ekran_yuksekligi
+        self.en_buyuk_olcek = en_buyuk_olcek
+        self.olcek = 1.0
+        # Başlangıçta dünyanın ortası, 1:1 ölçekte
+        self.x = (dunya_genisligi - ekran_genisligi) / 2
+        self.y = (dunya_yuksekligi - ekran_yuksekligi) / 2
+        self._sinirla()
+
+    @property
+    def en_kucuk_olcek(self) -> float:
+        """Tüm dünyanın ekrana sığdığı ölçek (1'den büyük olmaz)"""
+        return min(1.0, self.ekran_genisligi / self.dunya_genisligi, self.ekran_yuksekligi / self.dunya_yuksekligi)
+
+    def gorunur_alan(self) -> Tuple[float, float, float, float]:
+        """Ekranda görünen dünya dikdörtgeni (x0, y0, x1, y1)"""
+        return (self.x, self.y, self.x + self.ekran_genisligi / self.olcek,
+                self.y + self.ekran_yuksekligi / self.olcek)
+
+    def dunyadan_ekrana(self, x, y):
+        return (x - self.x) * self.olcek, (y - self.y) * self.olcek
+
+    def ekrandan_dunyaya(self, sx, sy):
+        return self.x + sx / self.olcek, self.y + sy / self.olcek
+
+    def dunya_dikdortgeni(self) -> Tuple[int, int, int, int]:
+        """Dünya sınırlarının ekrandaki dikdörtgeni (arka plan için)"""
+        sx, sy = self.dunyadan_ekrana(0.0, 0.0)
+        return (int(sx), int(sy), int(self.dunya_genisligi * self.olcek), int(self.dunya_yuksekligi * self.olcek))
+
+    def kaydir(self, dx: float, dy: float):
+        """Görünümü ekran pikseli cinsinden kaydır"""
+        self.x += dx / self.olcek
+        self.y += dy / self.olcek
+        self._sinirla()
+
+    def yakinlastir(self, carpan: float, odak: Tuple[float, float] = None):
+        """Ölçeği `carpan` ile çarp; `odak` ekran noktası yerinde kalır (varsayılan: ekran ortası)"""
+        if odak is None:
+            odak = (self.ekran_genisligi / 2, self.ekran_yuksekligi / 2)
+        dunya_x, dunya_y = self.ekrandan_dunyaya(*odak)
+        self.olcek = min(max(self.olcek * carpan, self.en_kucuk_olcek), self.en_buyuk_olcek)
+        self.x = dunya_x - odak[0] / self.olcek
+        self.y = dunya_y - odak[1] / self.olcek
+        self._sinirla()
+
+    def sigdir(self):
+        """Tüm dünyayı göster"""
+        self.olcek = self.en_kucuk_olcek
+        self._sinirla()
+
+    def _sinirla(self):
+        gorunen_genislik = self.ekran_genisligi / self.olcek
+        gorunen_yukseklik = self.ekran_yuksekligi / self.olcek
+        if gorunen_genislik >= self.dunya_genisligi:
+            self.x = (self.dunya_genisligi - gorunen_genislik) / 2
+        else:
+            self.x = min(max(self.x, 0.0), self.dunya_genisligi - gorunen_genislik)
+        if gorunen_yukseklik >= self.dunya_yuksekligi:
+            self.y = (self.dunya_yuksekligi - gorunen_yukseklik) / 2
+        else:
+            self.y = min(max(self.y, 0.0), self.dunya_yuksekligi - gorunen_yukseklik)
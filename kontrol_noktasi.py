@@ -0,0 +1,102 @@
+import glob
+import json
+import os
+import re
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+
+SURUM = 1
+META_ANAHTARI = '__meta__'
+
+
+def npz_kaydet(dosya: str, sutunlar: Dict[str, np.ndarray], meta: dict, sikistir: bool = True):
+    """Sütunları ve JSON başlığını tek bir .npz dosyasına yaz
+
+    Dosya önce geçici adla yazılıp sonra yerine taşınır; yazma sırasında
+    çökülürse eski kontrol noktası bozulmaz.
+    """
+    gecici = dosya + '.tmp'
+    veri = dict(sutunlar)
+    veri[META_ANAHTARI] = np.array(json.dumps(dict(meta, surum=SURUM), ensure_ascii=False))
+    with open(gecici, 'wb') as f:
+        (np.savez_compressed if sikistir else np.savez)(f, **veri)
+    os.replace(gecici, dosya)
+
+
+def npz_yukle(dosya: str) -> Tuple[Dict[str, np.ndarray], dict]:
+    """npz_kaydet ile yazılmış dosyayı (sütunlar, meta) olarak oku"""
+    with np.load(dosya, allow_pickle=False) as npz:
+        sutunlar = {ad: npz[ad] for ad in npz.files if ad != META_ANAHTARI}
+        meta = json.loads(str(npz[META_ANAHTARI]))
+    if meta.get('surum') != SURUM:
+        raise ValueError(f"Desteklenmeyen kontrol noktası sürümü: {meta.get('surum')}")
+    return sutunlar, meta
+
+
+def onekle(onek: str, sutunlar: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    return {f'{onek}.{ad}': dizi for ad, dizi in sutunlar.items()}
+
+
+def onek_ayikla(onek: str, sutunlar: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    bas = onek + '.'
+    return {ad[len(bas):]: dizi for ad, dizi in sutunlar.items() if ad.startswith(bas)}
+
+
+class KontrolNoktalari:
+    """Periyodik, dönüşümlü kontrol noktası dosyaları
+
+    Hedef nesne `zaman`, `durum_al() -> (sutunlar, meta)` ve
+    `durum_yukle(sutunlar, meta)` sağlar. Her `aralik` tickte bir
+    `klasor/onek_<tick>.npz` yazılır ve yalnızca son `saklanan` dosya tutulur.
+    """
+
+    def __init__(self, klasor: str = "kontrol_noktalari", onek: str = "simulasyon",
+                 aralik: int = 3600, saklanan: int = 3, sikistir: bool = True):
+        self.klasor = klasor
+        self.onek = onek
+        self.aralik = max(1, int(aralik))
+        self.saklanan = max(1, int(saklanan))
+        self.sikistir = sikistir
+        self._son_kayit = None
+        self._desen = re.compile(re.escape(onek) + r'_(\d+)\.npz$')
+
+    def gerekirse_kaydet(self, hedef) -> Optional[str]:
+        """Zaman aralığın katıysa kaydet; yazılan dosyanın yolunu döndür"""
+        if hedef.zaman % self.aralik or hedef.zaman == self._son_kayit:
+            return None
+        return self.kaydet(hedef)
+
+    def kaydet(self, hedef) -> str:
+        """Hemen kaydet ve eski dosyaları döndür"""
+        os.makedirs(self.klasor, exist_ok=True)
+        dosya = os.path.join(self.klasor, f"{self.onek}_{hedef.zaman:010d}.npz")
+        sutunlar, meta = hedef.durum_al()
+        npz_kaydet(dosya, sutunlar, meta, self.sikistir)
+        self._son_kayit = hedef.zaman
+        for eski in self.dosyalar()[:-self.saklanan]:
+            os.remove(eski)
+        return dosya
+
+    def dosyalar(self) -> List[str]:
+        """Mevcut kontrol noktaları, eskiden yeniye"""
+        adaylar = glob.glob(os.path.join(glob.escape(self.klasor), f"{glob.escape(self.onek)}_*.npz"))
+        eslesen = []
+        for dosya in adaylar:
+            m = self._desen.match(os.path.basename(dosya))
+            if m:
+                eslesen.append((int(m.group(1)), dosya))
+        return [dosya for _, dosya in sorted(eslesen)]
+
+    def en_son(self) -> Optional[str]:
+        dosyalar = self.dosyalar()
+        return dosyalar[-1] if dosyalar else None
+
+    def geri_yukle(self, hedef, dosya: Optional[str] = None) -> Optional[str]:
+        """Verilen (ya da en son) kontrol noktasını hedefe yükle"""
+        dosya = dosya or self.en_son()
+        if dosya is None:
+            return None
+        sutunlar, meta = npz_yukle(dosya)
+        hedef.durum_yukle(sutunlar, meta)
+        self._son_kayit = hedef.zaman
+        return dosya
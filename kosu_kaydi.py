@@ -0,0 +1,193 @@
+import json
+import os
+import queue
+import struct
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+SURUM = 1
+SIHIRLI = b'KOSUKYT1'
+# Parça başlığı: işaret, satır sayısı, ilk zaman, son zaman
+PARCA = struct.Struct('<4sIqq')
+PARCA_ISARETI = b'PRC0'
+
+
+def yeni_dosya_adi(klasor: str, onek: str, zaman: int = 0) -> str:
+    """`klasor/onek_<tarih>_<tick>.kayit`; aynı ad varsa sonuna sayı eklenir"""
+    os.makedirs(klasor, exist_ok=True)
+    kok = os.path.join(klasor, f"{onek}_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{zaman:010d}")
+    dosya, i = kok + '.kayit', 1
+    while os.path.exists(dosya):
+        dosya, i = f"{kok}_{i}.kayit", i + 1
+    return dosya
+
+
+class KosuKaydedici:
+    """Yalnızca sona eklenen, parça parça yazılan koşu kaydı
+
+    Her `ekle` çağrısı önceden ayrılmış tampona bir satır yazar; tampon
+    `parca_boyu` satıra ulaşınca arka plandaki yazıcı iş parçacığına
+    devredilir ve yerine yenisi açılır. Yazıcı her parçayı tamponlu
+    olarak yazar, ardından `fsync` ile diske indirir; süreç çökerse en
+    fazla son yarım parça kaybolur.
+
+    Dosya biçimi: `SIHIRLI`, 4 baytlık uzunluk ve JSON başlık (alanlar,
+    meta); ardından parçalar. Her parça `PARCA` başlığı ve sütun sıralı
+    float64 veriden (önce zaman, sonra alanlar) oluşur, böylece okuyucu
+    yalnızca istenen parçaların istenen sütunlarını okuyabilir.
+    """
+
+    def __init__(self, dosya: str, alanlar: Sequence[str], parca_boyu: int = 600, meta: dict = None,
+                 kuyruk_boyu: int = 8):
+        self.dosya = dosya
+        self.alanlar = list(alanlar)
+        self._sutun_no = {ad: 1 + j for j, ad in enumerate(self.alanlar)}
+        self.parca_boyu = max(1, int(parca_boyu))
+        self.hata: Optional[Exception] = None
+        self.parca_sayisi = 0
+        self._tampon = self._yeni_tampon()
+        self._n = 0
+
+        baslik = json.dumps({'surum': SURUM, 'alanlar': self.alanlar, 'meta': meta or {}},
+                            ensure_ascii=False).encode('utf-8')
+        self._f = open(dosya, 'wb', buffering=1 << 20)
+        self._f.write(SIHIRLI + struct.pack('<I', len(baslik)) + baslik)
+        self._f.flush()
+        os.fsync(self._f.fileno())
+
+        # Dolu kuyruk ana döngüyü yavaşlatır ama bellek sınırsız büyümez
+        self._kuyruk: queue.Queue = queue.Queue(maxsize=kuyruk_boyu)
+        self._yazici = threading.Thread(target=self._yaz, name="kosu-kaydi", daemon=True)
+        self._yazici.start()
+
+    def _yeni_tampon(self) -> np.ndarray:
+        return np.full((self.parca_boyu, 1 + len(self.alanlar)), np.nan)
+
+    def ekle(self, zaman: int, kayit: Dict[str, float]):
+        """Bir tick'in değerlerini ekle (eksik alanlar NaN kalır)"""
+        satir = self._tampon[self._n]
+        satir[0] = zaman
+        for ad, deger in kayit.items():
+            satir[self._sutun_no[ad]] = deger
+        self._n += 1
+        if self._n == self.parca_boyu:
+            self._gonder()
+
+    def _gonder(self):
+        if self._n == 0 or self._f is None:
+            return
+        self._kuyruk.put(self._tampon[:self._n])
+        self._tampon = self._yeni_tampon()
+        self._n = 0
+
+    def bosalt(self, bekle: bool = False):
+        """Yarım parçayı hemen yazıcıya ver (`bekle` ise diske inene kadar bekle)"""
+        self._gonder()
+        if bekle:
+            self._kuyruk.join()
+
+    def _yaz(self):
+        while True:
+            parca = self._kuyruk.get()
+            try:
+                if parca is None:
+                    return
+                if self.hata is None:
+                    self._parca_yaz(parca)
+            except OSError as e:
+                self.hata = e
+                print(f"Koşu kaydı yazma hatası ({self.dosya}): {e}")
+            finally:
+                self._kuyruk.task_done()
+
+    def _parca_yaz(self, parca: np.ndarray):
+        zaman = parca[:, 0]
+        self._f.write(PARCA.pack(PARCA_ISARETI, len(parca), int(zaman[0]), int(zaman[-1])))
+        self._f.write(np.asfortranarray(parca, dtype='<f8').tobytes(order='F'))
+        self._f.flush()
+        os.fsync(self._f.fileno())
+        self.parca_sayisi += 1
+
+    def kapat(self):
+        """Kalan satırları yaz, yazıcıyı durdur ve dosyayı kapat (boş kalan dosya silinir)"""
+        if self._f is None:
+            return
+        self._gonder()
+        self._kuyruk.put(None)
+        self._yazici.join()
+        self._f.close()
+        self._f = None
+        if self.parca_sayisi == 0 and self.hata is None:
+            os.remove(self.dosya)
+
+
+class KosuOkuyucu:
+    """KosuKaydedici dosyasını okur
+
+    Açılışta yalnızca başlık ve parça başlıkları okunur (her parça için
+    24 bayt); `pencere` istenen zaman aralığıyla kesişen parçaların
+    istenen sütunlarını okur. Çökme sonucu yarım kalmış son parça yok
+    sayılır.
+    """
+
+    def __init__(self, dosya: str):
+        self.dosya = dosya
+        with open(dosya, 'rb') as f:
+            if f.read(len(SIHIRLI)) != SIHIRLI:
+                raise ValueError(f"Koşu kaydı değil: {dosya}")
+            uzunluk, = struct.unpack('<I', f.read(4))
+            baslik = json.loads(f.read(uzunluk).decode('utf-8'))
+            if baslik.get('surum') != SURUM:
+                raise ValueError(f"Desteklenmeyen koşu kaydı sürümü: {baslik.get('surum')}")
+            self.alanlar: List[str] = baslik['alanlar']
+            self.meta: dict = baslik['meta']
+
+            # Parça dizini: (ilk zaman, son zaman, satır sayısı, verinin ofseti)
+            sutun_sayisi = 1 + len(self.alanlar)
+            boyut = os.fstat(f.fileno()).st_size
+            ofset = f.tell()
+            dizin = []
+            while ofset + PARCA.size <= boyut:
+                f.seek(ofset)
+                isaret, n, ilk, son = PARCA.unpack(f.read(PARCA.size))
+                veri_ofseti = ofset + PARCA.size
+                if isaret != PARCA_ISARETI or veri_ofseti + n * sutun_sayisi * 8 > boyut:
+                    break
+                dizin.append((ilk, son, n, veri_ofseti))
+                ofset = veri_ofseti + n * sutun_sayisi * 8
+        self._dizin = np.array(dizin, dtype=np.int64).reshape(-1, 4)
+
+    def __len__(self) -> int:
+        return int(self._dizin[:, 2].sum())
+
+    def zaman_araligi(self) -> Optional[tuple]:
+        """Kayıttaki (ilk, son) zaman; kayıt boşsa None"""
+        if len(self._dizin) == 0:
+            return None
+        return int(self._dizin[0, 0]), int(self._dizin[-1, 1])
+
+    def pencere(self, bas: float = None, son: float = None, alanlar: Sequence[str] = None) -> Dict[str, np.ndarray]:
+        """[bas, son] zaman aralığındaki satırlar; sonuç 'zaman' sütununu da içerir"""
+        alanlar = list(self.alanlar if alanlar is None else alanlar)
+        sutunlar = [1 + self.alanlar.index(ad) for ad in alanlar]
+        dizin = self._dizin
+        # Parçalar zamana göre sıralı: kesişenleri ikili aramayla bul
+        i = 0 if bas is None else int(np.searchsorted(dizin[:, 1], bas, side='left'))
+        j = len(dizin) if son is None else int(np.searchsorted(dizin[:, 0], son, side='right'))
+
+        parcalar = {ad: [] for ad in ['zaman'] + alanlar}
+        with open(self.dosya, 'rb') as f:
+            for _, _, n, ofset in dizin[i:j].tolist():
+                for ad, sutun in zip(parcalar, [0] + sutunlar):
+                    f.seek(ofset + sutun * n * 8)
+                    parcalar[ad].append(np.fromfile(f, dtype='<f8', count=n))
+        sonuc = {ad: np.concatenate(p) if p else np.empty(0) for ad, p in parcalar.items()}
+        secili = np.ones(len(sonuc['zaman']), dtype=bool)
+        if bas is not None:
+            secili &= sonuc['zaman'] >= bas
+        if son is not None:
+            secili &= sonuc['zaman'] <= son
+        return {ad: dizi[secili] for ad, dizi in sonuc.items()}
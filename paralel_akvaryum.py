@@ -0,0 +1,291 @@
+import math
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context, shared_memory
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from balik_dizisi import SAYISAL_ALANLAR, KOD_ALANLARI, BALIK_HAREKETI, HareketKurallari, hareket_cekirdegi
+from uzamsal_indeks import UzamsalIzgara
+
+# Hareket çekirdeğinin okuduğu/yazdığı sütunlar
+HAREKET_ALANLARI = ('x', 'y', 'yon_x', 'yon_y', 'hiz', 'boyut', 'enerji', 'yas', 'hamile', 'hamilelik_suresi',
+                    'hayatta', 'hastalık', 'dayaniklilik', 'davranis', 'renk')
+
+# Tick başı görüntüsü: karolar ve halo ızgaraları bu kopyadan kurulur;
+# 'anlik_sira' canlı satırların karo numarasına göre (karo içinde artan) sırasıdır
+ANLIK_ALANLAR = {'anlik_x': np.float64, 'anlik_y': np.float64, 'anlik_hayatta': np.bool_,
+                 'anlik_yon_x': np.float64, 'anlik_yon_y': np.float64, 'anlik_sira': np.int64}
+
+# Sütun başlangıçları önbellek satırı sınırına hizalanır
+HIZALAMA = 64
+
+
+def _yerlesim(kapasite: int) -> Tuple[Dict[str, Tuple[int, np.dtype]], int]:
+    """Bloktaki sütunların (ofset, tip) yerleşimi ve toplam boyut"""
+    alanlar = [(ad, np.dtype(tip)) for ad, tip in SAYISAL_ALANLAR.items()]
+    alanlar += [(ad, np.dtype(np.int8)) for ad in KOD_ALANLARI]
+    alanlar += [(ad, np.dtype(tip)) for ad, tip in ANLIK_ALANLAR.items()]
+    yerler = {}
+    ofset = 0
+    for ad, tip in alanlar:
+        yerler[ad] = (ofset, tip)
+        ofset += -(-kapasite * tip.itemsize // HIZALAMA) * HIZALAMA
+    return yerler, ofset
+
+
+class _Blok(shared_memory.SharedMemory):
+    """Görünümleri yaşarken silinebilen paylaşımlı bellek bloğu
+
+    Sütunlar np.frombuffer ile açılır ve tamponu dışa aktarılmış tutar;
+    bu yüzden görünümler yaşadıkça close() BufferError verir ve harita,
+    son görünüm bırakılana kadar onların üzerinden açık kalır.
+    """
+
+    def __del__(self):
+        try:
+            self.close()
+        except BufferError:
+            pass
+
+
+def _gorunumler(blok: shared_memory.SharedMemory, kapasite: int) -> Dict[str, np.ndarray]:
+    yerler, _ = _yerlesim(kapasite)
+    return {ad: np.frombuffer(blok.buf, dtype=tip, count=kapasite, offset=ofset)
+            for ad, (ofset, tip) in yerler.items()}
+
+
+class PaylasimliSutunlar:
+    """BalikDizisi sütunlarını paylaşımlı bellekte ayıran ayırıcı
+
+    `BalikDizisi(..., ayirici=PaylasimliSutunlar())` ile kullanılır. Her
+    kapasite değişiminde tüm sütunlar (ve tick başı görüntüsü) için tek blok
+    açılır; işçi süreçler bloğa adıyla bağlanır. Eski blok hemen silinir
+    (unlink); belleği, kalan görünümler bırakılınca geri verilir.
+    """
+
+    def __init__(self):
+        self.blok: Optional[_Blok] = None
+        self.kapasite = 0
+        self.sutunlar: Dict[str, np.ndarray] = {}
+
+    def __call__(self, kapasite: int) -> Dict[str, np.ndarray]:
+        _, boyut = _yerlesim(kapasite)
+        blok = _Blok(create=True, size=max(1, boyut))
+        self.kapat()
+        self.blok = blok
+        self.kapasite = kapasite
+        self.sutunlar = _gorunumler(blok, kapasite)
+        return {ad: self.sutunlar[ad] for ad in tuple(SAYISAL_ALANLAR) + KOD_ALANLARI}
+
+    def kapat(self):
+        self.sutunlar = {}
+        if self.blok is not None:
+            self.blok.unlink()
+            self.blok = None
+
+
+class HaloIzgarasi(UzamsalIzgara):
+    """Bir karonun ve çevresindeki halo şeridinin uzamsal ızgarası
+
+    Izgara yalnızca karo + halo dikdörtgenini (`kutu`: sol, üst, sağ, alt)
+    kaplar. Halo genişliğine kadar olan sorgular (rakip araması) tüm
+    balıklarla kurulmuş ızgarayla aynı sonucu verir. Sınırsız en yakın komşu
+    aramasında bulunan aday halodan uzaksa daha yakını karo dışında
+    olabilir; bu sorgular ilk gerektiğinde tüm dünya için kurulan tam
+    ızgaraya sorulur.
+    """
+
+    def __init__(self, genislik: int, yukseklik: int, halo: float, tum_canlilar: np.ndarray,
+                 kutu: Tuple[float, float, float, float] = None):
+        sol, ust, sag, alt = kutu or (0.0, 0.0, genislik, yukseklik)
+        super().__init__(sag - sol, alt - ust, halo, sol, ust)
+        self.dunya = (genislik, yukseklik)
+        self.halo = halo
+        self.tum_canlilar = tum_canlilar
+        self._tam: Optional[UzamsalIzgara] = None
+
+    def en_yakin(self, x: float, y: float, yaricap: float = math.inf,
+                 haric: int = -1) -> Tuple[int, float]:
+        indeks, mesafe = super().en_yakin(x, y, yaricap, haric)
+        if mesafe <= self.halo or yaricap <= self.halo:
+            return indeks, mesafe
+        return self._tam_izgara().en_yakin(x, y, yaricap, haric)
+
+    def toplu_en_yakin(self, qx, qy, haric=None) -> Tuple[np.ndarray, np.ndarray]:
+        indeksler, mesafeler = super().toplu_en_yakin(qx, qy, haric)
+        uzak = np.flatnonzero(mesafeler > self.halo)
+        if len(uzak):
+            haric = None if haric is None else np.asarray(haric)[uzak]
+            indeksler[uzak], mesafeler[uzak] = self._tam_izgara().toplu_en_yakin(
+                np.asarray(qx)[uzak], np.asarray(qy)[uzak], haric)
+        return indeksler, mesafeler
+
+    def _tam_izgara(self) -> UzamsalIzgara:
+        if self._tam is None:
+            self._tam = UzamsalIzgara(*self.dunya, self.hucre_boyutu)
+            self._tam.yeniden_olustur(self.xs, self.ys, aktif=self.tum_canlilar)
+        return self._tam
+
+
+def karo_duzeni(genislik: int, yukseklik: int, sayi: int) -> Tuple[int, int]:
+    """`sayi` karoyu dünyanın en-boy oranına uyan sx × sy ızgarasına böl"""
+    sx = max(1, min(sayi, round(math.sqrt(sayi * genislik / yukseklik))))
+    return sx, max(1, math.ceil(sayi / sx))
+
+
+def karo_sinirlari(genislik: int, yukseklik: int, duzen: Tuple[int, int]) -> List[Tuple[float, float, float, float]]:
+    """Karoların (x_bas, x_son, y_bas, y_son) sınırları; dış kenarlar sonsuza açılır"""
+    xs = np.linspace(0, genislik, duzen[0] + 1)
+    ys = np.linspace(0, yukseklik, duzen[1] + 1)
+    xs[0], xs[-1] = -math.inf, math.inf
+    ys[0], ys[-1] = -math.inf, math.inf
+    return [(float(xs[i]), float(xs[i + 1]), float(ys[j]), float(ys[j + 1]))
+            for j in range(duzen[1]) for i in range(duzen[0])]
+
+
+def karo_hareket_ettir(sutunlar: Dict[str, np.ndarray], karo: Tuple[float, float, float, float],
+                       araliklar: List[Tuple[int, int]], tohum: int, n: int, genislik: int, yukseklik: int,
+                       halo: float, hiz_carpani: float, rakip_mesafesi: float, sosyal_kodu: int, agresif_kodu: int,
+                       suru_yaricapi: float = 0.0, kurallar: HareketKurallari = BALIK_HAREKETI) -> Tuple[int, int]:
+    """Tick başında karoda bulunan canlı balıkları hareket ettir
+
+    `araliklar`, karoya göre sıralı `anlik_sira` dizisinde önce bu karonun,
+    sonra halosuna değen komşu karoların (baş, son) dilimleridir; böylece
+    çağrı tüm popülasyonu değil yalnızca karo ve komşularındaki balıkları
+    okur. Karonun sahibi olduğu satırlar yalnızca bu çağrı tarafından
+    yazılır; komşu konumları tick başı görüntüsünden kurulan, karo + halo
+    boyutundaki ızgaradan okunur. Karo sınırını geçen balık bir sonraki
+    tick komşu karoya geçer. (hareket eden, ölen) sayılarını döndürür.
+    """
+    x0 = sutunlar['anlik_x'][:n]
+    y0 = sutunlar['anlik_y'][:n]
+    sira = sutunlar['anlik_sira']
+    x_bas, x_son, y_bas, y_son = karo
+
+    bas, son = araliklar[0]
+    satirlar = sira[bas:son]
+    if len(satirlar) == 0:
+        return 0, 0
+    adaylar = np.concatenate([sira[b:s] for b, s in araliklar])
+    ax, ay = x0[adaylar], y0[adaylar]
+    cevre = np.sort(adaylar[(ax >= x_bas - halo) & (ax < x_son + halo) & (ay >= y_bas - halo) & (ay < y_son + halo)])
+    kutu = (max(x_bas - halo, 0.0), max(y_bas - halo, 0.0), min(x_son + halo, genislik), min(y_son + halo, yukseklik))
+    izgara = HaloIzgarasi(genislik, yukseklik, halo, sutunlar['anlik_hayatta'][:n], kutu)
+    izgara.yeniden_olustur(x0, y0, indeksler=cevre, etiketler=sutunlar['renk'][:n],
+                           yonler=(sutunlar['anlik_yon_x'][:n], sutunlar['anlik_yon_y'][:n]))
+
+    s = {ad: sutunlar[ad][:n] for ad in HAREKET_ALANLARI}
+    hareket_cekirdegi(s, satirlar, genislik, yukseklik, hiz_carpani, izgara, rakip_mesafesi,
+                      np.random.default_rng(tohum), sosyal_kodu, agresif_kodu, suru_yaricapi, kurallar)
+    return len(satirlar), int(np.count_nonzero(~s['hayatta'][satirlar]))
+
+
+# İşçi sürecin bağlı olduğu blok: (ad, blok, görünümler)
+_BAGLI = [None, None, None]
+
+
+def _karo_gorevi(gorev: tuple) -> Tuple[int, int]:
+    """İşçi süreçte çalışır: bloğa (gerekirse yeniden) bağlan ve karoyu işle"""
+    blok_adi, kapasite, *argumanlar = gorev
+    if _BAGLI[0] != blok_adi:
+        blok = _Blok(name=blok_adi)
+        _BAGLI[:] = [blok_adi, blok, _gorunumler(blok, kapasite)]
+    return karo_hareket_ettir(_BAGLI[2], *argumanlar)
+
+
+def _havuzu_kapat(havuz: Optional[ProcessPoolExecutor], bellek: PaylasimliSutunlar):
+    if havuz is not None:
+        havuz.shutdown(wait=True, cancel_futures=True)
+    bellek.kapat()
+
+
+class ParalelHareket:
+    """Balık hareketini dünya karolarına bölüp işçi süreçlerde çalıştırır
+
+    Balık sütunları `bellek` ayırıcısıyla paylaşımlı bellekte tutulur
+    (BalikDizisi'nin `ayirici`'sı olarak). Her tick ana süreç konum ve canlılık
+    görüntüsünü alır; her karo, tick başında içinde bulunan balıkların
+    sahibidir ve onları karo + `halo` şeridinden kurduğu kendi ızgarasıyla
+    hareket ettirir. Sınırı geçen balık bir sonraki tick yeni karosuna
+    geçmiş olur; ayrıca mesaj gerekmez. Seçilim, yem, üreme ve istatistikler
+    ana süreçte aynı sütunlar üzerinde vektörel çalışır.
+
+    Her karonun rastgele adımları o tick için `rng`'den çekilen kendi
+    tohumundan gelir; bu yüzden sonuç işçi sayısından bağımsızdır, yalnızca
+    karo düzenine bağlıdır. `isci_sayisi` 0 ise karolar bu süreçte sırayla
+    işlenir (aynı sonuç, karşılaştırma için).
+    """
+
+    def __init__(self, genislik: int, yukseklik: int, isci_sayisi: int = 0,
+                 karolar: Tuple[int, int] = None, halo: float = 90.0):
+        self.genislik = genislik
+        self.yukseklik = yukseklik
+        self.halo = halo
+        self.isci_sayisi = isci_sayisi
+        self.karo_duzeni = tuple(karolar or karo_duzeni(genislik, yukseklik, max(1, 4 * isci_sayisi)))
+        self.karolar = karo_sinirlari(genislik, yukseklik, self.karo_duzeni)
+        # Karo numarası için iç sınırlar ve her karonun halosuna değen komşu karolar (kendisi önce)
+        sx, sy = self.karo_duzeni
+        self._x_sinirlari = np.array([self.karolar[i][1] for i in range(sx - 1)])
+        self._y_sinirlari = np.array([self.karolar[j * sx][3] for j in range(sy - 1)])
+        self._komsular = [[k] + [i for i, (a0, a1, b0, b1) in enumerate(self.karolar)
+                                 if i != k and a0 < x1 + halo and a1 > x0 - halo and b0 < y1 + halo and b1 > y0 - halo]
+                          for k, (x0, x1, y0, y1) in enumerate(self.karolar)]
+        self.bellek = PaylasimliSutunlar()
+        self.havuz = None
+        if isci_sayisi > 0:
+            self.havuz = ProcessPoolExecutor(isci_sayisi, mp_context=get_context('spawn'))
+        # Son tickin karolardan toplanan sayıları
+        self.son_tick = {'hareket_eden': 0, 'olen': 0, 'en_kalabalik_karo': 0}
+        self._kapatici = weakref.finalize(self, _havuzu_kapat, self.havuz, self.bellek)
+
+    def hareket_et(self, dizi, su_ortami, rakip_mesafesi: float, rng: np.random.Generator,
+                   suru_yaricapi: float = 0.0, kurallar: HareketKurallari = BALIK_HAREKETI):
+        """BalikDizisi.hareket_et'in karolara bölünmüş karşılığı
+
+        Sürü yarıçapı halodan büyük olamaz: komşu özetleri yalnızca halo
+        ızgarasından hesaplanır.
+        """
+        if suru_yaricapi > self.halo:
+            raise ValueError(f"Sürü yarıçapı ({suru_yaricapi}) halo genişliğini ({self.halo}) aşamaz")
+        n = dizi.n
+        if n == 0:
+            return
+        sutunlar = self.bellek.sutunlar
+        for ad in ('x', 'y', 'hayatta', 'yon_x', 'yon_y'):
+            np.copyto(sutunlar['anlik_' + ad][:n], dizi.sutun(ad))
+
+        # Canlı satırları karo numarasına göre kovala (ölüler son kovaya); her
+        # karo yalnızca kendi ve komşularının dilimlerini okur
+        x, y = dizi.sutun('x'), dizi.sutun('y')
+        karo_no = (np.searchsorted(self._y_sinirlari, y, side='right') * self.karo_duzeni[0]
+                   + np.searchsorted(self._x_sinirlari, x, side='right'))
+        karo_no[~dizi.sutun('hayatta')] = len(self.karolar)
+        sira = np.argsort(karo_no, kind='stable')
+        sutunlar['anlik_sira'][:n] = sira
+        sinirlar = np.concatenate(([0], np.cumsum(np.bincount(karo_no, minlength=len(self.karolar) + 1)))).tolist()
+        araliklar = [[(sinirlar[k], sinirlar[k + 1]) for k in komsular] for komsular in self._komsular]
+
+        tohumlar = rng.integers(0, 2**63 - 1, size=len(self.karolar)).tolist()
+        ortak = (n, self.genislik, self.yukseklik, self.halo, kurallar.hiz_carpani(su_ortami),
+                 rakip_mesafesi) + dizi.davranis_kodlari() + (suru_yaricapi, kurallar)
+        if self.havuz is None:
+            sonuclar = [karo_hareket_ettir(sutunlar, karo, aralik, tohum, *ortak)
+                        for karo, aralik, tohum in zip(self.karolar, araliklar, tohumlar)]
+        else:
+            blok = (self.bellek.blok.name, self.bellek.kapasite)
+            sonuclar = list(self.havuz.map(_karo_gorevi, [blok + (karo, aralik, tohum) + ortak
+                                                          for karo, aralik, tohum
+                                                          in zip(self.karolar, araliklar, tohumlar)]))
+
+        self.son_tick = {
+            'hareket_eden': sum(s[0] for s in sonuclar),
+            'olen': sum(s[1] for s in sonuclar),
+            'en_kalabalik_karo': max(s[0] for s in sonuclar),
+        }
+
+    def kapat(self):
+        """İşçileri durdur ve paylaşımlı belleği bırak"""
+        self._kapatici()
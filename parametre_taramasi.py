@@ -0,0 +1,291 @@
+import argparse
+import json
+import os
+import sys
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import replace
+from datetime import datetime
+from itertools import product
+from multiprocessing import get_context
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+import numpy as np
+
+from bocek_motoru import BocekMotoru, BOCEK_TANIMI
+from rastgele import RastgeleServisi
+
+SURUM = 1
+TARAMA_UZANTISI = '.tarama'
+VARSAYILAN_KLASOR = "taramalar"
+
+# Taranabilen parametreler ve varsayılanları (BOCEK_TANIMI'ndan)
+PARAMETRELER = {
+    'bocek': BOCEK_TANIMI.baslangic_sayilari[0],
+    'yem': BOCEK_TANIMI.baslangic_sayilari[1],
+    'avci': BOCEK_TANIMI.baslangic_sayilari[2],
+    'renk_mutasyonu': BOCEK_TANIMI.ureme.mutasyon['renk'],
+    'tur_mutasyonu': BOCEK_TANIMI.ureme.mutasyon['tur'],
+    'davranis_mutasyonu': BOCEK_TANIMI.ureme.mutasyon['davranis'],
+}
+
+
+def hucre_anahtari(parametreler: Dict[str, float]) -> str:
+    """Parametre hücresinin sıradan bağımsız metin anahtarı"""
+    return json.dumps(parametreler, sort_keys=True)
+
+
+def hucre_etiketi(parametreler: Dict[str, float]) -> str:
+    return ",".join(f"{ad}={deger}" for ad, deger in parametreler.items())
+
+
+def kosu_tohumu(taban_tohum: int, parametreler: Dict[str, float], tekrar: int) -> np.random.SeedSequence:
+    """Hücre ve tekrar numarasından türetilen tohum
+
+    Izgaradaki sıradan bağımsızdır: ızgaraya değer eklemek ya da taramayı
+    sürdürmek aynı hücrenin aynı tekrarının tohumunu değiştirmez.
+    """
+    return np.random.SeedSequence(
+        taban_tohum, spawn_key=(zlib.crc32(hucre_anahtari(parametreler).encode('utf-8')), tekrar))
+
+
+# Bir depodaki tüm koşularda aynı olması gereken ayarlar (hücre parametreleri dışında)
+TARAMA_AYARLARI = ('tohum', 'tick', 'ornek_araligi', 'genislik', 'yukseklik', 'dizi_deposu')
+
+
+class TaramaDeposu:
+    """Parametre taramasının tek dosyalık, yalnızca sona eklenen sonuç deposu
+
+    İlk satır taramanın ortak ayarlarıdır (tohum, tick, örnekleme aralığı,
+    dünya boyutu, depo türü); depo yalnızca aynı ayarlarla sürdürülebilir.
+    Sonraki her satır bir koşunun JSON kaydıdır: `meta` (parametreler,
+    tekrar ve ayarlar), `alanlar` ve örneklenmiş `sutunlar` (KosuOkuyucu
+    pencereleriyle aynı biçim). Satır yazılıp `fsync` edildikten sonra koşu
+    tamamlanmış sayılır; çökme sonucu yarım kalan son satır okunurken
+    atlanır ve ilk yazmadan önce kesilir, böylece kesilen tarama kaldığı
+    yerden sürdürülebilir. Okumak depoyu değiştirmez: süren bir taramanın
+    deposu analiz aracıyla güvenle okunabilir.
+    """
+
+    def __init__(self, dosya: str):
+        self.dosya = dosya
+        self._yazmaya_hazir = False
+
+    def _yarim_satiri_kes(self):
+        if not os.path.exists(self.dosya):
+            return
+        with open(self.dosya, 'rb+') as f:
+            veri = f.read()
+            son = veri.rfind(b'\n') + 1
+            if son != len(veri):
+                f.truncate(son)
+
+    def _satirlar(self) -> Iterator[dict]:
+        if not os.path.exists(self.dosya):
+            return
+        with open(self.dosya, 'r', encoding='utf-8') as f:
+            for satir in f:
+                if not satir.endswith('\n'):
+                    return  # yazılırken kesilmiş satır
+                yield json.loads(satir)
+
+    def ayarlar(self) -> Optional[dict]:
+        """Deponun ortak ayarları (depo boşsa None)"""
+        for kayit in self._satirlar():
+            if 'ayarlar' not in kayit:
+                raise ValueError(f"Tarama deposu ayar satırıyla başlamıyor: {self.dosya}")
+            if kayit.get('surum') != SURUM:
+                raise ValueError(f"Desteklenmeyen tarama deposu sürümü: {kayit.get('surum')}")
+            return kayit['ayarlar']
+        return None
+
+    def ayarlari_sabitle(self, ayarlar: dict):
+        """Boş depoya ayarları yaz; dolu depo farklı ayarlarla sürdürülmek istenirse ValueError"""
+        ayarlar = json.loads(json.dumps({ad: ayarlar[ad] for ad in TARAMA_AYARLARI}))
+        mevcut = self.ayarlar()
+        if mevcut is None:
+            self._satir_yaz({'surum': SURUM, 'ayarlar': ayarlar})
+        elif mevcut != ayarlar:
+            farklar = ", ".join(f"{ad}: {mevcut.get(ad)} -> {ayarlar[ad]}"
+                                for ad in TARAMA_AYARLARI if mevcut.get(ad) != ayarlar[ad])
+            raise ValueError(f"{self.dosya} farklı ayarlarla oluşturulmuş ({farklar}); "
+                             f"aynı ayarları verin ya da başka bir depo seçin")
+
+    def kosular(self) -> Iterator[dict]:
+        """Depodaki koşular, yazıldıkları sırayla"""
+        for kayit in self._satirlar():
+            if 'ayarlar' in kayit:
+                if kayit.get('surum') != SURUM:
+                    raise ValueError(f"Desteklenmeyen tarama deposu sürümü: {kayit.get('surum')}")
+                continue
+            yield kayit
+
+    def tamamlananlar(self) -> Set[Tuple[str, int]]:
+        """Tamamlanmış (hücre anahtarı, tekrar) çiftleri"""
+        return {(hucre_anahtari(k['meta']['parametreler']), k['meta']['tekrar']) for k in self.kosular()}
+
+    def ekle(self, kosu: dict):
+        self._satir_yaz(kosu)
+
+    def _satir_yaz(self, kayit: dict):
+        if not self._yazmaya_hazir:
+            os.makedirs(os.path.dirname(self.dosya) or '.', exist_ok=True)
+            self._yarim_satiri_kes()
+            self._yazmaya_hazir = True
+        with open(self.dosya, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(kayit, ensure_ascii=False) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+
+
+def tanim_olustur(parametreler: Dict[str, float]):
+    """Mutasyon oranları değiştirilmiş böcek türü tanımı"""
+    mutasyon = dict(BOCEK_TANIMI.ureme.mutasyon,
+                    renk=parametreler['renk_mutasyonu'],
+                    tur=parametreler['tur_mutasyonu'],
+                    davranis=parametreler['davranis_mutasyonu'])
+    return replace(BOCEK_TANIMI, ureme=replace(BOCEK_TANIMI.ureme, mutasyon=mutasyon))
+
+
+def kosu_calistir(ayar: dict) -> dict:
+    """Tek hücrenin tek tekrarını başsız çalıştır ve depo satırını döndür
+
+    İstatistikler her `ornek_araligi` tickte bir (ve son tickte) örneklenir.
+    """
+    parametreler = ayar['parametreler']
+    rastgele = RastgeleServisi(tohum_dizisi=kosu_tohumu(ayar['tohum'], parametreler, ayar['tekrar']))
+    motor = BocekMotoru(ayar['genislik'], ayar['yukseklik'], ayar['dizi_deposu'], rastgele=rastgele,
+                        tanim=tanim_olustur(parametreler))
+    motor.sessiz = True
+    bas = time.perf_counter()
+    motor.baslangic_olustur(int(parametreler['bocek']), int(parametreler['yem']), int(parametreler['avci']))
+
+    alanlar = motor.gecmis.alanlar + ['nesil']
+    satirlar = []
+    for _ in range(ayar['tick']):
+        motor.step()
+        zaman = motor.zaman - 1
+        if zaman % ayar['ornek_araligi'] == 0 or zaman == ayar['tick'] - 1:
+            kayit = motor.gecmis.son()
+            satirlar.append([zaman] + [kayit[ad] for ad in alanlar[:-1]] + [motor.nesil])
+    motor.kapat()
+
+    sutunlar = np.array(satirlar, dtype=float).reshape(-1, 1 + len(alanlar))
+    return {
+        'meta': {
+            'surum': SURUM,
+            'tur': motor.tanim.ad,
+            'parametreler': parametreler,
+            'tekrar': ayar['tekrar'],
+            'tohum': ayar['tohum'],
+            'tick': ayar['tick'],
+            'ornek_araligi': ayar['ornek_araligi'],
+            'dunya': [ayar['genislik'], ayar['yukseklik']],
+            'dizi_deposu': ayar['dizi_deposu'],
+            'sure_s': time.perf_counter() - bas,
+            'tarih': datetime.now().isoformat(timespec='seconds'),
+        },
+        'alanlar': alanlar,
+        'sutunlar': {ad: sutunlar[:, j].tolist() for j, ad in enumerate(['zaman'] + alanlar)},
+    }
+
+
+def hucreleri_olustur(izgara: Dict[str, list]) -> List[Dict[str, float]]:
+    """Parametre ızgarasının kartezyen çarpımı (verilmeyenler varsayılan değerde)"""
+    degerler = [izgara.get(ad, [varsayilan]) for ad, varsayilan in PARAMETRELER.items()]
+    return [dict(zip(PARAMETRELER, hucre)) for hucre in product(*degerler)]
+
+
+def tarama_calistir(depo: TaramaDeposu, hucreler: List[Dict[str, float]], tekrar: int = 3,
+                    isci_sayisi: int = None, ayri_surec: bool = True, **ortak) -> int:
+    """Depoda olmayan (hücre, tekrar) koşularını süreç havuzunda çalıştır
+
+    Biten her koşu hemen depoya eklenir; tarama kesilirse aynı depoyla ve
+    aynı `ortak` ayarlarla yeniden çağırmak yalnızca eksik koşuları
+    çalıştırır (ayarlar farklıysa ValueError). Çalıştırılan koşu sayısını
+    döndürür.
+    """
+    depo.ayarlari_sabitle(ortak)
+    tamamlanan = depo.tamamlananlar()
+    isler = [dict(ortak, parametreler=hucre, tekrar=t)
+             for hucre in hucreler for t in range(tekrar)
+             if (hucre_anahtari(hucre), t) not in tamamlanan]
+    toplam = len(hucreler) * tekrar
+    print(f"{toplam - len(isler)}/{toplam} koşu depoda, {len(isler)} koşu çalıştırılacak.")
+
+    def kaydet(i: int, kosu: dict):
+        depo.ekle(kosu)
+        meta = kosu['meta']
+        print(f"[{i}/{len(isler)}] {hucre_etiketi(meta['parametreler'])} #{meta['tekrar']}: "
+              f"son popülasyon {kosu['sutunlar']['populasyon'][-1]:.0f} ({meta['sure_s']:.1f} s)")
+
+    if not ayri_surec:
+        for i, is_ in enumerate(isler, 1):
+            kaydet(i, kosu_calistir(is_))
+        return len(isler)
+
+    with ProcessPoolExecutor(isci_sayisi or os.cpu_count(), mp_context=get_context('spawn')) as havuz:
+        gelecekler = [havuz.submit(kosu_calistir, is_) for is_ in isler]
+        for i, gelecek in enumerate(as_completed(gelecekler), 1):
+            kaydet(i, gelecek.result())
+    return len(isler)
+
+
+def ozet_yazdir(depo: TaramaDeposu):
+    """Hücre başına son popülasyonun tekrarlar üzerinden ortalaması ve std'si"""
+    hucreler: Dict[str, list] = {}
+    for kosu in depo.kosular():
+        etiket = hucre_etiketi(kosu['meta']['parametreler'])
+        hucreler.setdefault(etiket, []).append(kosu['sutunlar']['populasyon'][-1])
+    print(f"\n{'hücre':<90}{'tekrar':>7}{'ort':>9}{'std':>9}")
+    for etiket, son in hucreler.items():
+        print(f"{etiket:<90}{len(son):>7}{np.mean(son):>9.1f}{np.std(son):>9.1f}")
+
+
+def _sayilar(metin: str) -> List[int]:
+    return [int(v) for v in metin.split(',') if v]
+
+
+def _oranlar(metin: str) -> List[float]:
+    return [float(v) for v in metin.split(',') if v]
+
+
+def main(argv=None) -> int:
+    ayristirici = argparse.ArgumentParser(description="Böcek simülasyonu parametre taraması (başsız)")
+    ayristirici.add_argument('--bocek', type=_sayilar, help="başlangıç popülasyonları, ör. 100,200,400")
+    ayristirici.add_argument('--avci', type=_sayilar, help="başlangıç avcı sayıları")
+    ayristirici.add_argument('--yem', type=_sayilar, help="yiyecek kaynağı sayıları")
+    ayristirici.add_argument('--renk-mutasyonu', type=_oranlar)
+    ayristirici.add_argument('--tur-mutasyonu', type=_oranlar)
+    ayristirici.add_argument('--davranis-mutasyonu', type=_oranlar)
+    ayristirici.add_argument('--tekrar', type=int, default=3, help="hücre başına tekrar sayısı")
+    ayristirici.add_argument('--tick', type=int, default=3000, help="koşu başına tick")
+    ayristirici.add_argument('--ornek-araligi', type=int, default=10, help="istatistiklerin örneklenme aralığı")
+    ayristirici.add_argument('--tohum', type=int, default=12345)
+    ayristirici.add_argument('--isci', type=int, help="süreç sayısı (varsayılan: çekirdek sayısı)")
+    ayristirici.add_argument('--ayni-surec', action='store_true', help="koşuları bu süreçte çalıştır")
+    ayristirici.add_argument('--dizi', action='store_true', help="NumPy sütun deposunu kullan")
+    ayristirici.add_argument('--dunya', default="1200x800", help="dünya boyutu GENxYUK")
+    ayristirici.add_argument('--cikti', default=os.path.join(VARSAYILAN_KLASOR, 'tarama' + TARAMA_UZANTISI),
+                             help="sonuç deposu; aynı depo ve ayarlarla yeniden çalıştırmak taramayı sürdürür")
+    ayar = ayristirici.parse_args(argv)
+
+    izgara = {ad: getattr(ayar, ad) for ad in PARAMETRELER if getattr(ayar, ad) is not None}
+    hucreler = hucreleri_olustur(izgara)
+    genislik, yukseklik = map(int, ayar.dunya.lower().split("x"))
+    depo = TaramaDeposu(ayar.cikti)
+    try:
+        tarama_calistir(depo, hucreler, ayar.tekrar, ayar.isci, ayri_surec=not ayar.ayni_surec,
+                        tick=ayar.tick, ornek_araligi=max(1, ayar.ornek_araligi), tohum=ayar.tohum,
+                        genislik=genislik, yukseklik=yukseklik, dizi_deposu=ayar.dizi)
+    except ValueError as e:
+        print(f"Tarama sürdürülemedi: {e}")
+        return 1
+    ozet_yazdir(depo)
+    print(f"\nSonuçlar {ayar.cikti} deposunda; SimulasyonAnalizi.veri_yukle ile okunabilir.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,280 @@
+import argparse
+import gc
+import json
+import math
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from itertools import product
+from multiprocessing import get_context
+from typing import List, Optional
+
+import numpy as np
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from akvaryum_motoru import AkvaryumMotoru
+from rastgele import RastgeleServisi
+
+SURUM = 1
+
+# Varsayılan ölçüm ızgarası (180 = baslangic_akvaryumu_olustur varsayılanı)
+BALIK_SAYILARI = (180, 1000, 10000, 100000)
+AVCI_SAYILARI = (2, 10, 50)
+YEM_SAYILARI = (12, 100, 500)
+
+# Karşılaştırılan ölçütler: (ad, büyüğü iyi mi)
+OLCUTLER = (('tps', True), ('tick_p95_ms', False), ('tepe_rss_mb', False), ('tick_basina_ayirma_kb', False))
+
+VARSAYILAN_KLASOR = "performans_sonuclari"
+
+
+def senaryo_adi(balik: int, avci: int, yem: int, kip: str, paralel: int = 0) -> str:
+    ad = f"{kip}_b{balik}_a{avci}_y{yem}"
+    return f"{ad}_p{paralel}" if paralel else ad
+
+
+def tepe_rss_mb() -> Optional[float]:
+    """Sürecin şimdiye kadarki en yüksek yerleşik belleği (MB)"""
+    if resource is not None:
+        tepe = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux KB, macOS bayt döndürür
+        return tepe / (1024 * 1024) if sys.platform == 'darwin' else tepe / 1024
+    try:
+        import psutil
+    except ImportError:
+        return None
+    bilgi = psutil.Process().memory_info()
+    return getattr(bilgi, 'peak_wset', bilgi.rss) / (1024 * 1024)
+
+
+def senaryo_calistir(ayar: dict) -> dict:
+    """Tek senaryoyu başsız çalıştır ve ölçümleri döndür
+
+    Dünya alanı `alan_olcekle` ile balık sayısına orantılı büyütülür, böylece
+    yoğunluk (ve komşu sayısı) 180 balıklık varsayılan akvaryumla aynı kalır.
+    Faz süreleri tick başına ortalamadır (üreme gibi seyrek fazlar dahil).
+    Süre ölçümünden sonra ayrı bir kısa koşu tracemalloc altında tekrarlanır;
+    izleme yükü tick sürelerine karışmaz. Paralel kipte tepe RSS ve ayırma
+    yalnızca ana süreci kapsar.
+    """
+    balik, avci, yem = ayar['balik'], ayar['avci'], ayar['yem']
+    olcek = math.sqrt(balik / BALIK_SAYILARI[0]) if ayar['alan_olcekle'] else 1.0
+    genislik, yukseklik = int(1200 * max(1.0, olcek)), int(800 * max(1.0, olcek))
+
+    gc.collect()
+    paralel = ayar.get('paralel', 0)
+    motor = AkvaryumMotoru(genislik, yukseklik, dizi_deposu=ayar['kip'] == 'dizi',
+                           rastgele=RastgeleServisi(ayar['tohum']), paralel=paralel)
+    bas = time.perf_counter()
+    motor.baslangic_akvaryumu_olustur(balik, yem, avci)
+    kurulum = time.perf_counter() - bas
+    motor.step(ayar['isinma'])
+
+    # Süre ölçümü: tick sayısına ya da süre bütçesine ulaşılana kadar
+    # (faz süreleri motorun kendi profilleyicisinden okunur)
+    motor.profil.sifirla()
+    tick_sureleri = []
+    bitis = time.perf_counter() + ayar['sure']
+    while len(tick_sureleri) < ayar['tick']:
+        bas = time.perf_counter()
+        motor._adim()
+        tick_sureleri.append(time.perf_counter() - bas)
+        if len(tick_sureleri) >= 3 and time.perf_counter() >= bitis:
+            break
+    fazlar = {ad: ist['toplam_s'] for ad, ist in motor.profil.ozet().items()}
+    tick_sureleri = np.array(tick_sureleri)
+    toplam = float(tick_sureleri.sum())
+    n = len(tick_sureleri)
+
+    # Ayırma ölçümü: tick içindeki geçici tepe bellek ve gen0 toplama sayısı
+    gen0 = [0]
+
+    def gc_say(evre, bilgi):
+        if evre == 'start' and bilgi['generation'] == 0:
+            gen0[0] += 1
+
+    ayirma_tepe = []
+    bloklar = sys.getallocatedblocks()
+    gc.callbacks.append(gc_say)
+    tracemalloc.start()
+    try:
+        for _ in range(ayar['bellek_tick']):
+            once, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            motor._adim()
+            _, tepe = tracemalloc.get_traced_memory()
+            ayirma_tepe.append(tepe - once)
+    finally:
+        tracemalloc.stop()
+        gc.callbacks.remove(gc_say)
+    bellek_tick = max(1, ayar['bellek_tick'])
+    motor.kapat()
+
+    return {
+        'ad': senaryo_adi(balik, avci, yem, ayar['kip'], paralel),
+        'balik': balik, 'avci': avci, 'yem': yem, 'kip': ayar['kip'], 'paralel': paralel,
+        'dunya': [genislik, yukseklik],
+        'tick': n,
+        'kurulum_s': kurulum,
+        'tps': n / toplam if toplam > 0 else float('inf'),
+        'tick_ort_ms': 1000 * toplam / n,
+        'tick_p50_ms': 1000 * float(np.percentile(tick_sureleri, 50)),
+        'tick_p95_ms': 1000 * float(np.percentile(tick_sureleri, 95)),
+        'tick_max_ms': 1000 * float(tick_sureleri.max()),
+        'fazlar_ms': {ad: 1000 * sure / n for ad, sure in fazlar.items()},
+        'tepe_rss_mb': tepe_rss_mb(),
+        'tick_basina_ayirma_kb': float(np.mean(ayirma_tepe)) / 1024 if ayirma_tepe else 0.0,
+        'tick_basina_gc0': gen0[0] / bellek_tick,
+        'tick_basina_net_blok': (sys.getallocatedblocks() - bloklar) / bellek_tick,
+        'son_populasyon': motor.sayaclar.sayi,
+    }
+
+
+def senaryolari_olustur(baliklar, avcilar, yemler, kip='dizi', paraleller=(0,), **ortak) -> List[dict]:
+    return [dict(ortak, balik=b, avci=a, yem=y, kip=kip, paralel=p)
+            for b, a, y, p in product(baliklar, avcilar, yemler, paraleller)]
+
+
+def hepsini_calistir(senaryolar: List[dict], ayri_surec: bool = True) -> List[dict]:
+    """Senaryoları sırayla çalıştır
+
+    Her senaryo varsayılan olarak kendi (spawn) sürecinde koşar; böylece
+    tepe RSS önceki senaryolardan etkilenmez.
+    """
+    sonuclar = []
+    for i, ayar in enumerate(senaryolar, 1):
+        ad = senaryo_adi(ayar['balik'], ayar['avci'], ayar['yem'], ayar['kip'], ayar.get('paralel', 0))
+        print(f"[{i}/{len(senaryolar)}] {ad} ...", end=" ", flush=True)
+        if ayri_surec:
+            with ProcessPoolExecutor(1, mp_context=get_context('spawn')) as havuz:
+                sonuc = havuz.submit(senaryo_calistir, ayar).result()
+        else:
+            sonuc = senaryo_calistir(ayar)
+        print(f"{sonuc['tps']:.1f} tick/s, p95 {sonuc['tick_p95_ms']:.1f} ms")
+        sonuclar.append(sonuc)
+    return sonuclar
+
+
+def karsilastir(sonuclar: List[dict], taban: dict, tolerans: float = 0.15) -> List[dict]:
+    """Tabana göre `tolerans` oranından fazla kötüleşen ölçütleri döndür"""
+    taban_senaryolari = {s['ad']: s for s in taban.get('senaryolar', [])}
+    gerilemeler = []
+    for sonuc in sonuclar:
+        eski = taban_senaryolari.get(sonuc['ad'])
+        if eski is None:
+            continue
+        for olcut, buyuk_iyi in OLCUTLER:
+            once, simdi = eski.get(olcut), sonuc.get(olcut)
+            if not once or simdi is None:
+                continue
+            oran = simdi / once
+            if (oran < 1 - tolerans) if buyuk_iyi else (oran > 1 + tolerans):
+                gerilemeler.append({'ad': sonuc['ad'], 'olcut': olcut, 'taban': once,
+                                    'simdi': simdi, 'oran': oran})
+    return gerilemeler
+
+
+def tablo_yazdir(sonuclar: List[dict]):
+    print(f"\n{'senaryo':<28}{'tick/s':>10}{'p95 ms':>10}{'RSS MB':>10}{'ayırma KB':>11}  en pahalı faz")
+    for s in sonuclar:
+        faz, ms = max(s['fazlar_ms'].items(), key=lambda kv: kv[1])
+        rss = f"{s['tepe_rss_mb']:.0f}" if s['tepe_rss_mb'] is not None else "-"
+        print(f"{s['ad']:<28}{s['tps']:>10.1f}{s['tick_p95_ms']:>10.2f}{rss:>10}"
+              f"{s['tick_basina_ayirma_kb']:>11.0f}  {faz} ({ms:.2f} ms)")
+
+
+def olceklenme_yazdir(sonuclar: List[dict]):
+    """Aynı senaryonun farklı işçi sayılarındaki tick/s değerlerini ilkine oranla"""
+    gruplar = {}
+    for s in sonuclar:
+        gruplar.setdefault(senaryo_adi(s['balik'], s['avci'], s['yem'], s['kip']), []).append(s)
+    gruplar = {ad: grup for ad, grup in gruplar.items() if len(grup) > 1}
+    if not gruplar:
+        return
+    print(f"\n{'senaryo':<28}{'işçi':>6}{'tick/s':>10}{'hızlanma':>10}")
+    for ad, grup in gruplar.items():
+        for s in grup:
+            print(f"{ad:<28}{s['paralel']:>6}{s['tps']:>10.1f}{s['tps'] / grup[0]['tps']:>9.2f}x")
+
+
+def _sayilar(metin: str) -> List[int]:
+    return [int(v) for v in metin.split(',') if v]
+
+
+def main(argv=None) -> int:
+    ayristirici = argparse.ArgumentParser(description="AkvaryumMotoru ölçeklenme ölçümü")
+    ayristirici.add_argument('--balik', type=_sayilar, default=list(BALIK_SAYILARI))
+    ayristirici.add_argument('--avci', type=_sayilar, default=list(AVCI_SAYILARI))
+    ayristirici.add_argument('--yem', type=_sayilar, default=list(YEM_SAYILARI))
+    ayristirici.add_argument('--kip', choices=('dizi', 'liste'), default='dizi',
+                             help="popülasyon deposu (liste kipi 10k üstünde çok yavaştır)")
+    ayristirici.add_argument('--paralel', type=_sayilar, default=[0],
+                             help="hareket için işçi süreç sayıları, ör. 1,8 (0: tek süreç; dizi kipini zorlar)")
+    ayristirici.add_argument('--hizli', action='store_true', help="yalnızca 180/1000 balık, 2 avcı, 12 yem")
+    ayristirici.add_argument('--tick', type=int, default=500, help="senaryo başına en çok ölçülen tick")
+    ayristirici.add_argument('--sure', type=float, default=5.0, help="senaryo başına süre bütçesi (s)")
+    ayristirici.add_argument('--isinma', type=int, default=20)
+    ayristirici.add_argument('--bellek-tick', type=int, default=5)
+    ayristirici.add_argument('--tohum', type=int, default=12345)
+    ayristirici.add_argument('--sabit-alan', action='store_true', help="dünyayı 1200x800'de tut")
+    ayristirici.add_argument('--ayni-surec', action='store_true', help="senaryoları bu süreçte çalıştır")
+    ayristirici.add_argument('--cikti', help="sonuç dosyası (varsayılan: performans_sonuclari/olcum_<zaman>.json)")
+    ayristirici.add_argument('--taban', default=os.path.join(VARSAYILAN_KLASOR, 'taban.json'))
+    ayristirici.add_argument('--taban-kaydet', action='store_true', help="sonuçları yeni taban olarak yaz")
+    ayristirici.add_argument('--tolerans', type=float, default=0.15)
+    ayar = ayristirici.parse_args(argv)
+
+    if ayar.hizli:
+        ayar.balik, ayar.avci, ayar.yem = [180, 1000], [2], [12]
+    senaryolar = senaryolari_olustur(
+        ayar.balik, ayar.avci, ayar.yem, ayar.kip, tick=ayar.tick, sure=ayar.sure, isinma=ayar.isinma,
+        bellek_tick=ayar.bellek_tick, tohum=ayar.tohum, alan_olcekle=not ayar.sabit_alan,
+        paraleller=ayar.paralel)
+    sonuclar = hepsini_calistir(senaryolar, ayri_surec=not ayar.ayni_surec)
+    tablo_yazdir(sonuclar)
+    olceklenme_yazdir(sonuclar)
+
+    veri = {
+        'surum': SURUM,
+        'tarih': datetime.now().isoformat(timespec='seconds'),
+        'ortam': {'python': platform.python_version(), 'numpy': np.__version__,
+                  'platform': platform.platform(), 'islemci': platform.processor() or platform.machine(),
+                  'cekirdek': os.cpu_count()},
+        'ayarlar': {k: v for k, v in vars(ayar).items() if k not in ('cikti', 'taban', 'taban_kaydet')},
+        'senaryolar': sonuclar,
+    }
+    cikti = ayar.cikti or os.path.join(
+        VARSAYILAN_KLASOR, f"olcum_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    os.makedirs(os.path.dirname(cikti) or '.', exist_ok=True)
+    with open(cikti, 'w', encoding='utf-8') as f:
+        json.dump(veri, f, indent=2, ensure_ascii=False)
+    print(f"\nSonuçlar {cikti} dosyasına yazıldı.")
+
+    gerilemeler = []
+    if os.path.exists(ayar.taban):
+        with open(ayar.taban, 'r', encoding='utf-8') as f:
+            gerilemeler = karsilastir(sonuclar, json.load(f), ayar.tolerans)
+        if gerilemeler:
+            print(f"\n⚠ {len(gerilemeler)} gerileme (tolerans %{ayar.tolerans * 100:.0f}):")
+            for g in gerilemeler:
+                print(f"  {g['ad']:<28}{g['olcut']:<24}{g['taban']:>10.2f} -> {g['simdi']:>10.2f} (x{g['oran']:.2f})")
+        else:
+            print(f"Tabana ({ayar.taban}) göre gerileme yok.")
+    if ayar.taban_kaydet:
+        os.makedirs(os.path.dirname(ayar.taban) or '.', exist_ok=True)
+        with open(ayar.taban, 'w', encoding='utf-8') as f:
+            json.dump(veri, f, indent=2, ensure_ascii=False)
+        print(f"Taban {ayar.taban} olarak kaydedildi.")
+    return 1 if gerilemeler else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+import numpy as np
+from typing import Dict, Iterable, Sequence
+
+# Canlı balıklar üzerinden toplamı tutulan özellikler
+TOPLAM_ALANLARI = ('zeka', 'guc', 'dayaniklilik', 'mutasyon_sayisi')
+
+
+class PopulasyonSayaclari:
+    """Canlı balıklar için artımlı sayaçlar
+
+    Doğum ve ölüm anlarında güncellenir; böylece istatistikler ve bilgi
+    paneli her tick popülasyonu baştan taramak yerine sayaçları O(1)'de
+    okur. Balığın genetik özellikleri doğumdan sonra değişmediği için
+    toplamlar yalnızca bu iki olayda değişir.
+    """
+
+    def __init__(self, kategoriler: Dict[str, Sequence]):
+        self.kategoriler = {ad: list(degerler) for ad, degerler in kategoriler.items()}
+        self._kodlar = {ad: {deger: i for i, deger in enumerate(degerler)}
+                        for ad, degerler in self.kategoriler.items()}
+        self.sifirla()
+
+    def sifirla(self):
+        """Tüm sayaçları sıfırla"""
+        self.sayi = 0
+        self._sayimlar = {ad: np.zeros(len(degerler), dtype=np.int64)
+                          for ad, degerler in self.kategoriler.items()}
+        self._toplamlar = dict.fromkeys(TOPLAM_ALANLARI, 0.0)
+
+    def yeniden_say(self, baliklar: Iterable):
+        """Sayaçları popülasyondan baştan kur (yeniden başlatma ve doğrulama için)"""
+        self.sifirla()
+        for balik in baliklar:
+            if balik.hayatta:
+                self.ekle(balik)
+
+    # --- Olaylar --------------------------------------------------------
+
+    def ekle(self, balik, isaret: int = 1):
+        """Doğum: balığı sayaçlara ekle"""
+        self.sayi += isaret
+        for ad, kodlar in self._kodlar.items():
+            self._sayimlar[ad][kodlar[getattr(balik, ad)]] += isaret
+        for ad in TOPLAM_ALANLARI:
+            self._toplamlar[ad] += isaret * getattr(balik, ad)
+
+    def cikar(self, balik):
+        """Ölüm: balığı sayaçlardan düş"""
+        self.ekle(balik, -1)
+
+    def dizi_guncelle(self, dizi, indeksler: np.ndarray, isaret: int = 1):
+        """BalikDizisi satırlarını toplu olarak ekle (+1) ya da çıkar (-1)"""
+        if len(indeksler) == 0:
+            return
+        self.sayi += isaret * len(indeksler)
+        for ad, degerler in self.kategoriler.items():
+            ceviri = np.zeros(len(degerler), dtype=np.intp)
+            for kod, deger in enumerate(degerler):
+                ceviri[dizi.kod(ad, deger)] = kod
+            kodlar = ceviri[dizi.sutun(ad)[indeksler]]
+            self._sayimlar[ad] += isaret * np.bincount(kodlar, minlength=len(degerler))
+        for ad in TOPLAM_ALANLARI:
+            self._toplamlar[ad] += isaret * float(dizi.sutun(ad)[indeksler].sum())
+
+    def durum(self) -> Dict[str, np.ndarray]:
+        """Sayaçların tam hali (kontrol noktası için)"""
+        durum = {'sayi': np.array(self.sayi)}
+        for ad, sayimlar in self._sayimlar.items():
+            durum[f'sayim.{ad}'] = sayimlar
+        for ad, toplam in self._toplamlar.items():
+            durum[f'toplam.{ad}'] = np.array(toplam)
+        return durum
+
+    def durumu_yukle(self, durum: Dict[str, np.ndarray]):
+        self.sayi = int(durum['sayi'])
+        for ad in self._sayimlar:
+            self._sayimlar[ad] = durum[f'sayim.{ad}'].astype(np.int64)
+        for ad in self._toplamlar:
+            self._toplamlar[ad] = float(durum[f'toplam.{ad}'])
+
+    # --- Okuma ----------------------------------------------------------
+
+    def sayim(self, ad: str, deger) -> int:
+        """Bir kategorideki canlı balık sayısı"""
+        return int(self._sayimlar[ad][self._kodlar[ad][deger]])
+
+    def dagilim(self, ad: str) -> Dict:
+        """Kategori değeri -> canlı balık sayısı"""
+        return {deger: int(sayi) for deger, sayi in zip(self.kategoriler[ad], self._sayimlar[ad])}
+
+    def toplam(self, ad: str) -> float:
+        return self._toplamlar[ad]
+
+    def ortalama(self, ad: str) -> float:
+        """Canlı balıklar üzerinden özellik ortalaması"""
+        if self.sayi <= 0:
+            return 0
+        return self._toplamlar[ad] / self.sayi
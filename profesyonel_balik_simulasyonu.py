@@ -10,6 +10,8 @@ from dataclasses import dataclass
 from typing import List, Dict
 import json
 from datetime import datetime
+from rastgele import RastgeleServisi
+from faz_profilleyici import FazProfilleyici
 
 @dataclass
 class BalikParametreleri:
@@ -52,10 +54,16 @@ class BalikBireyi:
             return 1.0
 
 class EvrimSimulasyonu:
-    """Ana evrim simülasyonu sınıfı"""
+    """Ana evrim simülasyonu sınıfı
+
+    Popülasyon rastgeleliği `rastgele` servisinin akışlarından çekilir;
+    balık panelindeki konum titreşimi yalnızca görseldir ve global
+    `random` ile kalır.
+    """
     
-    def __init__(self):
+    def __init__(self, rastgele: RastgeleServisi = None):
         self.parametreler = BalikParametreleri()
+        self.rastgele = rastgele or RastgeleServisi()
         self.populasyon: List[BalikBireyi] = []
         self.nesil = 0
         self.calisir = False
@@ -66,6 +74,11 @@ class EvrimSimulasyonu:
         self.allel_frekanslari = []
         self.fitness_verileri = []
         
+        # Döngü fazlarının süreleri (Veri Kaydet ile CSV olarak da yazılır)
+        self.profil = FazProfilleyici()
+        self.profil.sar(self, 'populasyon_dinamikleri_uygula', 'genetik_suruklenme_uygula', 'mutasyon_uygula',
+                        'ureme_gerceklestir', 'verileri_kaydet', 'grafikleri_guncelle')
+        
         self.arayuz_olustur()
         
     def arayuz_olustur(self):
@@ -321,6 +334,7 @@ class EvrimSimulasyonu:
         
     def baslangic_populasyonu_olustur(self):
         """Başlangıç popülasyonunu oluştur"""
+        r = self.rastgele.baslangic
         self.populasyon.clear()
         self.nesil = 0
         self.nesil_verileri.clear()
@@ -338,7 +352,7 @@ class EvrimSimulasyonu:
         
         for i in range(self.parametreler.populasyon_sayisi):
             # Genotip belirleme
-            rand = random.random()
+            rand = r.random()
             if rand < kk_freq:
                 genotip = "KK"
             elif rand < kk_freq + kb_freq:
@@ -346,7 +360,7 @@ class EvrimSimulasyonu:
             else:
                 genotip = "BB"
             
-            birey = BalikBireyi(genotip, "disi" if random.random() < 0.5 else "erkek")
+            birey = BalikBireyi(genotip, "disi" if r.random() < 0.5 else "erkek")
             self.populasyon.append(birey)
         
         self.verileri_kaydet()
@@ -412,7 +426,7 @@ class EvrimSimulasyonu:
         olecek_sayi = int(mevcut_populasyon * self.parametreler.olum_orani)
         if olecek_sayi > 0 and olecek_sayi < mevcut_populasyon:
             # Güvenli şekilde rastgele bireyler seç ve çıkar
-            olecek_indeksler = random.sample(range(mevcut_populasyon), olecek_sayi)
+            olecek_indeksler = self.rastgele.secilim.sample(range(mevcut_populasyon), olecek_sayi)
             olecek_indeksler.sort(reverse=True)  # Büyükten küçüğe sırala
             
             for indeks in olecek_indeksler:
@@ -422,19 +436,21 @@ class EvrimSimulasyonu:
         # Doğum (yeni bireyler eklenir)
         if len(self.populasyon) >= 2:  # En az 2 birey olmalı
             dogacak_sayi = int(mevcut_populasyon * self.parametreler.dogum_orani)
+            r = self.rastgele.ureme
             for _ in range(dogacak_sayi):
                 # Mevcut popülasyondan rastgele iki ebeveyn seç
-                ebeveyn1 = random.choice(self.populasyon)
-                ebeveyn2 = random.choice(self.populasyon)
+                ebeveyn1 = r.choice(self.populasyon)
+                ebeveyn2 = r.choice(self.populasyon)
                 
                 yeni_genotip = self.genotip_olustur(ebeveyn1.genotip, ebeveyn2.genotip)
-                yeni_cinsiyet = "disi" if random.random() < 0.5 else "erkek"
+                yeni_cinsiyet = "disi" if r.random() < 0.5 else "erkek"
                 
                 yeni_birey = BalikBireyi(yeni_genotip, yeni_cinsiyet)
                 self.populasyon.append(yeni_birey)
     
     def genetik_suruklenme_uygula(self):
         """Genetik sürüklenme - rastgele değişimler"""
+        r = self.rastgele.ureme
         if self.parametreler.genetik_suruklenme <= 0:
             return
             
@@ -444,21 +460,22 @@ class EvrimSimulasyonu:
         for _ in range(degisecek_sayi):
             if self.populasyon:
                 # Rastgele bir birey seç
-                birey = random.choice(self.populasyon)
+                birey = r.choice(self.populasyon)
                 
                 # Rastgele yeni genotip ver
-                rastgele_genotip = random.choice(["KK", "KB", "BB"])
+                rastgele_genotip = r.choice(["KK", "KB", "BB"])
                 birey.genotip = rastgele_genotip
     
     def mutasyon_uygula(self):
         """Mutasyon işlemini uygula"""
+        r = self.rastgele.ureme
         for birey in self.populasyon:
-            if random.random() < self.parametreler.mutasyon_orani:
+            if r.random() < self.parametreler.mutasyon_orani:
                 # Mutasyon gerçekleşir
                 yeni_genotip = ""
                 
                 for allel in birey.genotip:
-                    if random.random() < 0.5:  # %50 şansla allel değişir
+                    if r.random() < 0.5:  # %50 şansla allel değişir
                         if allel == "K":
                             yeni_genotip += "B"
                         else:
@@ -470,6 +487,7 @@ class EvrimSimulasyonu:
         
     def ureme_gerceklestir(self):
         """Üreme işlemini gerçekleştir - Sadeleştirilmiş"""
+        r = self.rastgele.ureme
         if len(self.populasyon) < 2:
             return
             
@@ -478,25 +496,27 @@ class EvrimSimulasyonu:
         
         for _ in range(yavru_sayisi):
             # Rastgele iki ebeveyn seç
-            ebeveyn1 = random.choice(self.populasyon)
-            ebeveyn2 = random.choice(self.populasyon)
+            ebeveyn1 = r.choice(self.populasyon)
+            ebeveyn2 = r.choice(self.populasyon)
             
             # Yavru oluştur
             yavru_genotip = self.genotip_olustur(ebeveyn1.genotip, ebeveyn2.genotip)
-            yavru_cinsiyet = "disi" if random.random() < 0.5 else "erkek"
+            yavru_cinsiyet = "disi" if r.random() < 0.5 else "erkek"
             
             yavru = BalikBireyi(yavru_genotip, yavru_cinsiyet)
             self.populasyon.append(yavru)
         
     def genotip_olustur(self, anne_genotip: str, baba_genotip: str) -> str:
         """İki ebeveynden yavru genotipi oluştur"""
+        r = self.rastgele.ureme
+
         # Anne'den allel
         if anne_genotip == "KK":
             anne_allel = "K"
         elif anne_genotip == "BB":
             anne_allel = "B"
         else:  # KB
-            anne_allel = random.choice(["K", "B"])
+            anne_allel = r.choice(["K", "B"])
             
         # Baba'dan allel
         if baba_genotip == "KK":
@@ -504,7 +524,7 @@ class EvrimSimulasyonu:
         elif baba_genotip == "BB":
             baba_allel = "B"
         else:  # KB
-            baba_allel = random.choice(["K", "B"])
+            baba_allel = r.choice(["K", "B"])
         
         # Genotip oluştur
         alleller = sorted([anne_allel, baba_allel], reverse=True)
@@ -780,7 +800,9 @@ class EvrimSimulasyonu:
         try:
             with open(dosya_adi, 'w', encoding='utf-8') as f:
                 json.dump(veri, f, indent=2, ensure_ascii=False)
-            messagebox.showinfo("Başarılı", f"Veriler {dosya_adi} dosyasına kaydedildi.")
+            profil_dosyasi = self.profil.csv_kaydet(f"evrim_faz_profili_{zaman_damgasi}.csv")
+            messagebox.showinfo("Başarılı", f"Veriler {dosya_adi} dosyasına, faz süreleri "
+                                            f"{profil_dosyasi} dosyasına kaydedildi.")
         except Exception as e:
             messagebox.showerror("Hata", f"Veri kaydetme hatası: {e}")
             
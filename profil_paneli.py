@@ -0,0 +1,60 @@
+import pygame
+from typing import Optional, Tuple
+from faz_profilleyici import FazProfilleyici
+
+
+class ProfilPaneli:
+    """Faz profilini gösteren yarı saydam pygame paneli
+
+    Panel yüzeyi her `guncelleme_araligi` saniyede bir yeniden çizilir,
+    arada önbellekteki yüzey bliti yapılır; böylece panel kendi ölçtüğü
+    çizim fazına fark edilir yük eklemez. Çubuklar `butce_ms` (varsayılan
+    60 fps kare bütçesi) ölçeğindedir: dolu kısım p50, ince çizgi p95.
+    """
+
+    def __init__(self, font: pygame.font.Font, genislik: int = 420, guncelleme_araligi: float = 0.25,
+                 butce_ms: float = 1000 / 60):
+        self.font = font
+        self.genislik = genislik
+        self.guncelleme_araligi = guncelleme_araligi
+        self.butce_ms = butce_ms
+        self._yuzey: Optional[pygame.Surface] = None
+        self._son = None
+
+    def ciz(self, ekran: pygame.Surface, profil: FazProfilleyici, konum: Tuple[int, int]):
+        simdi = profil.saat()
+        if self._yuzey is None or simdi - self._son >= self.guncelleme_araligi:
+            self._yuzey = self._olustur(profil)
+            self._son = simdi
+        ekran.blit(self._yuzey, konum)
+
+    def _olustur(self, profil: FazProfilleyici) -> pygame.Surface:
+        ozet = profil.ozet()
+        satir = 22
+        yuzey = pygame.Surface((self.genislik, 60 + satir * len(ozet) + 24), pygame.SRCALPHA)
+        yuzey.fill((0, 0, 0, 170))
+
+        beyaz, gri = (255, 255, 255), (180, 180, 180)
+        sutunlar = (130, 185, 240)
+        cubuk_x, cubuk_genislik = 295, self.genislik - 305
+        yuzey.blit(self.font.render("Faz Profili (ms)", True, (255, 255, 0)), (10, 8))
+        for x, baslik in zip(sutunlar, ("p50", "p95", "maks")):
+            yuzey.blit(self.font.render(baslik, True, gri), (x, 34))
+
+        y = 56
+        for ad, ist in ozet.items():
+            yuzey.blit(self.font.render(ad, True, beyaz), (10, y))
+            for x, anahtar in zip(sutunlar, ('p50', 'p95', 'maks')):
+                yuzey.blit(self.font.render(f"{ist[anahtar]:.2f}", True, beyaz), (x, y))
+            # p50 dolu çubuk, p95 işareti; bütçeyi aşan kısım kırmızı
+            oran50 = min(1.0, ist['p50'] / self.butce_ms)
+            oran95 = min(1.0, ist['p95'] / self.butce_ms)
+            renk = (220, 60, 60) if ist['p95'] > self.butce_ms else (80, 200, 120)
+            pygame.draw.rect(yuzey, (60, 60, 60), (cubuk_x, y + 4, cubuk_genislik, 10))
+            pygame.draw.rect(yuzey, renk, (cubuk_x, y + 4, max(1, int(cubuk_genislik * oran50)), 10))
+            isaret = cubuk_x + int(cubuk_genislik * oran95)
+            pygame.draw.line(yuzey, beyaz, (isaret, y + 1), (isaret, y + 16), 2)
+            y += satir
+
+        yuzey.blit(self.font.render(f"Çubuk ölçeği: {self.butce_ms:.1f} ms  |  P: CSV", True, gri), (10, y + 2))
+        return yuzey
@@ -0,0 +1,91 @@
+import random
+import zlib
+import numpy as np
+from typing import Dict, List, Optional
+
+# Motorların kullandığı alt sistem akışları
+AKISLAR = ('baslangic', 'hareket', 'secilim', 'ureme', 'ortam', 'felaket')
+
+
+class RastgeleAkisi(random.Random):
+    """Tek bir alt sistemin tohumlu rastgele sayı akışı
+
+    `random.Random` arayüzünü korur (uniform, randint, choice, gauss ...),
+    böylece tekil çekimler eski `random.*` çağrılarıyla aynı anlamda ve
+    aynı hızda kalır. Aynı SeedSequence'tan türetilen `np` üreteci
+    (numpy.random.Generator) dizi halindeki çekimler içindir.
+    """
+
+    def __init__(self, tohum_dizisi: np.random.SeedSequence):
+        super().__init__()
+        self.tohumla(tohum_dizisi)
+
+    def tohumla(self, tohum_dizisi: np.random.SeedSequence):
+        """Akışı `tohum_dizisi`nin başına al (aynı nesne, yeni dizi)"""
+        self.tohum_dizisi = tohum_dizisi
+        self.np = np.random.Generator(np.random.PCG64(tohum_dizisi))
+        self.seed(int.from_bytes(tohum_dizisi.generate_state(4, np.uint32).tobytes(), 'little'))
+
+    def durum(self) -> dict:
+        """JSON'a yazılabilir tam durum"""
+        surum, python_durumu, gauss = self.getstate()
+        return {'python': [surum, list(python_durumu), gauss], 'numpy': self.np.bit_generator.state}
+
+    def durumu_yukle(self, durum: dict):
+        surum, python_durumu, gauss = durum['python']
+        self.setstate((surum, tuple(python_durumu), gauss))
+        self.np.bit_generator.state = durum['numpy']
+
+
+class RastgeleServisi:
+    """Simülasyonlar için tohumlu, bağımsız rastgele sayı akışları
+
+    Her alt sistem (hareket, seçilim, üreme, ortam, felaket, başlangıç)
+    kendi akışını kullanır; bir alt sistemdeki çekim sayısının değişmesi
+    diğerlerinin dizisini kaydırmaz. Akışlar adlarından türetildiği için
+    yeni bir akış eklemek mevcutları etkilemez. `tohum` verilmezse rastgele
+    seçilir ve `tohum` özniteliğinden okunup koşu yeniden üretilebilir.
+    Paralel işçiler için `cocuklar(n)` bağımsız alt servisler üretir.
+    """
+
+    def __init__(self, tohum: Optional[int] = None, tohum_dizisi: np.random.SeedSequence = None):
+        self.tohum_dizisi = tohum_dizisi or np.random.SeedSequence(tohum)
+        self.tohum = self.tohum_dizisi.entropy
+        self._akislar: Dict[str, RastgeleAkisi] = {}
+        # servis.hareket, servis.secilim ... kısayolları
+        for ad in AKISLAR:
+            setattr(self, ad, self.akis(ad))
+
+    def akis(self, ad: str) -> RastgeleAkisi:
+        """Adlı akışı döndür (yoksa oluştur)"""
+        if ad not in self._akislar:
+            self._akislar[ad] = RastgeleAkisi(self._akis_dizisi(ad))
+        return self._akislar[ad]
+
+    def _akis_dizisi(self, ad: str) -> np.random.SeedSequence:
+        kok = self.tohum_dizisi
+        return np.random.SeedSequence(kok.entropy, spawn_key=tuple(kok.spawn_key) + (zlib.crc32(ad.encode('utf-8')),))
+
+    def cocuklar(self, n: int) -> List['RastgeleServisi']:
+        """Paralel işçiler için bağımsız alt servisler"""
+        return [RastgeleServisi(tohum_dizisi=alt) for alt in self.tohum_dizisi.spawn(n)]
+
+    # --- Kontrol noktası -------------------------------------------------
+
+    def durum(self) -> dict:
+        return {ad: akis.durum() for ad, akis in self._akislar.items()}
+
+    def durumu_yukle(self, durum: dict):
+        for ad, akis_durumu in durum.items():
+            self.akis(ad).durumu_yukle(akis_durumu)
+
+    def tohumu_degistir(self, tohum: int):
+        """Servisi `tohum` köküne taşı (kontrol noktasından sürdürürken)
+
+        Akış nesneleri korunur, yalnızca yeniden tohumlanır; ardından
+        genellikle `durumu_yukle` ile kaydedilen konumlarına alınırlar.
+        """
+        self.tohum_dizisi = np.random.SeedSequence(tohum)
+        self.tohum = self.tohum_dizisi.entropy
+        for ad, akis in self._akislar.items():
+            akis.tohumla(self._akis_dizisi(ad))
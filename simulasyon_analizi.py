@@ -7,6 +7,8 @@ import glob
 import os
 from typing import List, Dict, Any
 import seaborn as sns
+from kosu_kaydi import KosuOkuyucu
+from parametre_taramasi import TaramaDeposu, TARAMA_UZANTISI, hucre_etiketi
 
 class SimulasyonAnalizi:
     """Simülasyon verilerini analiz etmek için araç"""
@@ -16,31 +18,81 @@ class SimulasyonAnalizi:
         self.dosya_adlari = []
         
     def veri_yukle(self, dosya_yolu: str = None):
-        """JSON verilerini yükle"""
+        """JSON verilerini, .kayit koşu kayıtlarını ya da .tarama depolarını yükle
+
+        Tarama deposundaki her koşu ayrı bir simülasyon olarak eklenir.
+        """
         if dosya_yolu:
             # Belirli dosya yükle
             try:
-                with open(dosya_yolu, 'r', encoding='utf-8') as f:
-                    veri = json.load(f)
-                    self.veriler.append(veri)
-                    self.dosya_adlari.append(dosya_yolu)
+                self._ekle(dosya_yolu)
                 print(f"Veri yüklendi: {dosya_yolu}")
             except Exception as e:
                 print(f"Veri yükleme hatası: {e}")
         else:
             # Tüm simulasyon verilerini yükle
-            dosyalar = glob.glob("simulasyon_verileri_*.json")
+            dosyalar = (glob.glob("simulasyon_verileri_*.json") + glob.glob(os.path.join("kosu_kayitlari", "*.kayit"))
+                        + glob.glob(os.path.join("taramalar", "*" + TARAMA_UZANTISI)))
             for dosya in dosyalar:
                 try:
-                    with open(dosya, 'r', encoding='utf-8') as f:
-                        veri = json.load(f)
-                        self.veriler.append(veri)
-                        self.dosya_adlari.append(dosya)
+                    self._ekle(dosya)
                 except Exception as e:
                     print(f"Dosya yükleme hatası ({dosya}): {e}")
             
             print(f"Toplam {len(self.veriler)} simülasyon verisi yüklendi.")
     
+    def _ekle(self, dosya_yolu: str):
+        if dosya_yolu.endswith(TARAMA_UZANTISI):
+            for veri in self.tarama_oku(dosya_yolu):
+                meta = veri['meta']
+                self.veriler.append(veri)
+                self.dosya_adlari.append(f"{dosya_yolu} [{hucre_etiketi(meta['parametreler'])} #{meta['tekrar']}]")
+        else:
+            self.veriler.append(self._dosya_oku(dosya_yolu))
+            self.dosya_adlari.append(dosya_yolu)
+    
+    @classmethod
+    def _dosya_oku(cls, dosya_yolu: str) -> Dict[str, Any]:
+        if dosya_yolu.endswith('.kayit'):
+            return cls.kosu_kaydi_oku(dosya_yolu)
+        with open(dosya_yolu, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    
+    @staticmethod
+    def kosu_kaydi_oku(dosya_yolu: str, bas: float = None, son: float = None) -> Dict[str, Any]:
+        """Koşu kaydını (isteğe bağlı [bas, son] zaman penceresiyle) eski JSON biçimine çevir"""
+        kayit = KosuOkuyucu(dosya_yolu)
+        return SimulasyonAnalizi.sutunlardan_veri(kayit.alanlar, kayit.pencere(bas, son), kayit.meta)
+    
+    @classmethod
+    def tarama_oku(cls, dosya_yolu: str) -> List[Dict[str, Any]]:
+        """Tarama deposundaki koşuları (meta'da parametreler ve tekrar ile) eski JSON biçimine çevir"""
+        return [cls.sutunlardan_veri(kosu['alanlar'], {ad: np.asarray(d) for ad, d in kosu['sutunlar'].items()},
+                                     kosu['meta'])
+                for kosu in TaramaDeposu(dosya_yolu).kosular()]
+    
+    @staticmethod
+    def sutunlardan_veri(alanlar: List[str], sutunlar: Dict[str, np.ndarray], meta: dict) -> Dict[str, Any]:
+        """Koşu kaydı sütunlarını ('zaman', 'populasyon', 'renk.*' ...) eski JSON biçimine çevir"""
+        def sozlukler(*onekler, tamsayi=False):
+            adlar = [(ad, ad.split('.', 1)[1]) for ad in alanlar if ad.split('.', 1)[0] in onekler]
+            degerler = [sutunlar[ad].astype(int) if tamsayi else sutunlar[ad] for ad, _ in adlar]
+            return [dict(zip((kisa for _, kisa in adlar), satir)) for satir in zip(*(d.tolist() for d in degerler))]
+        
+        populasyon = sutunlar['populasyon'].astype(int).tolist()
+        return {
+            'zaman': int(sutunlar['zaman'][-1]) + 1 if len(populasyon) else 0,
+            'nesil': int(sutunlar['nesil'][-1]) if len(populasyon) else 0,
+            'gecmis_zamani': sutunlar['zaman'].tolist(),
+            'populasyon_gecmisi': populasyon,
+            'renk_dagilimi_gecmisi': sozlukler('renk', tamsayi=True),
+            'tur_dagilimi_gecmisi': sozlukler('tur', tamsayi=True),
+            'cevre_gecmisi': sozlukler('cevre', 'su'),
+            'genetik_cesitlilik_gecmisi': sozlukler('genetik'),
+            'bocek_sayisi': populasyon[-1] if populasyon else 0,
+            'meta': meta,
+        }
+    
     def temel_istatistikler(self):
         """Temel istatistikleri göster"""
         if not self.veriler:
@@ -0,0 +1,142 @@
+import numpy as np
+from typing import Dict, Optional
+
+KAYITSIZ = -1  # Ebeveyni olmayan (kurucu) ya da henüz ölmemiş birey
+
+
+class SoyAgaci:
+    """Sütun tabanlı soy ağacı tablosu
+
+    Her doğum bir satırdır ve satır numarası bireyin tamsayı kimliğidir;
+    kimlikler böylece artan sırayla, çakışmadan verilir. Anne, baba,
+    doğum/ölüm tick'i ve nesil NumPy sütunlarında tutulur, yani ölen
+    balıkların nesneleri saklanmadan milyonlarca doğum üzerinde soy
+    analizi yapılabilir. Tek bireyin kayıtları O(1)'de okunur; ata ve
+    torun sorguları nesil nesil dizi olarak ilerler.
+    """
+    _SUTUNLAR = ('anne', 'baba', 'dogum', 'olum', 'nesil')
+
+    def __init__(self, kapasite: int = 1024):
+        self.n = 0
+        self._kapasite = 0
+        self.anne = np.empty(0, dtype=np.int32)
+        self.baba = np.empty(0, dtype=np.int32)
+        self.dogum = np.empty(0, dtype=np.int64)
+        self.olum = np.empty(0, dtype=np.int64)
+        self.nesil = np.empty(0, dtype=np.int32)
+        self._kapasiteyi_ayarla(max(1, kapasite))
+        self._cocuk_indeksi = None
+
+    def __len__(self) -> int:
+        return self.n
+
+    def _kapasiteyi_ayarla(self, yeni_kapasite: int):
+        for ad in self._SUTUNLAR:
+            eski = getattr(self, ad)
+            yeni = np.full(yeni_kapasite, KAYITSIZ, dtype=eski.dtype)
+            yeni[:self.n] = eski[:self.n]
+            setattr(self, ad, yeni)
+        self._kapasite = yeni_kapasite
+
+    def temizle(self):
+        self.n = 0
+        self._cocuk_indeksi = None
+
+    def durum(self) -> Dict[str, np.ndarray]:
+        """Kayıtlı satırlar (kontrol noktası için)"""
+        return {ad: getattr(self, ad)[:self.n] for ad in self._SUTUNLAR}
+
+    def durumu_yukle(self, durum: Dict[str, np.ndarray]):
+        self.temizle()
+        self.toplu_ekle(durum['anne'], durum['baba'], durum['dogum'], durum['nesil'])
+        self.olum[:self.n] = durum['olum']
+
+    # --- Kayıt ----------------------------------------------------------
+
+    def toplu_ekle(self, anneler, babalar, dogum: int, nesiller) -> np.ndarray:
+        """Doğumları kaydet ve yeni kimlikleri döndür"""
+        nesiller = np.asarray(nesiller)
+        m = len(nesiller)
+        bas, son = self.n, self.n + m
+        if son > self._kapasite:
+            self._kapasiteyi_ayarla(1 << (son - 1).bit_length())
+        self.anne[bas:son] = anneler
+        self.baba[bas:son] = babalar
+        self.dogum[bas:son] = dogum
+        self.olum[bas:son] = KAYITSIZ
+        self.nesil[bas:son] = nesiller
+        self.n = son
+        self._cocuk_indeksi = None
+        return np.arange(bas, son, dtype=np.int64)
+
+    def ekle(self, anne: int, baba: int, dogum: int, nesil: int) -> int:
+        """Tek doğumu kaydet"""
+        return int(self.toplu_ekle([anne], [baba], dogum, [nesil])[0])
+
+    def olum_kaydet(self, kimlikler, zaman: int):
+        """Ölüm tick'ini yaz (tek kimlik ya da dizi)"""
+        self.olum[kimlikler] = zaman
+
+    # --- Sorgular -------------------------------------------------------
+
+    def ebeveynler(self, kimlik: int):
+        return int(self.anne[kimlik]), int(self.baba[kimlik])
+
+    def canli_mi(self, kimlik: int) -> bool:
+        return bool(self.olum[kimlik] == KAYITSIZ)
+
+    def cocuk_sayilari(self) -> np.ndarray:
+        """Her bireyin doğrudan yavru sayısı"""
+        ebeveyn = np.concatenate((self.anne[:self.n], self.baba[:self.n]))
+        return np.bincount(ebeveyn[ebeveyn >= 0], minlength=self.n)
+
+    def atalar(self, kimlik: int, derinlik: Optional[int] = None) -> np.ndarray:
+        """Bireyin tüm (ya da `derinlik` nesil geriye kadar) ataları, sıralı"""
+        gorulen = np.zeros(self.n, dtype=bool)
+        sinir = np.array([kimlik], dtype=np.int64)
+        adim = 0
+        while len(sinir) and (derinlik is None or adim < derinlik):
+            ebeveyn = np.concatenate((self.anne[sinir], self.baba[sinir])).astype(np.int64)
+            ebeveyn = ebeveyn[ebeveyn >= 0]
+            sinir = np.unique(ebeveyn[~gorulen[ebeveyn]])
+            gorulen[sinir] = True
+            adim += 1
+        return np.flatnonzero(gorulen)
+
+    def torunlar(self, kimlik: int, derinlik: Optional[int] = None) -> np.ndarray:
+        """Bireyden gelen tüm (ya da `derinlik` nesil ileriye kadar) torunlar, sıralı"""
+        sirali, baslangic = self._cocuklar()
+        gorulen = np.zeros(self.n, dtype=bool)
+        sinir = np.array([kimlik], dtype=np.int64)
+        adim = 0
+        while len(sinir) and (derinlik is None or adim < derinlik):
+            bas = baslangic[sinir]
+            sayi = baslangic[sinir + 1] - bas
+            toplam = int(sayi.sum())
+            if toplam == 0:
+                break
+            ofset = np.arange(toplam) - np.repeat(np.cumsum(sayi) - sayi, sayi)
+            cocuk = sirali[np.repeat(bas, sayi) + ofset]
+            sinir = np.unique(cocuk[~gorulen[cocuk]])
+            gorulen[sinir] = True
+            adim += 1
+        return np.flatnonzero(gorulen)
+
+    def torun_sayisi(self, kimlik: int) -> int:
+        return len(self.torunlar(kimlik))
+
+    def _cocuklar(self):
+        """Ebeveyn -> çocuk sıralı indeksi (yeni doğumda geçersizlenir)"""
+        if self._cocuk_indeksi is None:
+            n = self.n
+            ebeveyn = np.concatenate((self.anne[:n], self.baba[:n])).astype(np.int64)
+            cocuk = np.concatenate((np.arange(n), np.arange(n)))
+            gecerli = ebeveyn >= 0
+            # Aynı ebeveyn iki kez (anne = baba) sayılmasın
+            gecerli[n:] &= self.baba[:n] != self.anne[:n]
+            ebeveyn, cocuk = ebeveyn[gecerli], cocuk[gecerli]
+            sira = np.argsort(ebeveyn, kind='stable')
+            baslangic = np.zeros(n + 1, dtype=np.int64)
+            np.cumsum(np.bincount(ebeveyn, minlength=n), out=baslangic[1:])
+            self._cocuk_indeksi = (cocuk[sira], baslangic)
+        return self._cocuk_indeksi
@@ -3,12 +3,12 @@ import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import tkinter as tk
 from tkinter import ttk, messagebox
-import random
 import math
 from dataclasses import dataclass
 from typing import List
 import json
 from datetime import datetime
+from rastgele import RastgeleServisi
 
 @dataclass
 class CevreselFaktorler:
@@ -23,8 +23,9 @@ class CevreselFaktorler:
 class OptimizeBalikPopulasyonu:
     """Spyder için optimize edilmiş balık popülasyonu"""
     
-    def __init__(self, baslangic_boyutu: int = 1000):
+    def __init__(self, baslangic_boyutu: int = 1000, rastgele: RastgeleServisi = None):
         self.baslangic_boyutu = baslangic_boyutu
+        self.rastgele = rastgele or RastgeleServisi()
         self.reset_populasyon()
         self.cevre = CevreselFaktorler()
         self.yil = 0
@@ -48,6 +49,7 @@ class OptimizeBalikPopulasyonu:
         
     def mevsimsel_etki_hesapla(self):
         """Mevsimsel faktörleri güncelle"""
+        r = self.rastgele.ortam
         mevsim_radyan = (self.mevsim / 4.0) * 2 * math.pi
         sicaklik_degisimi = self.cevre.sicaklik_varyasyon * math.cos(mevsim_radyan)
         mevcut_sicaklik = self.cevre.sicaklik_ortalama + sicaklik_degisimi
@@ -58,22 +60,23 @@ class OptimizeBalikPopulasyonu:
         self.cevre.besin_bolluğu = max(0.2, min(2.0, 
             self.cevre.besin_bolluğu * 0.9 + besin_carpani * 0.1))
         
-        self.cevre.kirlilik_seviyesi += random.uniform(-0.01, 0.01)
+        self.cevre.kirlilik_seviyesi += r.uniform(-0.01, 0.01)
         self.cevre.kirlilik_seviyesi = max(0.0, min(1.0, self.cevre.kirlilik_seviyesi))
         
         return mevcut_sicaklik
     
     def catastrofik_olay_kontrol(self):
         """Catastrofik olayları kontrol et"""
+        r = self.rastgele.felaket
         olay_listesi = []
         
-        if random.random() < 0.02:  # Hastalık
-            olum_orani = random.uniform(0.2, 0.5)
+        if r.random() < 0.02:  # Hastalık
+            olum_orani = r.uniform(0.2, 0.5)
             self.populasyon_azalt(olum_orani)
             olay_listesi.append(f"Hastalık Salgını - %{olum_orani*100:.1f} kayıp")
             
-        if random.random() < 0.015:  # Yırtıcı
-            yirtici_olum = random.uniform(0.15, 0.35)
+        if r.random() < 0.015:  # Yırtıcı
+            yirtici_olum = r.uniform(0.15, 0.35)
             kk_kayip = int(self.populasyon['KK'] * yirtici_olum * 1.2)
             kb_kayip = int(self.populasyon['KB'] * yirtici_olum * 1.0)
             bb_kayip = int(self.populasyon['BB'] * yirtici_olum * 0.8)
@@ -83,9 +86,9 @@ class OptimizeBalikPopulasyonu:
             self.populasyon['BB'] = max(0, self.populasyon['BB'] - bb_kayip)
             olay_listesi.append("Yırtıcı İstilası")
             
-        if random.random() < 0.008:  # İklim değişikliği
-            self.cevre.sicaklik_ortalama += random.uniform(-1, 2)
-            self.cevre.kirlilik_seviyesi += random.uniform(0.02, 0.08)
+        if r.random() < 0.008:  # İklim değişikliği
+            self.cevre.sicaklik_ortalama += r.uniform(-1, 2)
+            self.cevre.kirlilik_seviyesi += r.uniform(0.02, 0.08)
             olay_listesi.append("İklim Değişikliği")
             
         return olay_listesi
@@ -114,6 +117,7 @@ class OptimizeBalikPopulasyonu:
     
     def ureme_ve_sekillenme(self, sicaklik: float):
         """Üreme ve seçilim süreçleri"""
+        r = self.rastgele.ureme
         toplam = sum(self.populasyon.values())
         if toplam < 10:
             return
@@ -140,18 +144,19 @@ class OptimizeBalikPopulasyonu:
                 self.populasyon['BB'] = yeni_toplam - self.populasyon['KK'] - self.populasyon['KB']
         
         # Mutasyon
-        if random.random() < 0.05:
+        if r.random() < 0.05:
             self.basit_mutasyon()
     
     def basit_mutasyon(self):
         """Basit mutasyon işlemi"""
+        r = self.rastgele.ureme
         toplam = sum(self.populasyon.values())
         if toplam < 100:
             return
             
         degisim = max(1, int(toplam * 0.005))
         
-        if random.random() < 0.5:
+        if r.random() < 0.5:
             if self.populasyon['KK'] > degisim:
                 self.populasyon['KK'] -= degisim
                 self.populasyon['KB'] += degisim
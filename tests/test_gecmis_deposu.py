@@ -0,0 +1,51 @@
+import numpy as np
+
+from gecmis_deposu import GecmisDeposu
+
+
+def _doldur(depo: GecmisDeposu, bas: int, son: int):
+    for t in range(bas, son):
+        depo.kaydet(t, {'x': t, 'y': -t})
+
+
+def test_dusen_kayitlar_ozetlere_katlanir():
+    depo = GecmisDeposu(['x', 'y'], max_uzunluk=5, toplama_orani=2, seviye_sayisi=3)
+    _doldur(depo, 0, 30)
+
+    # Seviye 2: (0..3), (4..7), (8..11); yarım blok [12, 13]; seviye 1: 14..23
+    # çiftleri; yarım blok [24]; seviye 0: 25..29
+    zaman, ort = depo.seri('x')
+    np.testing.assert_array_equal(zaman, [0, 4, 8, 12, 14, 16, 18, 20, 22, 24, 25, 26, 27, 28, 29])
+    np.testing.assert_array_equal(ort, [1.5, 5.5, 9.5, 12.5, 14.5, 16.5, 18.5, 20.5, 22.5, 24, 25, 26, 27, 28, 29])
+    _, en_kucuk = depo.seri('x', 'min')
+    _, en_buyuk = depo.seri('y', 'max')
+    np.testing.assert_array_equal(en_kucuk[:4], [0, 4, 8, 12])
+    np.testing.assert_array_equal(en_buyuk[:4], [0, -4, -8, -12])
+
+    assert len(depo) == 5
+    assert depo.son() == {'x': 29.0, 'y': -29.0}
+    assert np.all(np.diff(zaman) > 0)
+
+
+def test_adim_ve_sinirsiz_kip():
+    depo = GecmisDeposu(['x', 'y'], adim=3)
+    assert [depo.kaydet(t, {'x': t}) for t in range(5)] == [True, False, False, True, False]
+    _doldur(depo, 5, 3000)
+    zaman, _ = depo.seri('x')
+    np.testing.assert_array_equal(zaman, np.arange(0, 3000, 3))
+    assert depo.bellek() >= len(depo) * 3 * 8
+
+
+def test_durum_gidis_donus():
+    depo = GecmisDeposu(['x', 'y'], max_uzunluk=5, toplama_orani=3, seviye_sayisi=3)
+    _doldur(depo, 0, 47)
+    kopya = GecmisDeposu(['x', 'y'], max_uzunluk=5, toplama_orani=3, seviye_sayisi=3)
+    kopya.durumu_yukle(depo.durum())
+
+    for d in (depo, kopya):
+        _doldur(d, 47, 90)
+    for ad in ('x', 'y'):
+        for istatistik in ('min', 'ort', 'max'):
+            for a, b in zip(depo.seri(ad, istatistik), kopya.seri(ad, istatistik)):
+                np.testing.assert_array_equal(a, b)
+    assert depo.son() == kopya.son()
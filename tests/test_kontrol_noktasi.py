@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from akvaryum_motoru import AkvaryumMotoru
+from kontrol_noktasi import KontrolNoktalari, npz_kaydet, npz_yukle
+from rastgele import RastgeleServisi
+
+
+def _motor(dizi_deposu: bool, tohum: int = 7) -> AkvaryumMotoru:
+    motor = AkvaryumMotoru(600, 400, dizi_deposu, rastgele=RastgeleServisi(tohum))
+    motor.sessiz = True
+    motor.baslangic_akvaryumu_olustur(60, 8, 1)
+    return motor
+
+
+def _esit(a: dict, b: dict) -> bool:
+    return a.keys() == b.keys() and all(np.array_equal(a[k], b[k]) for k in a)
+
+
+@pytest.mark.parametrize('dizi_deposu', [True, False])
+def test_kontrol_noktasindan_devam_ayni_kosuyu_verir(tmp_path, dizi_deposu):
+    motor = _motor(dizi_deposu)
+    motor.kontrol_noktalari = KontrolNoktalari(str(tmp_path), 'balik', aralik=40)
+    motor.step(50)
+    dosya = motor.kontrol_noktalari.en_son()
+    assert dosya.endswith('balik_0000000040.npz')
+
+    motor.kontrol_noktalari = None
+    motor.step(30)
+    devam = AkvaryumMotoru.kontrol_noktasindan(dosya)
+    devam.sessiz = True
+    assert devam.zaman == 40
+    assert devam.rastgele.tohum == 7
+    devam.step(40)
+
+    assert devam.zaman == motor.zaman
+    assert _esit(motor.durum_al()[0], devam.durum_al()[0])
+
+
+def test_yalnizca_son_noktalar_saklanir(tmp_path):
+    motor = _motor(True)
+    motor.kontrol_noktalari = KontrolNoktalari(str(tmp_path), 'balik', aralik=10, saklanan=2)
+    motor.step(45)
+    dosyalar = motor.kontrol_noktalari.dosyalar()
+    assert [f[-14:-4] for f in dosyalar] == ['0000000030', '0000000040']
+
+
+def test_npz_gidis_donus_ve_surum_denetimi(tmp_path):
+    dosya = str(tmp_path / 'nokta.npz')
+    sutunlar = {'a.x': np.arange(5.0), 'a.kod': np.array([1, 2], dtype=np.int8)}
+    npz_kaydet(dosya, sutunlar, {'zaman': 3, 'ad': 'akvaryum'})
+    okunan, meta = npz_yukle(dosya)
+    assert _esit(sutunlar, okunan)
+    assert meta['zaman'] == 3 and meta['ad'] == 'akvaryum'
+    assert not (tmp_path / 'nokta.npz.tmp').exists()
+
+    npz_kaydet(dosya, sutunlar, {})
+    with np.load(dosya) as npz:
+        veri = dict(npz)
+    veri['__meta__'] = np.array('{"surum": 99}')
+    np.savez(dosya, **veri)
+    with pytest.raises(ValueError):
+        npz_yukle(dosya)
@@ -0,0 +1,66 @@
+import os
+
+import numpy as np
+import pytest
+
+from kosu_kaydi import KosuKaydedici, KosuOkuyucu
+
+
+def _kayit_yaz(dosya: str, tick: int, parca_boyu: int = 10) -> KosuKaydedici:
+    kaydedici = KosuKaydedici(dosya, ['sayi', 'enerji'], parca_boyu=parca_boyu, meta={'tur': 'balik'})
+    for t in range(tick):
+        kaydedici.ekle(t, {'sayi': 100 + t, 'enerji': t / 2})
+    kaydedici.kapat()
+    return kaydedici
+
+
+def test_pencere_istenen_araligi_ve_alanlari_dondurur(tmp_path):
+    dosya = str(tmp_path / 'kosu.kayit')
+    _kayit_yaz(dosya, 35)
+    okuyucu = KosuOkuyucu(dosya)
+
+    assert len(okuyucu) == 35
+    assert okuyucu.zaman_araligi() == (0, 34)
+    assert okuyucu.meta == {'tur': 'balik'}
+
+    pencere = okuyucu.pencere(8, 21, alanlar=['sayi'])
+    assert set(pencere) == {'zaman', 'sayi'}
+    np.testing.assert_array_equal(pencere['zaman'], np.arange(8, 22))
+    np.testing.assert_array_equal(pencere['sayi'], np.arange(108, 122))
+
+    tumu = okuyucu.pencere()
+    np.testing.assert_array_equal(tumu['enerji'], np.arange(35) / 2)
+    assert len(okuyucu.pencere(40, 50)['zaman']) == 0
+
+
+def test_eksik_alan_nan_kalir(tmp_path):
+    dosya = str(tmp_path / 'kosu.kayit')
+    kaydedici = KosuKaydedici(dosya, ['sayi', 'enerji'], parca_boyu=4)
+    kaydedici.ekle(0, {'sayi': 5})
+    kaydedici.kapat()
+    pencere = KosuOkuyucu(dosya).pencere()
+    assert pencere['sayi'][0] == 5 and np.isnan(pencere['enerji'][0])
+
+
+def test_yarim_kalan_son_parca_yok_sayilir(tmp_path):
+    dosya = str(tmp_path / 'kosu.kayit')
+    _kayit_yaz(dosya, 30)
+    # Çökmeyi taklit et: son parçanın ortasından kes
+    with open(dosya, 'r+b') as f:
+        f.truncate(os.path.getsize(dosya) - 50)
+
+    okuyucu = KosuOkuyucu(dosya)
+    assert len(okuyucu) == 20
+    assert okuyucu.zaman_araligi() == (0, 19)
+    np.testing.assert_array_equal(okuyucu.pencere(15)['zaman'], np.arange(15, 20))
+
+
+def test_bos_kayit_silinir_ve_yabanci_dosya_reddedilir(tmp_path):
+    dosya = str(tmp_path / 'bos.kayit')
+    KosuKaydedici(dosya, ['sayi']).kapat()
+    assert not os.path.exists(dosya)
+
+    yabanci = tmp_path / 'yabanci.kayit'
+    yabanci.write_bytes(b'baska bir dosya')
+    with pytest.raises(ValueError):
+        KosuOkuyucu(str(yabanci))
@@ -0,0 +1,51 @@
+import pytest
+
+from parametre_taramasi import TaramaDeposu, hucreleri_olustur, tarama_calistir
+
+AYARLAR = dict(tick=15, ornek_araligi=5, tohum=3, genislik=300, yukseklik=200, dizi_deposu=True)
+
+
+def _tara(dosya: str, **degisen) -> int:
+    hucreler = hucreleri_olustur({'bocek': [15, 25], 'yem': [6], 'avci': [1]})
+    return tarama_calistir(TaramaDeposu(dosya), hucreler, tekrar=2, ayri_surec=False, **dict(AYARLAR, **degisen))
+
+
+def _sonuclar(dosya: str) -> dict:
+    return {(kosu['meta']['parametreler']['bocek'], kosu['meta']['tekrar']): kosu['sutunlar']
+            for kosu in TaramaDeposu(dosya).kosular()}
+
+
+def test_kesilen_tarama_kaldigi_yerden_surer(tmp_path):
+    tam = str(tmp_path / 'tam.tarama')
+    kesik = str(tmp_path / 'kesik.tarama')
+    assert _tara(tam) == 4
+
+    # Çökmeyi taklit et: son koşu hiç yazılmamış, bir önceki yarım kalmış
+    with open(tam, 'rb') as f:
+        satirlar = f.read().splitlines(keepends=True)
+    with open(kesik, 'wb') as f:
+        f.write(b''.join(satirlar[:3]) + satirlar[3][:40])
+
+    okunan = open(kesik, 'rb').read()
+    assert len(_sonuclar(kesik)) == 2
+    assert open(kesik, 'rb').read() == okunan  # okumak depoyu değiştirmez
+
+    assert _tara(kesik) == 2
+    assert _sonuclar(kesik) == _sonuclar(tam)
+    assert _tara(kesik) == 0
+
+
+def test_farkli_ayarlarla_surdurme_reddedilir(tmp_path):
+    dosya = str(tmp_path / 'tarama.tarama')
+    _tara(dosya)
+    once = open(dosya, 'rb').read()
+    with pytest.raises(ValueError, match='tick'):
+        _tara(dosya, tick=20)
+    assert open(dosya, 'rb').read() == once
+
+
+def test_okumak_dosya_olusturmaz(tmp_path):
+    depo = TaramaDeposu(str(tmp_path / 'yok' / 'tarama.tarama'))
+    assert depo.ayarlar() is None
+    assert list(depo.kosular()) == []
+    assert not (tmp_path / 'yok').exists()
@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+
+from soy_agaci import KAYITSIZ, SoyAgaci
+
+
+def _rastgele_agac(tohum: int = 0, kurucu: int = 8, dogum: int = 300) -> SoyAgaci:
+    rng = np.random.default_rng(tohum)
+    agac = SoyAgaci(kapasite=4)
+    agac.toplu_ekle([KAYITSIZ] * kurucu, [KAYITSIZ] * kurucu, 0, [0] * kurucu)
+    for t in range(1, dogum + 1):
+        anne = int(rng.integers(len(agac)))
+        # Ara sıra anne = baba (kendileşme) durumu da denensin
+        baba = anne if rng.random() < 0.1 else int(rng.integers(len(agac)))
+        agac.ekle(anne, baba, t, max(agac.nesil[anne], agac.nesil[baba]) + 1)
+    return agac
+
+
+def _kaba_atalar(agac: SoyAgaci, kimlik: int, derinlik=None) -> list:
+    bulunan, sinir, adim = set(), {kimlik}, 0
+    while sinir and (derinlik is None or adim < derinlik):
+        sinir = {e for k in sinir for e in agac.ebeveynler(k) if e >= 0} - bulunan
+        bulunan |= sinir
+        adim += 1
+    return sorted(bulunan)
+
+
+def _kaba_torunlar(agac: SoyAgaci, kimlik: int, derinlik=None) -> list:
+    cocuklar = {}
+    for k in range(len(agac)):
+        for e in set(agac.ebeveynler(k)):
+            if e >= 0:
+                cocuklar.setdefault(e, []).append(k)
+    bulunan, sinir, adim = set(), {kimlik}, 0
+    while sinir and (derinlik is None or adim < derinlik):
+        sinir = {c for k in sinir for c in cocuklar.get(k, [])} - bulunan
+        bulunan |= sinir
+        adim += 1
+    return sorted(bulunan)
+
+
+@pytest.mark.parametrize('derinlik', [None, 1, 3])
+def test_atalar_ve_torunlar_kaba_aramayla_ayni(derinlik):
+    agac = _rastgele_agac()
+    for kimlik in [0, 3, 7, 20, 150, len(agac) - 1]:
+        assert agac.atalar(kimlik, derinlik).tolist() == _kaba_atalar(agac, kimlik, derinlik)
+        assert agac.torunlar(kimlik, derinlik).tolist() == _kaba_torunlar(agac, kimlik, derinlik)
+    assert agac.torun_sayisi(0) == len(_kaba_torunlar(agac, 0))
+
+
+def test_kucuk_agac():
+    agac = SoyAgaci()
+    a, b, c = agac.toplu_ekle([KAYITSIZ] * 3, [KAYITSIZ] * 3, 0, [0, 0, 0]).tolist()
+    ab = agac.ekle(a, b, 1, 1)
+    aa = agac.ekle(a, a, 1, 1)
+    torun = agac.ekle(ab, c, 2, 2)
+
+    assert agac.atalar(torun).tolist() == [a, b, c, ab]
+    assert agac.atalar(torun, derinlik=1).tolist() == [c, ab]
+    assert agac.torunlar(a).tolist() == [ab, aa, torun]
+    assert agac.torunlar(c).tolist() == [torun]
+    assert agac.torunlar(torun).tolist() == []
+    # cocuk_sayilari ebeveynlik rollerini sayar: anne = baba olan yavru iki kez sayılır
+    assert agac.cocuk_sayilari().tolist() == [3, 1, 1, 1, 0, 0]
+
+
+def test_olum_ve_durum_gidis_donus():
+    agac = _rastgele_agac(tohum=1, dogum=50)
+    agac.olum_kaydet(np.array([2, 9, 30]), 77)
+    assert not agac.canli_mi(9) and agac.canli_mi(10)
+
+    kopya = SoyAgaci()
+    kopya.durumu_yukle(agac.durum())
+    assert len(kopya) == len(agac)
+    for ad, sutun in agac.durum().items():
+        np.testing.assert_array_equal(getattr(kopya, ad)[:len(kopya)], sutun)
+    assert kopya.torunlar(0).tolist() == agac.torunlar(0).tolist()
@@ -0,0 +1,80 @@
+import math
+
+import numpy as np
+import pytest
+
+from uzamsal_indeks import UzamsalIzgara
+
+
+def _izgara(tohum: int = 0, n: int = 400, sol: float = 0.0, ust: float = 0.0, hucre: float = 25.0):
+    rng = np.random.default_rng(tohum)
+    # Bir kısmı alan dışında: kenar hücrelere düşmeleri gerekir
+    xs = sol + rng.uniform(-20, 520, n)
+    ys = ust + rng.uniform(-20, 320, n)
+    aktif = rng.random(n) < 0.9
+    etiketler = rng.integers(0, 3, n)
+    izgara = UzamsalIzgara(500, 300, hucre, sol, ust)
+    izgara.yeniden_olustur(xs, ys, aktif=aktif, etiketler=etiketler)
+    sorgular = np.column_stack((sol + rng.uniform(-30, 530, 60), ust + rng.uniform(-30, 330, 60)))
+    return izgara, xs, ys, aktif, etiketler, sorgular
+
+
+def _uzakliklar(xs, ys, aktif, x, y, haric=-1):
+    d = np.hypot(xs - x, ys - y)
+    d[~aktif] = np.inf
+    if haric >= 0:
+        d[haric] = np.inf
+    return d
+
+
+@pytest.mark.parametrize('sol, ust', [(0.0, 0.0), (-130.0, 270.0)])
+@pytest.mark.parametrize('yaricap', [math.inf, 40.0, 3.0])
+def test_en_yakin_kaba_aramayla_ayni(sol, ust, yaricap):
+    izgara, xs, ys, aktif, _, sorgular = _izgara(sol=sol, ust=ust)
+    for i, (x, y) in enumerate(sorgular):
+        haric = i if i % 2 else -1
+        d = _uzakliklar(xs, ys, aktif, x, y, haric)
+        beklenen = int(np.argmin(d))
+        indeks, mesafe = izgara.en_yakin(x, y, yaricap, haric)
+        if d[beklenen] < yaricap:
+            assert (indeks, mesafe) == (beklenen, pytest.approx(d[beklenen]))
+        else:
+            assert (indeks, mesafe) == (-1, math.inf)
+
+
+@pytest.mark.parametrize('yaricap', [60.0, 12.0])
+def test_ilk_ve_yakindakiler_kaba_aramayla_ayni(yaricap):
+    izgara, xs, ys, aktif, etiketler, sorgular = _izgara(tohum=1)
+    for i, (x, y) in enumerate(sorgular):
+        d = _uzakliklar(xs, ys, aktif, x, y, haric=i)
+        icinde = np.flatnonzero(d < yaricap)
+        assert izgara.ilk(x, y, yaricap, haric=i) == (icinde.min() if len(icinde) else -1)
+        farkli = icinde[etiketler[icinde] != i % 3]
+        assert izgara.ilk(x, y, yaricap, haric=i, farkli_etiket=i % 3) == (farkli.min() if len(farkli) else -1)
+        yakin = izgara.yakindakiler(x, y, yaricap, haric=i)
+        assert sorted(yakin.tolist()) == icinde.tolist()
+        assert np.all(np.diff(d[yakin]) >= 0)
+
+
+def test_toplu_sorgular_tekli_sorgularla_ayni():
+    izgara, xs, ys, aktif, etiketler, _ = _izgara(tohum=2)
+    # Aynı konumda iki öğe: eşitlik durumunda da aynı seçim yapılmalı
+    xs[5], ys[5] = xs[4], ys[4]
+    izgara.yeniden_olustur(xs, ys, aktif=aktif, etiketler=etiketler)
+    satirlar = np.flatnonzero(aktif)
+    qx, qy = xs[satirlar], ys[satirlar]
+
+    indeksler, mesafeler = izgara.toplu_en_yakin(qx, qy, haric=satirlar)
+    ilkler = izgara.toplu_ilk(qx, qy, 30.0, haric=satirlar, farkli_etiket=etiketler[satirlar])
+    for j, i in enumerate(satirlar):
+        assert (indeksler[j], mesafeler[j]) == izgara.en_yakin(xs[i], ys[i], haric=i)
+        assert ilkler[j] == izgara.ilk(xs[i], ys[i], 30.0, haric=i, farkli_etiket=etiketler[i])
+
+
+def test_bos_izgara():
+    izgara = UzamsalIzgara(100, 100, 10)
+    izgara.yeniden_olustur(np.empty(0), np.empty(0))
+    assert izgara.en_yakin(5, 5) == (-1, math.inf)
+    assert izgara.ilk(5, 5, 50) == -1
+    indeksler, mesafeler = izgara.toplu_en_yakin([5.0], [5.0])
+    assert indeksler.tolist() == [-1] and mesafeler.tolist() == [math.inf]
@@ -0,0 +1,375 @@
+import math
+import numpy as np
+from typing import Dict, Optional, Sequence, Tuple
+
+
+class UzamsalIzgara:
+    """Düzgün ızgaralı uzamsal karma (komşu sorguları için)
+
+    Her tick başında konumlardan bir kez yeniden kurulur. Öğeler hücre
+    numarasına göre sıralı tutulur; böylece bir satırdaki ardışık hücreler
+    tek bir dilimle okunur ve sorgu maliyeti yalnızca yakın hücrelerdeki
+    öğe sayısına bağlı kalır. Izgara (`sol`, `ust`) köşesinden başlayan
+    genislik x yukseklik alanını kaplar (varsayılan tüm dünya); alan
+    dışındaki konumlar kenar hücrelere düşer.
+    """
+
+    def __init__(self, genislik: float, yukseklik: float, hucre_boyutu: float,
+                 sol: float = 0.0, ust: float = 0.0):
+        self.genislik = genislik
+        self.yukseklik = yukseklik
+        self.sol = sol
+        self.ust = ust
+        self.hucre_boyutu = float(hucre_boyutu)
+        self.sutun_sayisi = max(1, int(math.ceil(genislik / self.hucre_boyutu)))
+        self.satir_sayisi = max(1, int(math.ceil(yukseklik / self.hucre_boyutu)))
+
+        self.xs = np.empty(0, dtype=np.float64)
+        self.ys = np.empty(0, dtype=np.float64)
+        self.etiketler: Optional[np.ndarray] = None
+        self.yon_x: Optional[np.ndarray] = None
+        self.yon_y: Optional[np.ndarray] = None
+        self.nesneler: Sequence = []
+        self._sirali = np.empty(0, dtype=np.intp)
+        self._baslangic = np.zeros(self.sutun_sayisi * self.satir_sayisi + 1, dtype=np.intp)
+
+    def __len__(self) -> int:
+        return len(self._sirali)
+
+    def yeniden_olustur(self, xs, ys, aktif=None, etiketler=None, nesneler: Sequence = None, yonler=None,
+                        indeksler: np.ndarray = None):
+        """Izgarayı verilen konumlardan yeniden kur
+
+        İndeksler girdi dizilerindeki sıraya karşılık gelir; `aktif` maskesi
+        False olan öğeler ızgaraya eklenmez ama indeks numaralandırması bozulmaz.
+        Maske yerine eklenecek öğelerin artan sıralı `indeksler`i de verilebilir
+        (büyük dizilerin küçük bir bölümü için maske kurmadan).
+        `yonler` (yon_x, yon_y) verilirse komsu_ozetleri ortalama yönü de hesaplar.
+        """
+        self.xs = np.asarray(xs, dtype=np.float64)
+        self.ys = np.asarray(ys, dtype=np.float64)
+        self.etiketler = None if etiketler is None else np.asarray(etiketler)
+        if yonler is None:
+            self.yon_x = self.yon_y = None
+        else:
+            self.yon_x = np.asarray(yonler[0], dtype=np.float64)
+            self.yon_y = np.asarray(yonler[1], dtype=np.float64)
+        self.nesneler = nesneler if nesneler is not None else []
+
+        if indeksler is not None:
+            indeksler = np.asarray(indeksler, dtype=np.intp)
+        elif aktif is None:
+            indeksler = np.arange(len(self.xs), dtype=np.intp)
+        else:
+            indeksler = np.flatnonzero(aktif)
+
+        hucreler = self._hucre_numarasi(self.xs[indeksler], self.ys[indeksler])
+        sira = np.argsort(hucreler, kind='stable')
+        self._sirali = indeksler[sira]
+
+        sayim = np.bincount(hucreler, minlength=self.sutun_sayisi * self.satir_sayisi)
+        self._baslangic = np.zeros(len(sayim) + 1, dtype=np.intp)
+        np.cumsum(sayim, out=self._baslangic[1:])
+
+    def nesnelerden_olustur(self, nesneler: Sequence, canli_alani: str = 'hayatta',
+                            etiket_alani: str = None, etiket_kodlari: dict = None,
+                            yon_alanlari: Tuple[str, str] = None):
+        """x/y niteliği olan nesne listesinden ızgarayı kur"""
+        n = len(nesneler)
+        xs = np.fromiter((o.x for o in nesneler), dtype=np.float64, count=n)
+        ys = np.fromiter((o.y for o in nesneler), dtype=np.float64, count=n)
+        aktif = None
+        if canli_alani:
+            aktif = np.fromiter((getattr(o, canli_alani) for o in nesneler), dtype=bool, count=n)
+        etiketler = None
+        if etiket_alani:
+            etiketler = np.fromiter((etiket_kodlari[getattr(o, etiket_alani)] for o in nesneler),
+                                    dtype=np.int16, count=n)
+        yonler = None
+        if yon_alanlari:
+            yonler = [np.fromiter((getattr(o, ad) for o in nesneler), dtype=np.float64, count=n)
+                      for ad in yon_alanlari]
+        self.yeniden_olustur(xs, ys, aktif=aktif, etiketler=etiketler, nesneler=nesneler, yonler=yonler)
+
+    def _hucre_numarasi(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """Konumları düz hücre numarasına çevir (dışarıdakiler kenara kırpılır)"""
+        cx = np.clip(((xs - self.sol) // self.hucre_boyutu).astype(np.intp), 0, self.sutun_sayisi - 1)
+        cy = np.clip(((ys - self.ust) // self.hucre_boyutu).astype(np.intp), 0, self.satir_sayisi - 1)
+        return cy * self.sutun_sayisi + cx
+
+    def _hucre_koordinati(self, x: float, y: float) -> Tuple[int, int]:
+        cx = min(max(int((x - self.sol) // self.hucre_boyutu), 0), self.sutun_sayisi - 1)
+        cy = min(max(int((y - self.ust) // self.hucre_boyutu), 0), self.satir_sayisi - 1)
+        return cx, cy
+
+    def _hucre_kutusu(self, cx0: int, cy0: int, cx1: int, cy1: int) -> np.ndarray:
+        """Hücre dikdörtgenindeki öğe indeksleri (satır başına tek dilim)
+
+        Kutu, öğeler gibi kenar hücrelere kırpılır; alanın tamamen dışındaki
+        bir kutu da oraya kırpılmış öğeleri bulur.
+        """
+        cx0 = min(max(cx0, 0), self.sutun_sayisi - 1)
+        cy0 = min(max(cy0, 0), self.satir_sayisi - 1)
+        cx1 = max(min(cx1, self.sutun_sayisi - 1), 0)
+        cy1 = max(min(cy1, self.satir_sayisi - 1), 0)
+        if cx0 > cx1 or cy0 > cy1:
+            return np.empty(0, dtype=np.intp)
+
+        parcalar = []
+        for cy in range(cy0, cy1 + 1):
+            satir = cy * self.sutun_sayisi
+            bas = self._baslangic[satir + cx0]
+            son = self._baslangic[satir + cx1 + 1]
+            if son > bas:
+                parcalar.append(self._sirali[bas:son])
+        if not parcalar:
+            return np.empty(0, dtype=np.intp)
+        if len(parcalar) == 1:
+            return parcalar[0]
+        return np.concatenate(parcalar)
+
+    def _kutu_adaylari(self, x: float, y: float, yaricap: float) -> np.ndarray:
+        h = self.hucre_boyutu
+        return self._hucre_kutusu(int((x - yaricap - self.sol) // h), int((y - yaricap - self.ust) // h),
+                                  int((x + yaricap - self.sol) // h), int((y + yaricap - self.ust) // h))
+
+    def yakindakiler(self, x: float, y: float, yaricap: float, haric: int = -1) -> np.ndarray:
+        """Yarıçap içindeki öğelerin indeksleri (mesafeye göre sıralı)"""
+        adaylar = self._kutu_adaylari(x, y, yaricap)
+        if len(adaylar) == 0:
+            return adaylar
+        dx = self.xs[adaylar] - x
+        dy = self.ys[adaylar] - y
+        d2 = dx * dx + dy * dy
+        maske = d2 < yaricap * yaricap
+        if haric >= 0:
+            maske &= adaylar != haric
+        adaylar = adaylar[maske]
+        return adaylar[np.argsort(d2[maske], kind='stable')]
+
+    def en_yakin(self, x: float, y: float, yaricap: float = math.inf,
+                 haric: int = -1) -> Tuple[int, float]:
+        """En yakın öğe ve mesafesi; bulunamazsa (-1, inf)
+
+        Sınırsız aramada kutu halka halka büyütülür: r halkası tarandıktan
+        sonra taranmamış hücreler en az r*h uzaktadır, bu yüzden en iyi
+        aday o mesafenin içindeyse arama durur.
+        """
+        if math.isfinite(yaricap):
+            adaylar = self._kutu_adaylari(x, y, yaricap)
+            return self._en_yakin_aday(adaylar, x, y, yaricap, haric)
+
+        cx, cy = self._hucre_koordinati(x, y)
+        en_fazla = max(self.sutun_sayisi, self.satir_sayisi)
+        r = 1
+        while True:
+            adaylar = self._hucre_kutusu(cx - r, cy - r, cx + r, cy + r)
+            indeks, mesafe = self._en_yakin_aday(adaylar, x, y, math.inf, haric)
+            if indeks >= 0 and mesafe <= r * self.hucre_boyutu:
+                return indeks, mesafe
+            if r >= en_fazla:
+                return indeks, mesafe
+            r += 1
+
+    def _en_yakin_aday(self, adaylar: np.ndarray, x: float, y: float,
+                       yaricap: float, haric: int) -> Tuple[int, float]:
+        if len(adaylar) == 0:
+            return -1, math.inf
+        dx = self.xs[adaylar] - x
+        dy = self.ys[adaylar] - y
+        d2 = dx * dx + dy * dy
+        if haric >= 0:
+            d2[adaylar == haric] = np.inf
+        secilen = int(np.argmin(d2))
+        mesafe = math.sqrt(d2[secilen])
+        if mesafe >= yaricap or not math.isfinite(mesafe):
+            return -1, math.inf
+        return int(adaylar[secilen]), mesafe
+
+    def ilk(self, x: float, y: float, yaricap: float, haric: int = -1,
+            farkli_etiket: int = None) -> int:
+        """Yarıçap içindeki en küçük indeksli öğe (liste sırasını korur)
+
+        `farkli_etiket` verilirse etiketi bu değerden farklı olan öğeler aranır.
+        """
+        adaylar = self._kutu_adaylari(x, y, yaricap)
+        if len(adaylar) == 0:
+            return -1
+        dx = self.xs[adaylar] - x
+        dy = self.ys[adaylar] - y
+        maske = dx * dx + dy * dy < yaricap * yaricap
+        if haric >= 0:
+            maske &= adaylar != haric
+        if farkli_etiket is not None:
+            maske &= self.etiketler[adaylar] != farkli_etiket
+        uygun = adaylar[maske]
+        if len(uygun) == 0:
+            return -1
+        return int(uygun.min())
+
+    def dikdortgen(self, x0: float, y0: float, x1: float, y1: float) -> np.ndarray:
+        """[x0, x1] x [y0, y1] dikdörtgenindeki öğelerin indeksleri (sırasız)"""
+        h = self.hucre_boyutu
+        adaylar = self._hucre_kutusu(int((x0 - self.sol) // h), int((y0 - self.ust) // h),
+                                     int((x1 - self.sol) // h), int((y1 - self.ust) // h))
+        if len(adaylar) == 0:
+            return adaylar
+        xs = self.xs[adaylar]
+        ys = self.ys[adaylar]
+        return adaylar[(xs >= x0) & (xs <= x1) & (ys >= y0) & (ys <= y1)]
+
+    def komsu_ciftleri(self, qx, qy, yaricap: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Tüm sorgu noktaları için yarıçap içindeki (sorgu, öğe, mesafe²) çiftleri
+
+        Python döngüsü yalnızca kutunun satır sayısı kadardır; her satırda her
+        sorgunun aday dilimi np.repeat ile tek seferde açılır. Çiftlerin sırası
+        belirli değildir; gerekiyorsa çağıran taraf sıralar.
+        """
+        qx = np.asarray(qx, dtype=np.float64)
+        qy = np.asarray(qy, dtype=np.float64)
+        bos = (np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp), np.empty(0))
+        if len(qx) == 0 or len(self._sirali) == 0:
+            return bos
+
+        h = self.hucre_boyutu
+        cx0 = np.clip(((qx - yaricap - self.sol) // h).astype(np.intp), 0, self.sutun_sayisi - 1)
+        cx1 = np.clip(((qx + yaricap - self.sol) // h).astype(np.intp), 0, self.sutun_sayisi - 1)
+        cy0 = np.clip(((qy - yaricap - self.ust) // h).astype(np.intp), 0, self.satir_sayisi - 1)
+        cy1 = np.clip(((qy + yaricap - self.ust) // h).astype(np.intp), 0, self.satir_sayisi - 1)
+        satir_sayisi = int((cy1 - cy0).max()) + 1
+        sorgu_indeksleri = np.arange(len(qx), dtype=np.intp)
+
+        sorgular = []
+        ogeler = []
+        for k in range(satir_sayisi):
+            cy = cy0 + k
+            gecerli = cy <= cy1
+            satir = cy * self.sutun_sayisi
+            bas = np.where(gecerli, self._baslangic[np.minimum(satir + cx0, len(self._baslangic) - 1)], 0)
+            son = np.where(gecerli, self._baslangic[np.minimum(satir + cx1 + 1, len(self._baslangic) - 1)], 0)
+            sayi = son - bas
+            toplam = int(sayi.sum())
+            if toplam == 0:
+                continue
+            q = np.repeat(sorgu_indeksleri, sayi)
+            ofset = np.arange(toplam, dtype=np.intp) - np.repeat(np.cumsum(sayi) - sayi, sayi)
+            sorgular.append(q)
+            ogeler.append(self._sirali[np.repeat(bas, sayi) + ofset])
+
+        if not sorgular:
+            return bos
+        q = np.concatenate(sorgular)
+        o = np.concatenate(ogeler)
+        dx = self.xs[o] - qx[q]
+        dy = self.ys[o] - qy[q]
+        d2 = dx * dx + dy * dy
+        maske = d2 < yaricap * yaricap
+        return q[maske], o[maske], d2[maske]
+
+    def komsu_ozetleri(self, qx, qy, yaricap: float, k: int = 0, haric=None) -> Dict[str, np.ndarray]:
+        """Tüm sorgu noktalarının yarıçap içindeki komşularının toplu özeti
+
+        Tek komsu_ciftleri çağrısının çiftleri bincount ile toplanır; toplam
+        maliyet çift sayısıyla doğrusaldır. `haric` her sorgu için dışarıda
+        tutulacak öğe indeksidir (kendisi; yoksa -1). Dönen sözlük:
+
+        - 'sayi': komşu sayısı
+        - 'merkez_x', 'merkez_y': komşuların ağırlık merkezi (komşusuz
+          sorguda sorgu noktasının kendisi)
+        - 'yon_x', 'yon_y': komşuların birim yönlerinin ortalaması; uzunluğu
+          hizalanma derecesidir (yalnızca ızgara yönlerle kurulduysa)
+        - 'en_yakinlar', 'en_yakin_mesafeler': (sorgu, k) boyutlu, mesafeye
+          göre sıralı en yakın k komşu; eksikler -1 / inf (k > 0 ise)
+        """
+        qx = np.asarray(qx, dtype=np.float64)
+        qy = np.asarray(qy, dtype=np.float64)
+        m = len(qx)
+        q, o, d2 = self.komsu_ciftleri(qx, qy, yaricap)
+        if haric is not None:
+            kendisi_degil = o != np.asarray(haric)[q]
+            q, o, d2 = q[kendisi_degil], o[kendisi_degil], d2[kendisi_degil]
+
+        sayi = np.bincount(q, minlength=m)
+        bolen = np.maximum(sayi, 1)
+        yalniz = sayi == 0
+        ozet = {
+            'sayi': sayi,
+            'merkez_x': np.where(yalniz, qx, np.bincount(q, weights=self.xs[o], minlength=m) / bolen),
+            'merkez_y': np.where(yalniz, qy, np.bincount(q, weights=self.ys[o], minlength=m) / bolen),
+        }
+        if self.yon_x is not None:
+            ozet['yon_x'] = np.bincount(q, weights=self.yon_x[o], minlength=m) / bolen
+            ozet['yon_y'] = np.bincount(q, weights=self.yon_y[o], minlength=m) / bolen
+
+        if k > 0:
+            # Sorguya, sonra mesafeye göre sırala (eşitlikte küçük indeks önce);
+            # her sorgunun grubundaki ilk k çift en yakın k komşudur
+            sira = np.lexsort((o, d2, q))
+            q, o, d2 = q[sira], o[sira], d2[sira]
+            grup_sirasi = np.arange(len(q)) - (np.cumsum(sayi) - sayi)[q]
+            secili = grup_sirasi < k
+            en_yakinlar = np.full((m, k), -1, dtype=np.intp)
+            mesafeler = np.full((m, k), np.inf)
+            en_yakinlar[q[secili], grup_sirasi[secili]] = o[secili]
+            mesafeler[q[secili], grup_sirasi[secili]] = np.sqrt(d2[secili])
+            ozet['en_yakinlar'] = en_yakinlar
+            ozet['en_yakin_mesafeler'] = mesafeler
+        return ozet
+
+    def toplu_en_yakin(self, qx, qy, haric=None) -> Tuple[np.ndarray, np.ndarray]:
+        """Tüm sorgu noktaları için sınırsız en_yakin: (indeksler, mesafeler)
+
+        Çeyrek hücre yarıçapındaki çiftler tek komsu_ciftleri çağrısıyla
+        toplanıp sorgu başına en yakına indirgenir; eşit mesafede en_yakin
+        gibi önce hücre sırası, sonra indeksi küçük olan seçilir. Bu yarıçapta
+        komşusu olmayan sorgular yarıçap ikiye katlanarak yeniden sorulur;
+        küçük başlangıç yarıçapı yoğun bölgelerde çift sayısını düşük tutar.
+        `haric` her sorgu için dışarıda tutulacak öğedir (yoksa -1).
+        Bulunamayan sorgular için -1 / inf döner.
+        """
+        qx = np.asarray(qx, dtype=np.float64)
+        qy = np.asarray(qy, dtype=np.float64)
+        haric = np.full(len(qx), -1, dtype=np.intp) if haric is None else np.asarray(haric)
+        indeksler = np.full(len(qx), -1, dtype=np.intp)
+        mesafeler = np.full(len(qx), np.inf)
+        kalan = np.arange(len(qx))
+        yaricap = self.hucre_boyutu / 4
+        kosegen = math.hypot(self.genislik, self.yukseklik)
+        while len(kalan) and len(self._sirali):
+            q, o, d2 = self.komsu_ciftleri(qx[kalan], qy[kalan], yaricap)
+            kendisi_degil = o != haric[kalan][q]
+            q, o, d2 = q[kendisi_degil], o[kendisi_degil], d2[kendisi_degil]
+            if len(q):
+                en_kucuk = np.full(len(kalan), np.inf)
+                np.minimum.at(en_kucuk, q, d2)
+                esit = d2 == en_kucuk[q]
+                q, o = q[esit], o[esit]
+                anahtar = self._hucre_numarasi(self.xs[o], self.ys[o]) * len(self.xs) + o
+                secilen = np.full(len(kalan), np.iinfo(np.intp).max)
+                np.minimum.at(secilen, q, anahtar)
+                bulunan = np.isfinite(en_kucuk)
+                indeksler[kalan[bulunan]] = secilen[bulunan] % len(self.xs)
+                mesafeler[kalan[bulunan]] = np.sqrt(en_kucuk[bulunan])
+            kalan = kalan[indeksler[kalan] < 0]
+            if yaricap > kosegen:
+                break
+            yaricap *= 2
+        return indeksler, mesafeler
+
+    def toplu_ilk(self, qx, qy, yaricap: float, haric=None, farkli_etiket=None) -> np.ndarray:
+        """Tüm sorgu noktaları için ilk: yarıçap içindeki en küçük indeksli öğe (yoksa -1)
+
+        `haric` ve `farkli_etiket` sorgu başına dizilerdir; çiftler tek
+        komsu_ciftleri çağrısından gelir.
+        """
+        q, o, _ = self.komsu_ciftleri(qx, qy, yaricap)
+        uygun = np.ones(len(q), dtype=bool)
+        if haric is not None:
+            uygun &= o != np.asarray(haric)[q]
+        if farkli_etiket is not None:
+            uygun &= self.etiketler[o] != np.asarray(farkli_etiket)[q]
+        yok = len(self.xs)
+        sonuc = np.full(len(qx), yok, dtype=np.intp)
+        np.minimum.at(sonuc, q[uygun], o[uygun])
+        sonuc[sonuc == yok] = -1
+        return sonuc
@@ -0,0 +1,70 @@
+import time
+from typing import Callable, Optional
+
+
+class SabitAdimZamanlayici:
+    """Simülasyon adımlarını çizimden ayıran sabit zaman adımlı zamanlayıcı
+
+    Normal kipte gerçek geçen süre bir birikimde toplanır ve her `1 / tick_hizi`
+    saniye için bir adım atılır; böylece simülasyon hızı çizim hızına bağlı
+    kalmaz. `kare_basina_tick` verilirse her karede sabit sayıda adım atılır,
+    `tick_hizi` None ise kare bütçesine sığdığı kadar adım atılır. Turbo kipte
+    her karede `turbo_araligi` adım atılır, yani yalnızca her N. tick çizilir.
+    Her durumda bir karede `zaman_butcesi` saniyeden fazla simülasyon
+    çalıştırılmaz, yetişemeyen birikim atılır.
+    """
+
+    def __init__(self, tick_hizi: Optional[float] = 60.0, max_fps: int = 60,
+                 kare_basina_tick: Optional[int] = None, zaman_butcesi: float = None,
+                 turbo_araligi: int = 100, turbo_butcesi: float = 0.25,
+                 saat: Callable[[], float] = time.perf_counter):
+        self.tick_hizi = tick_hizi
+        self.max_fps = max_fps
+        self.kare_basina_tick = kare_basina_tick
+        self.zaman_butcesi = zaman_butcesi if zaman_butcesi is not None else 0.8 / max_fps
+        self.turbo_araligi = turbo_araligi
+        self.turbo_butcesi = turbo_butcesi
+        self.saat = saat
+
+        self.hiz_carpani = 1.0
+        self.turbo = False
+        self.olculen_tps = 0.0  # Son karelerin ortalama tick/saniye değeri
+        self._birikim = 0.0
+        self._son = None
+
+    def sifirla(self):
+        """Birikimi boşalt (duraklatma sonrası yığılmış adımları atmak için)"""
+        self._birikim = 0.0
+        self._son = None
+
+    def kare(self, adim: Callable[[], None]) -> int:
+        """Bu kare için düşen adımları çalıştır; atılan adım sayısını döndür"""
+        simdi = self.saat()
+        gecen = 0.0 if self._son is None else simdi - self._son
+        self._son = simdi
+
+        if self.turbo:
+            hedef, butce = self.turbo_araligi, self.turbo_butcesi
+        elif self.kare_basina_tick is not None:
+            hedef, butce = self.kare_basina_tick, self.zaman_butcesi
+        elif self.tick_hizi is None:
+            hedef, butce = None, self.zaman_butcesi
+        else:
+            self._birikim += gecen * self.tick_hizi * self.hiz_carpani
+            hedef, butce = int(self._birikim), self.zaman_butcesi
+
+        bitis = simdi + butce
+        atilan = 0
+        while hedef is None or atilan < hedef:
+            adim()
+            atilan += 1
+            if self.saat() >= bitis:
+                break
+
+        if self.tick_hizi is not None and not self.turbo and self.kare_basina_tick is None:
+            # Bütçeye sığmayan adımlar ertelenmez, atılır (spiral önlenir)
+            self._birikim = self._birikim - atilan if atilan == hedef else 0.0
+
+        if gecen > 0:
+            self.olculen_tps = 0.9 * self.olculen_tps + 0.1 * (atilan / gecen)
+        return atilan